@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Sequence
+
+
+class EmployeeTotals:
+    """Running per-employee column totals that absorb new review batches
+
+    Employees keep their order of first appearance across batches, and adding a
+    batch costs time proportional to the batch, not to the history.
+    """
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns = list(columns)
+        self.names: List[str] = []
+        # Per-employee values captured when an employee is first seen
+        self.metadata: Dict[str, tuple] = {}
+        self._positions: Dict[str, int] = {}
+        self._totals = np.zeros((16, len(self.columns)))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._positions
+
+    def add(self, names: pd.Series, values: np.ndarray) -> List[str]:
+        """Add one row of values per review to the reviewed employees' totals
+
+        Returns the employees seen for the first time, in order of appearance.
+        """
+        codes, uniques = pd.factorize(names)
+        valid = codes >= 0
+        codes, values = codes[valid], values[valid]
+
+        batch_totals = self._group_sums(codes, values, len(uniques))
+
+        new_names = [name for name in uniques if name not in self._positions]
+        for name in new_names:
+            self._positions[name] = len(self.names)
+            self.names.append(name)
+
+        # Grow geometrically so repeated small batches stay cheap
+        if len(self.names) > len(self._totals):
+            grown = np.zeros((max(len(self.names), 2 * len(self._totals)), len(self.columns)))
+            grown[:len(self._totals)] = self._totals
+            self._totals = grown
+
+        positions = np.fromiter((self._positions[name] for name in uniques), dtype=np.int64, count=len(uniques))
+        self._totals[positions] += batch_totals
+        return new_names
+
+    def _group_sums(self, codes: np.ndarray, values: np.ndarray, num_groups: int) -> np.ndarray:
+        """Per-employee column sums of one batch
+
+        Each employee's values are summed as one contiguous row in their original
+        order, which is how a per-employee Series.sum or mean adds them, so sums
+        match those bit for bit. Employees with the same number of rows are summed
+        together as one employees x rows array, one column at a time to keep the
+        batch's memory use to a few copies of a single column. Whole-number columns
+        such as counts sum exactly in any order, so those use a plain bincount.
+        """
+        sums = np.zeros((num_groups, len(self.columns)))
+        if not len(codes) or not self.columns:
+            return sums
+        order = np.argsort(codes, kind='stable')
+        sizes = np.bincount(codes, minlength=num_groups)
+        starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+        groups = [np.flatnonzero(sizes == size) for size in np.unique(sizes[sizes > 0])]
+        # Each group's employees x rows array of original row positions
+        rows = [order[starts[group][:, None] + np.arange(sizes[group[0]])] for group in groups]
+        for col in range(len(self.columns)):
+            column = values[:, col].astype(float)
+            if np.array_equal(column, np.rint(column)) and np.abs(column).sum() < 2 ** 53:
+                sums[:, col] = np.bincount(codes, weights=column, minlength=num_groups)
+                continue
+            for group, group_rows in zip(groups, rows):
+                # take gathers each employee's rows contiguously, which the matching sum order needs
+                sums[group, col] = np.take(column, group_rows).sum(axis=1)
+        return sums
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the totals as a DataFrame indexed by employee name"""
+        return pd.DataFrame(
+            self._totals[:len(self.names)].copy(),
+            index=pd.Index(self.names, name='employee_name'),
+            columns=self.columns
+        )
+
+
+class EmployeeRowIndex:
+    """Row positions of each employee's reviews, for O(1) per-employee retrieval
+
+    Positions are grouped once with a stable sort, so each employee's rows come
+    back in their original order, as a boolean mask on employee_name would give.
+    Employees are numbered in order of first appearance, as in EmployeeTotals.
+    Positions are stored as int32 to halve the index's footprint.
+    """
+
+    def __init__(self, names: pd.Series):
+        codes, uniques = pd.factorize(names)
+        dtype = np.int32 if len(codes) <= np.iinfo(np.int32).max else np.int64
+        order = np.argsort(codes, kind='stable').astype(dtype)
+        self._order = order[codes[order] >= 0]
+        self._bounds = np.searchsorted(codes[self._order], np.arange(len(uniques) + 1)).astype(dtype)
+        self._codes: Dict[str, int] = dict(zip(uniques.tolist(), range(len(uniques))))
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._codes
+
+    def code(self, name: str) -> int:
+        """Employee number in order of first appearance, -1 for unknown employees"""
+        return self._codes.get(name, -1)
+
+    def positions(self, name: str) -> np.ndarray:
+        """Row positions of one employee's reviews, empty for unknown employees"""
+        code = self._codes.get(name)
+        if code is None:
+            return self._order[:0]
+        return self._order[self._bounds[code]:self._bounds[code + 1]]
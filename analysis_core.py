@@ -0,0 +1,26 @@
+"""Import-light entry point to the analysis engines
+
+Everything here depends only on pandas, numpy and the standard library, so
+batch jobs and cold-started workers never pay for Streamlit, Plotly or the
+sample-data generator. benchmarks/import_time.py enforces the import budget.
+"""
+from result_cache import ResultCache, dataset_fingerprint, default_cache
+from review_store import ReviewStore, StreamedReviews, compact_reviews, stream_reviews_csv
+from succession_planning import READINESS_LEVELS, SuccessionCandidateIndex, SuccessionPlanningAnalyzer
+from team_dynamics import TeamDynamicsAnalyzer
+from text_matching import first_name_aliases
+
+__all__ = [
+    "READINESS_LEVELS",
+    "ResultCache",
+    "ReviewStore",
+    "StreamedReviews",
+    "SuccessionCandidateIndex",
+    "SuccessionPlanningAnalyzer",
+    "TeamDynamicsAnalyzer",
+    "compact_reviews",
+    "dataset_fingerprint",
+    "default_cache",
+    "first_name_aliases",
+    "stream_reviews_csv",
+]
@@ -0,0 +1,287 @@
+"""Benchmark suite for the succession and team dynamics analyzers
+
+Times and memory-profiles every analyzer method on synthetic organizations of
+increasing size, reports throughput and peak memory, and compares the run with a
+stored baseline so regressions fail the run.
+
+Each measurement gets a fresh ResultCache, so nothing is served from an earlier
+run. Team dynamics analyses are measured on an analyzer whose text features are
+already built; building them is measured separately as get_text_features.
+Likewise, development plans are measured with the per-dataset employee lookups
+already built by a first plan, which is measured as first_development_plan, and
+what-if re-ranking on an analyzer that has already ranked candidates once.
+
+Usage:
+    python benchmarks/analyzer_bench.py                     # compare with baseline.json
+    python benchmarks/analyzer_bench.py --sizes 10 1000     # selected org sizes
+    python benchmarks/analyzer_bench.py --update-baseline   # record a new baseline
+"""
+import argparse
+import copy
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from analysis_core import ResultCache, SuccessionPlanningAnalyzer, TeamDynamicsAnalyzer  # noqa: E402
+from sample_data import generate_synthetic_review_data  # noqa: E402
+
+DEFAULT_SIZES = [10, 100, 1_000, 10_000, 100_000]
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Development plans are generated for this many employees per size
+DEV_PLAN_SAMPLE = 100
+
+# Reviewer-type weights of the weighted score aggregation cases
+REVIEWER_WEIGHTS = {"Manager": 2.0, "Direct Report": 1.5, "Peer": 1.0, "Cross-functional Partner": 1.0, "Self": 0.5}
+
+
+def _succession_analyzer(context: Dict):
+    return SuccessionPlanningAnalyzer(context["reviews"], cache=ResultCache())
+
+
+def _warm_dynamics_analyzer(context: Dict):
+    """Dynamics analyzer with text features built once per dataset and an empty result cache"""
+    if "dynamics" not in context:
+        analyzer = TeamDynamicsAnalyzer(context["reviews"], cache=ResultCache())
+        analyzer.get_text_features()
+        context["dynamics"] = analyzer
+    context["dynamics"].cache = ResultCache()
+    return context["dynamics"]
+
+
+def _what_if_ranking(context: Dict):
+    """Analyzer with its default ranking computed, and what-if role weights to re-rank with"""
+    analyzer = _succession_analyzer(context)
+    analyzer.rank_succession_candidates()
+    role_weights = copy.deepcopy(analyzer.role_weights)
+    role_weights["VP"]["innovation"] = 0.2
+    return analyzer, role_weights
+
+
+def _first_development_plan(context: Dict):
+    """Analyzer with employee scores computed but no employee lookups built yet"""
+    analyzer = _succession_analyzer(context)
+    return analyzer, analyzer.calculate_employee_scores()["name"].iloc[0]
+
+
+def _development_plans(context: Dict):
+    """Analyzer whose employee lookups were built by a first plan, and the employees to plan for"""
+    analyzer, first_name = _first_development_plan(context)
+    analyzer.generate_development_plan(first_name)
+    names = list(analyzer.calculate_employee_scores()["name"][1:DEV_PLAN_SAMPLE + 1])
+    return analyzer, names
+
+
+# name -> (setup(context) -> state, run(state), units(context) -> (count, unit))
+CASES: Dict[str, Tuple[Callable, Callable, Callable]] = {
+    "calculate_employee_scores": (
+        _succession_analyzer,
+        lambda analyzer: analyzer.calculate_employee_scores(),
+        lambda context: (len(context["reviews"]), "reviews"),
+    ),
+    "weighted_employee_scores": (
+        lambda context: _succession_analyzer(context).with_score_aggregation(REVIEWER_WEIGHTS),
+        lambda analyzer: analyzer.calculate_employee_scores(),
+        lambda context: (len(context["reviews"]), "reviews"),
+    ),
+    "calibrated_employee_scores": (
+        lambda context: _succession_analyzer(context).with_score_aggregation(REVIEWER_WEIGHTS, True),
+        lambda analyzer: analyzer.calculate_employee_scores(),
+        lambda context: (len(context["reviews"]), "reviews"),
+    ),
+    "identify_succession_candidates": (
+        _succession_analyzer,
+        lambda analyzer: analyzer.identify_succession_candidates(),
+        lambda context: (context["employees"], "employees"),
+    ),
+    "rank_succession_candidates": (
+        _what_if_ranking,
+        lambda state: state[0].rank_succession_candidates(state[1], experience_bonus_cap=0.05),
+        lambda context: (context["employees"], "employees"),
+    ),
+    "assess_bench_strength": (
+        _succession_analyzer,
+        lambda analyzer: analyzer.assess_bench_strength(),
+        lambda context: (context["employees"], "employees"),
+    ),
+    "calculate_score_intervals": (
+        _succession_analyzer,
+        lambda analyzer: analyzer.calculate_score_intervals(),
+        lambda context: (context["employees"], "employees"),
+    ),
+    "first_development_plan": (
+        _first_development_plan,
+        lambda state: state[0].generate_development_plan(state[1]),
+        lambda context: (1, "plans"),
+    ),
+    "generate_development_plan": (
+        _development_plans,
+        lambda state: [state[0].generate_development_plan(name) for name in state[1]],
+        lambda context: (min(DEV_PLAN_SAMPLE, context["employees"] - 1), "plans"),
+    ),
+    "generate_development_plans": (
+        _succession_analyzer,
+        lambda analyzer: analyzer.generate_development_plans(),
+        lambda context: (context["employees"], "plans"),
+    ),
+    "get_text_features": (
+        lambda context: TeamDynamicsAnalyzer(context["reviews"], cache=ResultCache()),
+        lambda analyzer: analyzer.get_text_features(),
+        lambda context: (len(context["reviews"]), "reviews"),
+    ),
+    "analyze_toxic_behaviors": (
+        _warm_dynamics_analyzer,
+        lambda analyzer: analyzer.analyze_toxic_behaviors(),
+        lambda context: (context["employees"], "employees"),
+    ),
+    "analyze_positive_dynamics": (
+        _warm_dynamics_analyzer,
+        lambda analyzer: analyzer.analyze_positive_dynamics(),
+        lambda context: (context["employees"], "employees"),
+    ),
+    "analyze_relationship_network": (
+        _warm_dynamics_analyzer,
+        lambda analyzer: analyzer.analyze_relationship_network(),
+        lambda context: (context["employees"], "employees"),
+    ),
+    "identify_team_tensions": (
+        _warm_dynamics_analyzer,
+        lambda analyzer: analyzer.identify_team_tensions(),
+        lambda context: (context["employees"], "employees"),
+    ),
+    "generate_team_health_report": (
+        _warm_dynamics_analyzer,
+        lambda analyzer: analyzer.generate_team_health_report(),
+        lambda context: (context["employees"], "employees"),
+    ),
+}
+
+
+def measure(setup: Callable, run: Callable, context: Dict, repeat: int, profile_memory: bool) -> Dict:
+    """Best-of-repeat wall time of run, plus its traced peak memory in a separate pass"""
+    timings = []
+    for _ in range(repeat):
+        state = setup(context)
+        gc.collect()
+        start = time.perf_counter()
+        run(state)
+        timings.append(time.perf_counter() - start)
+
+    peak = None
+    if profile_memory:
+        # tracemalloc slows allocation-heavy code, so memory gets its own untimed pass
+        state = setup(context)
+        gc.collect()
+        tracemalloc.start()
+        run(state)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {"seconds": min(timings), "peak_bytes": peak}
+
+
+def run_suite(sizes: List[int], cases: List[str], repeat: int, profile_memory: bool, seed: int) -> Dict:
+    """Run the selected cases for every org size and return results keyed by "size:case" """
+    results = {}
+    for size in sizes:
+        reviews = generate_synthetic_review_data(size, seed=seed)
+        context = {"reviews": reviews, "employees": size}
+        print(f"\n{size} employees, {len(reviews)} reviews")
+        for case in cases:
+            setup, run, units = CASES[case]
+            result = measure(setup, run, context, repeat, profile_memory)
+            count, unit = units(context)
+            result.update({
+                "size": size,
+                "case": case,
+                "throughput": count / result["seconds"] if result["seconds"] > 0 else float("inf"),
+                "unit": unit,
+            })
+            results[f"{size}:{case}"] = result
+            peak = f"{result['peak_bytes'] / 1e6:9.1f} MB" if result["peak_bytes"] is not None else "        -"
+            print(f"  {case:32s} {result['seconds'] * 1e3:10.2f} ms  {result['throughput']:12.0f} {unit}/s  {peak}")
+    return results
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float, memory_tolerance: float,
+            min_seconds: float, min_bytes: int = 0) -> List[str]:
+    """Return a description of every measurement that regressed beyond tolerance"""
+    regressions = []
+    for key, result in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        # Sub-millisecond timings are dominated by noise
+        if result["seconds"] > min_seconds and result["seconds"] > reference["seconds"] * (1 + tolerance):
+            regressions.append(
+                f"{key}: {result['seconds'] * 1e3:.2f} ms vs baseline {reference['seconds'] * 1e3:.2f} ms"
+            )
+        # Small peaks move by whole allocator blocks from run to run
+        if (result["peak_bytes"] is not None and reference.get("peak_bytes")
+                and result["peak_bytes"] > min_bytes
+                and result["peak_bytes"] > reference["peak_bytes"] * (1 + memory_tolerance)):
+            regressions.append(
+                f"{key}: peak {result['peak_bytes'] / 1e6:.1f} MB vs baseline {reference['peak_bytes'] / 1e6:.1f} MB"
+            )
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Org sizes in employees")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES), help="Methods to run")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per measurement (best is kept)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc peak-memory pass")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic organizations")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON to compare with or update")
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed slowdown ratio")
+    parser.add_argument("--memory-tolerance", type=float, default=0.1, help="Allowed peak memory growth ratio")
+    parser.add_argument("--min-seconds", type=float, default=0.005, help="Ignore timing changes below this")
+    parser.add_argument("--min-bytes", type=int, default=1_000_000, help="Ignore peak memory changes below this")
+    parser.add_argument("--output", help="Also write this run's results to a JSON file")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.cases, args.repeat, not args.no_memory, args.seed)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"\nBaseline updated: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; run with --update-baseline to record one")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(
+        results, baseline, args.tolerance, args.memory_tolerance, args.min_seconds, args.min_bytes
+    )
+    if regressions:
+        print("\nRegressions against baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print("\nNo regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
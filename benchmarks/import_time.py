@@ -0,0 +1,65 @@
+"""Import-time benchmark for the analysis core
+
+Imports analysis_core in fresh interpreters and fails when the median import
+time exceeds the budget, or when the import pulls in a UI dependency.
+
+Usage:
+    python benchmarks/import_time.py [--budget 1.5] [--runs 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Budget for importing the core, including pandas and numpy, in seconds
+DEFAULT_BUDGET = 1.5
+
+# Modules the core must never load
+FORBIDDEN_PREFIXES = ("streamlit", "plotly", "sample_data")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import analysis_core
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def measure_import(module_probe: str = _PROBE) -> dict:
+    """Import the core once in a fresh interpreter and return its timing and loaded modules"""
+    output = subprocess.run(
+        [sys.executable, "-c", module_probe], cwd=REPO_ROOT, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET, help="Median import budget in seconds")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to time")
+    args = parser.parse_args(argv)
+
+    runs = [measure_import() for _ in range(args.runs)]
+    median = statistics.median(run["seconds"] for run in runs)
+    forbidden = sorted({
+        module for run in runs for module in run["modules"] if module.startswith(FORBIDDEN_PREFIXES)
+    })
+
+    print(f"analysis_core import: median {median:.3f}s over {args.runs} runs (budget {args.budget:.3f}s)")
+    if forbidden:
+        print(f"FAIL: core imported UI dependencies: {', '.join(forbidden)}")
+        return 1
+    if median > args.budget:
+        print("FAIL: import time over budget")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
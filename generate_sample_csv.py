@@ -1,13 +1,38 @@
 #!/usr/bin/env python3
-"""Generate sample CSV file from sample data"""
+"""Generate sample CSV file from sample data
 
-from sample_data import generate_360_review_data
+Without arguments, writes the 8-person sample. With --employees, generates a
+synthetic organization of that size and writes its reviews as shard files.
+"""
+
+import argparse
+
+from sample_data import generate_360_review_data, write_synthetic_review_shards
 
 def main():
     """Generate and save sample CSV"""
+    parser = argparse.ArgumentParser(description="Generate sample 360-degree review data")
+    parser.add_argument("--employees", type=int, help="Generate a synthetic organization with this many employees")
+    parser.add_argument("--reviews-per-employee", type=float, help="Mean reviews per employee (default: by level)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for synthetic organizations")
+    parser.add_argument("--shards", type=int, default=8, help="Number of shard files to write")
+    parser.add_argument("--workers", type=int, help="Worker processes writing shards (default: all cores)")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv", help="Shard file format")
+    parser.add_argument("--output-dir", default="synthetic_reviews", help="Directory for shard files")
+    args = parser.parse_args()
+
+    if args.employees:
+        paths = write_synthetic_review_shards(
+            args.output_dir, args.employees, num_shards=args.shards,
+            reviews_per_employee=args.reviews_per_employee, seed=args.seed,
+            n_workers=args.workers, file_format=args.format
+        )
+        print(f"Generated {len(paths)} shard files for {args.employees} employees in {args.output_dir}")
+        return
+
     df = generate_360_review_data()
     df.to_csv("sample_360_reviews.csv", index=False)
     print(f"Generated sample_360_reviews.csv with {len(df)} records for {df['employee_name'].nunique()} employees")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
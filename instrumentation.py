@@ -0,0 +1,229 @@
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Callable, Dict, List, Optional
+
+
+class Recorder:
+    """Bounded buffer of finished spans for one recording scope, such as one app session"""
+
+    def __init__(self, maxlen: int = 20_000):
+        self.spans = deque(maxlen=maxlen)
+        self.lock = threading.Lock()
+        self.origin = time.perf_counter()
+
+    def clear(self):
+        """Drop every recorded span"""
+        with self.lock:
+            self.spans.clear()
+
+    def get_spans(self) -> List[Dict]:
+        """Return a snapshot of the recorded spans, oldest first"""
+        with self.lock:
+            return list(self.spans)
+
+
+# Spans go to the recorder enabled in the current context. Each thread (and so each
+# Streamlit script run) has its own context, so sessions record independently.
+_current: contextvars.ContextVar[Optional[Recorder]] = contextvars.ContextVar('recorder', default=None)
+_default_recorder = Recorder()
+_local = threading.local()
+
+
+def enable(recorder: Recorder = None):
+    """Start recording spans in the current context, into recorder or the process default"""
+    _current.set(recorder if recorder is not None else _default_recorder)
+
+
+def disable():
+    """Stop recording spans in the current context; recorded spans are kept until cleared"""
+    _current.set(None)
+
+
+def is_enabled() -> bool:
+    return _current.get() is not None
+
+
+def _recorder(recorder: Recorder = None) -> Recorder:
+    """The given recorder, else the one recording in this context, else the process default"""
+    if recorder is not None:
+        return recorder
+    current = _current.get()
+    return current if current is not None else _default_recorder
+
+
+def clear(recorder: Recorder = None):
+    """Drop every span recorded by recorder (by default the current one)"""
+    _recorder(recorder).clear()
+
+
+def get_spans(recorder: Recorder = None) -> List[Dict]:
+    """Return a snapshot of recorder's spans (by default the current one's), oldest first"""
+    return _recorder(recorder).get_spans()
+
+
+def record(name: str, start: float, duration: float, rows: int = None, calls: int = 1):
+    """Record a finished span in the current context; start is a time.perf_counter() value"""
+    recorder = _current.get()
+    if recorder is None:
+        return
+    depth = len(getattr(_local, 'stack', ()))
+    span = {
+        'name': name,
+        'start': start - recorder.origin,
+        'duration': duration,
+        'rows': rows,
+        'calls': calls,
+        'depth': depth,
+        'thread': threading.get_ident(),
+        'pid': os.getpid(),
+    }
+    with recorder.lock:
+        recorder.spans.append(span)
+
+
+class _Span:
+    """Times one named block; rows can be set inside the block"""
+
+    def __init__(self, name: str, rows: int = None):
+        self.name = name
+        self.rows = rows
+
+    def __enter__(self):
+        stack = getattr(_local, 'stack', None)
+        if stack is None:
+            stack = _local.stack = []
+        self._start = time.perf_counter()
+        stack.append(self.name)
+        return self
+
+    def __exit__(self, *exc_info):
+        duration = time.perf_counter() - self._start
+        _local.stack.pop()
+        record(self.name, self._start, duration, self.rows)
+        return False
+
+
+class _NullSpan:
+    """Shared no-op span used while recording is disabled"""
+
+    rows = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def __setattr__(self, name, value):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str, rows: int = None):
+    """Context manager timing a named block, or a shared no-op while disabled"""
+    if _current.get() is None:
+        return _NULL_SPAN
+    return _Span(name, rows)
+
+
+def traced(name: str = None, rows: Callable[..., int] = None) -> Callable:
+    """Decorate a function so each call is recorded as a span
+
+    rows, if given, is called with the function's arguments and returns the
+    number of rows the call processes. While recording is disabled the wrapper
+    only looks up the current recorder and calls straight through.
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current.get() is None:
+                return func(*args, **kwargs)
+            with _Span(span_name, rows(*args, **kwargs) if rows is not None else None):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class StageTotals:
+    """Accumulates time per stage across many small calls, such as one per review
+
+    Recording a span per review would cost more than the work it measures, so hot
+    loops add to running totals and flush them as one aggregated span per stage.
+    """
+
+    def __init__(self):
+        self.seconds = defaultdict(float)
+        self.calls = defaultdict(int)
+
+    def add(self, stage: str, seconds: float):
+        self.seconds[stage] += seconds
+        self.calls[stage] += 1
+
+    def flush(self, prefix: str, start: float, rows: int = None):
+        """Record each stage as a span, laid end to end from start"""
+        for stage, seconds in self.seconds.items():
+            record(f"{prefix}.{stage}", start, seconds, rows, self.calls[stage])
+            start += seconds
+        self.seconds.clear()
+        self.calls.clear()
+
+
+def summarize(spans: List[Dict] = None, recorder: Recorder = None) -> List[Dict]:
+    """Per-name totals of the given spans or of recorder's spans, slowest total first"""
+    totals = {}
+    for span_data in get_spans(recorder) if spans is None else spans:
+        entry = totals.setdefault(span_data['name'], {
+            'name': span_data['name'], 'calls': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'rows': None
+        })
+        duration_ms = span_data['duration'] * 1e3
+        entry['calls'] += span_data['calls']
+        entry['total_ms'] += duration_ms
+        entry['max_ms'] = max(entry['max_ms'], duration_ms)
+        if span_data['rows'] is not None:
+            entry['rows'] = (entry['rows'] or 0) + span_data['rows']
+
+    summary = sorted(totals.values(), key=lambda entry: entry['total_ms'], reverse=True)
+    for entry in summary:
+        entry['mean_ms'] = entry['total_ms'] / entry['calls'] if entry['calls'] else 0.0
+        entry['rows_per_s'] = (
+            entry['rows'] / (entry['total_ms'] / 1e3) if entry['rows'] and entry['total_ms'] else None
+        )
+    return summary
+
+
+def export_trace(path: str = None, recorder: Recorder = None) -> str:
+    """Serialize recorder's spans (by default the current one's) as a Chrome trace
+    (chrome://tracing, Perfetto)
+
+    Returns the JSON document and also writes it to path when one is given.
+    """
+    events = []
+    for span_data in get_spans(recorder):
+        args = {'calls': span_data['calls']}
+        if span_data['rows'] is not None:
+            args['rows'] = span_data['rows']
+        events.append({
+            'name': span_data['name'],
+            'ph': 'X',
+            'ts': span_data['start'] * 1e6,
+            'dur': span_data['duration'] * 1e6,
+            'pid': span_data['pid'],
+            'tid': span_data['thread'],
+            'args': args,
+        })
+    trace = json.dumps({'traceEvents': events, 'displayTimeUnit': 'ms'})
+    if path is not None:
+        with open(path, 'w') as f:
+            f.write(trace)
+    return trace
@@ -0,0 +1,74 @@
+import threading
+from typing import Callable, List, Tuple
+
+
+class PrecomputeJob:
+    """Warms analyzer results on a background thread, with progress and cancellation
+
+    Each step calls an analyzer method whose result lands in the analyzer's result
+    cache, so pages asking for it later get it immediately; a page asking while the
+    step is still running waits for that computation instead of repeating it.
+    Cancellation is checked between steps, so a step already running completes.
+    Development plans are warmed as one batch, which also builds the per-employee
+    lookups that single plans use, so those come back quickly on demand.
+    """
+
+    def __init__(self, succession_analyzer, dynamics_analyzer):
+        self.succession_analyzer = succession_analyzer
+        self.dynamics_analyzer = dynamics_analyzer
+        self.current_step = "Waiting to start"
+        self.steps_done = 0
+        self.total_steps = len(self._steps())
+        self.error = None
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="precompute", daemon=True)
+
+    def start(self) -> "PrecomputeJob":
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """Stop before the next step"""
+        self._cancelled.set()
+
+    def join(self, timeout: float = None):
+        self._thread.join(timeout)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    @property
+    def progress(self) -> float:
+        """Completed fraction of the steps, between 0 and 1"""
+        return min(1.0, self.steps_done / self.total_steps) if self.total_steps else 1.0
+
+    def _steps(self) -> List[Tuple[str, Callable]]:
+        succession = self.succession_analyzer
+        dynamics = self.dynamics_analyzer
+        return [
+            ("Employee scores", succession.calculate_employee_scores),
+            ("Succession candidates", succession.identify_succession_candidates),
+            ("Score intervals", succession.calculate_score_intervals),
+            ("Development plans", succession.generate_development_plans),
+            ("Team health report", dynamics.generate_team_health_report),
+        ]
+
+    def _run(self):
+        try:
+            for label, step in self._steps():
+                if self._cancelled.is_set():
+                    self.current_step = "Cancelled"
+                    return
+                self.current_step = label
+                step()
+                self.steps_done += 1
+            self.current_step = "Done"
+        except Exception as e:
+            # Pages recompute on demand and report the error themselves
+            self.error = e
+            self.current_step = "Failed"
@@ -0,0 +1,194 @@
+import functools
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Hashable
+
+import numpy as np
+import pandas as pd
+
+
+def dataset_fingerprint(df: pd.DataFrame) -> str:
+    """Fast content fingerprint of a DataFrame (values, index, columns and dtypes)"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr([(str(col), str(dtype)) for col, dtype in df.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def chain_fingerprint(fingerprint: str, batch_fingerprint: str) -> str:
+    """Fingerprint of a dataset after appending a batch, without rehashing the history"""
+    return hashlib.blake2b(f"{fingerprint}+{batch_fingerprint}".encode(), digest_size=16).hexdigest()
+
+
+# Containers larger than this are sized from an evenly spaced sample of their items
+_SIZE_SAMPLE = 16
+
+
+def approximate_size(value: Any, _seen: set = None) -> int:
+    """Approximate bytes held by a cached result
+
+    DataFrames, Series and arrays count their buffers; containers and plain objects
+    add up their contents, extrapolated from a sample of items for large containers.
+    Strings in object columns are not counted. Sizing stays cheap next to computing
+    the result, whatever its size.
+    """
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=False).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=False))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (str, bytes, int, float, bool)) or value is None:
+        return sys.getsizeof(value)
+    if isinstance(value, dict):
+        items = list(value.items()) if len(value) <= _SIZE_SAMPLE else _sample(list(value.items()))
+        items = [item for pair in items for item in pair]
+        return sys.getsizeof(value) + _scaled_size(items, len(value) * 2, _seen)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = list(value) if len(value) <= _SIZE_SAMPLE else _sample(list(value))
+        return sys.getsizeof(value) + _scaled_size(items, len(value), _seen)
+    if hasattr(value, '__dict__'):
+        return sys.getsizeof(value) + approximate_size(vars(value), _seen)
+    return sys.getsizeof(value)
+
+
+def _sample(items: list) -> list:
+    return items[::-(-len(items) // _SIZE_SAMPLE)]
+
+
+def _scaled_size(items: list, total: int, seen: set) -> int:
+    """Size of items, scaled up to a container of total items"""
+    if not items:
+        return 0
+    return sum(approximate_size(item, seen) for item in items) * total // len(items)
+
+
+class ResultCache:
+    """Thread-safe LRU cache for analyzer results, bounded by entries and approximate bytes
+
+    Results of large datasets are big, so the byte budget usually binds first. The most
+    recent result is always kept, even when it alone exceeds the budget.
+    """
+
+    def __init__(self, maxsize: int = 128, max_bytes: int = 1 << 30):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+        # Per-key locks and their number of holders or waiters, for keys being computed
+        self._computing = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a cached result and mark it as most recently used"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any):
+        """Store a result, evicting least recently used entries beyond maxsize or max_bytes"""
+        size = approximate_size(value)
+        with self._lock:
+            self.nbytes += size - self._sizes.get(key, 0)
+            self._entries[key] = value
+            self._sizes[key] = size
+            self._entries.move_to_end(key)
+            while len(self._entries) > 1 and (len(self._entries) > self.maxsize or self.nbytes > self.max_bytes):
+                evicted, _ = self._entries.popitem(last=False)
+                self.nbytes -= self._sizes.pop(evicted)
+
+    @contextmanager
+    def computing(self, key: Hashable):
+        """Hold the computation of one key, so concurrent callers compute it only once"""
+        with self._lock:
+            entry = self._computing.get(key)
+            if entry is None:
+                entry = self._computing[key] = [threading.Lock(), 0]
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._computing[key]
+
+    def clear(self):
+        """Drop every cached result"""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __reduce__(self):
+        # Analyzers holding a cache stay picklable: the shared cache unpickles to itself
+        # and any other cache to an empty one of the same bounds, since locks cannot be pickled
+        if self is default_cache:
+            return 'default_cache'
+        return (ResultCache, (self.maxsize, self.max_bytes))
+
+
+# Shared by every analyzer so results survive analyzer re-creation on the same data
+default_cache = ResultCache()
+
+_MISSING = object()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turn method arguments into a hashable cache key component"""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((_freeze(k), _freeze(v)) for k, v in value.items()))
+    raise TypeError(f"Unhashable cache argument: {type(value).__name__}")
+
+
+def cached_result(method: Callable) -> Callable:
+    """Memoize an analyzer method on its dataset fingerprint, configuration and arguments
+
+    The analyzer provides ``fingerprint``, ``cache`` and ``_cache_config()``. Calls with
+    arguments that cannot be frozen into a key (such as DataFrames) are not cached.
+    Cached results are shared between callers and must be treated as read-only.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            key = (
+                type(self).__qualname__, method.__name__, self.fingerprint, self._cache_config(),
+                _freeze(args), _freeze(kwargs)
+            )
+        except TypeError:
+            return method(self, *args, **kwargs)
+
+        result = self.cache.get(key, _MISSING)
+        if result is _MISSING:
+            # A caller arriving while another thread computes the same key waits for its result
+            with self.cache.computing(key):
+                result = self.cache.get(key, _MISSING)
+                if result is _MISSING:
+                    result = method(self, *args, **kwargs)
+                    self.cache.put(key, result)
+        return result
+
+    return wrapper
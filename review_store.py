@@ -0,0 +1,164 @@
+import os
+import sqlite3
+import tempfile
+import threading
+from typing import Iterator, List, Union
+
+import pandas as pd
+
+
+def compact_reviews(reviews_df: pd.DataFrame) -> pd.DataFrame:
+    """Return a memory-compact copy of a reviews frame for long-lived sessions
+
+    String columns with repeated values, from names, roles and reviewer types to
+    review text and feedback snippets, become categoricals, which intern each
+    distinct string once and store small integer codes per row. Scores keep their
+    float64 dtype: float32 rounding would shift means off the requirement
+    thresholds and change readiness and plans.
+    """
+    compact = reviews_df.copy()
+    for col in compact.columns:
+        series = compact[col]
+        if pd.api.types.is_string_dtype(series) and not isinstance(series.dtype, pd.CategoricalDtype):
+            if series.nunique(dropna=False) < len(series):
+                compact[col] = series.astype('category')
+    return compact
+
+
+class ReviewStore:
+    """On-disk store of raw review rows, queried per employee instead of held in memory"""
+
+    def __init__(self, path: str = None):
+        if path is None:
+            handle, path = tempfile.mkstemp(prefix="reviews_", suffix=".sqlite")
+            os.close(handle)
+        self.path = path
+        # Streamlit reruns scripts on different threads, so share one guarded connection
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._date_columns: List[str] = []
+        self._num_rows = 0
+
+    def append(self, reviews_df: pd.DataFrame):
+        """Write a batch of review rows to the store"""
+        if len(reviews_df) == 0:
+            return
+        self._date_columns = [
+            col for col in reviews_df.columns if pd.api.types.is_datetime64_any_dtype(reviews_df[col])
+        ]
+        with self._lock:
+            reviews_df.to_sql('reviews', self._conn, if_exists='append', index=False)
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_employee ON reviews (employee_name)')
+            self._conn.commit()
+        self._num_rows += len(reviews_df)
+
+    def __len__(self) -> int:
+        return self._num_rows
+
+    def _query(self, sql: str, params: tuple = ()) -> pd.DataFrame:
+        with self._lock:
+            return pd.read_sql_query(sql, self._conn, params=params, parse_dates=self._date_columns or None)
+
+    def employee_reviews(self, employee_name: str) -> pd.DataFrame:
+        """Return all reviews of one employee in ingestion order"""
+        if not self._num_rows:
+            return pd.DataFrame()
+        return self._query('SELECT * FROM reviews WHERE employee_name = ? ORDER BY rowid', (employee_name,))
+
+    def head(self, n: int = 1000) -> pd.DataFrame:
+        """Return the first n stored reviews"""
+        if not self._num_rows:
+            return pd.DataFrame()
+        return self._query('SELECT * FROM reviews ORDER BY rowid LIMIT ?', (n,))
+
+    def iter_chunks(self, chunksize: int = 50_000) -> Iterator[pd.DataFrame]:
+        """Yield stored reviews in ingestion order, chunksize rows at a time
+
+        Each chunk starts after the last rowid of the previous one, so a full pass
+        reads every row once; OFFSET would rescan all earlier rows for every chunk.
+        """
+        if not self._num_rows:
+            return
+        last_rowid = 0
+        while True:
+            chunk = self._query(
+                'SELECT rowid AS _store_rowid, * FROM reviews WHERE rowid > ? ORDER BY rowid LIMIT ?',
+                (last_rowid, chunksize)
+            )
+            if chunk.empty:
+                return
+            last_rowid = int(chunk.pop('_store_rowid').iloc[-1])
+            yield chunk
+            if len(chunk) < chunksize:
+                return
+
+    def close(self):
+        """Close the connection and delete the backing file"""
+        with self._lock:
+            self._conn.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class StreamedReviews:
+    """Analyzers and on-disk review store produced by streaming ingestion"""
+
+    def __init__(self, succession_analyzer, dynamics_analyzer, review_store: ReviewStore):
+        self.succession_analyzer = succession_analyzer
+        self.dynamics_analyzer = dynamics_analyzer
+        self.review_store = review_store
+
+    @property
+    def num_reviews(self) -> int:
+        return len(self.review_store)
+
+
+def stream_reviews_csv(source: Union[str, object], chunksize: int = 50_000,
+                       store_path: str = None, n_workers: int = 1, chunk_size: int = None) -> StreamedReviews:
+    """Ingest a reviews CSV chunk by chunk with bounded memory
+
+    Only per-employee score and text aggregates stay in memory; raw rows are written
+    to an on-disk ReviewStore. The source must be a path or a seekable file object,
+    because a cheap first pass collects the roster before any text is scanned.
+    n_workers and chunk_size configure the text analysis process pool per chunk.
+    """
+    # Imported here so importing the store does not pull in both analyzers
+    from succession_planning import SuccessionPlanningAnalyzer
+    from team_dynamics import TeamDynamicsAnalyzer
+    from text_matching import first_name_aliases
+
+    roster = []
+    seen = set()
+    for names in pd.read_csv(source, usecols=['employee_name'], chunksize=chunksize):
+        for name in names['employee_name'].dropna().unique():
+            if name not in seen:
+                seen.add(name)
+                roster.append(name)
+
+    if hasattr(source, 'seek'):
+        source.seek(0)
+
+    review_store = ReviewStore(store_path)
+    succession_analyzer = None
+    dynamics_analyzer = None
+
+    for chunk in pd.read_csv(source, chunksize=chunksize):
+        if 'review_date' in chunk.columns:
+            chunk['review_date'] = pd.to_datetime(chunk['review_date'])
+        review_store.append(chunk)
+
+        if succession_analyzer is None:
+            succession_analyzer = SuccessionPlanningAnalyzer(chunk, review_store=review_store)
+            dynamics_analyzer = TeamDynamicsAnalyzer(
+                chunk, name_aliases=first_name_aliases(roster), review_store=review_store, roster=roster,
+                n_workers=n_workers, chunk_size=chunk_size
+            )
+        else:
+            succession_analyzer.append_reviews(chunk)
+            dynamics_analyzer.append_reviews(chunk)
+
+    if succession_analyzer is None:
+        review_store.close()
+        raise ValueError("No reviews found in CSV")
+
+    return StreamedReviews(succession_analyzer, dynamics_analyzer, review_store)
@@ -5,6 +5,68 @@ import random
 import re
 from typing import Dict, List, Tuple
 
+# Strengths and development areas by level, shared by both generators
+STRENGTHS_POOL = {
+    "VP": [
+        "Exceptional strategic vision and ability to align teams with company goals",
+        "Strong executive presence and stakeholder management skills",
+        "Excellent at building high-performing teams and developing talent",
+        "Outstanding communication skills across all organizational levels"
+    ],
+    "Director": [
+        "Strong leadership skills and ability to drive team performance",
+        "Excellent project management and delivery capabilities",
+        "Good strategic thinking and cross-functional collaboration",
+        "Effective at mentoring and developing team members"
+    ],
+    "Manager": [
+        "Strong team leadership and people management skills",
+        "Excellent at coordinating cross-team initiatives",
+        "Good technical knowledge and problem-solving abilities",
+        "Effective communicator and team motivator"
+    ],
+    "Professional": [
+        "Strong technical expertise and problem-solving skills",
+        "Excellent attention to detail and quality of work",
+        "Good collaboration and communication skills",
+        "Proactive in taking on new challenges and learning"
+    ],
+    "Graduate": [
+        "Quick learner with strong technical foundation",
+        "Enthusiastic and eager to contribute to team success",
+        "Good communication skills and team player attitude",
+        "Shows potential for growth and development"
+    ]
+}
+
+DEVELOPMENT_POOL = {
+    "VP": [
+        "Could benefit from more hands-on involvement in day-to-day operations",
+        "Opportunity to further develop next-generation leadership pipeline",
+        "Could enhance digital transformation and innovation leadership"
+    ],
+    "Director": [
+        "Would benefit from developing more strategic thinking capabilities",
+        "Opportunity to improve executive communication and presentation skills",
+        "Could enhance cross-functional stakeholder management"
+    ],
+    "Manager": [
+        "Would benefit from developing more advanced leadership skills",
+        "Opportunity to improve strategic planning and vision setting",
+        "Could enhance conflict resolution and difficult conversation skills"
+    ],
+    "Professional": [
+        "Would benefit from developing leadership and mentoring skills",
+        "Opportunity to improve strategic thinking and business acumen",
+        "Could enhance presentation and executive communication skills"
+    ],
+    "Graduate": [
+        "Would benefit from developing more advanced technical skills",
+        "Opportunity to improve project management and planning abilities",
+        "Could enhance professional communication and networking skills"
+    ]
+}
+
 def generate_360_review_data():
     """Generate sample 360-degree review data with human text reviews for 8 team members"""
     
@@ -94,40 +156,7 @@ def generate_360_review_data():
 
 def generate_strengths(person, performance_level):
     """Generate realistic strengths based on role and performance"""
-    strengths_pool = {
-        "VP": [
-            "Exceptional strategic vision and ability to align teams with company goals",
-            "Strong executive presence and stakeholder management skills",
-            "Excellent at building high-performing teams and developing talent",
-            "Outstanding communication skills across all organizational levels"
-        ],
-        "Director": [
-            "Strong leadership skills and ability to drive team performance",
-            "Excellent project management and delivery capabilities",
-            "Good strategic thinking and cross-functional collaboration",
-            "Effective at mentoring and developing team members"
-        ],
-        "Manager": [
-            "Strong team leadership and people management skills",
-            "Excellent at coordinating cross-team initiatives",
-            "Good technical knowledge and problem-solving abilities",
-            "Effective communicator and team motivator"
-        ],
-        "Professional": [
-            "Strong technical expertise and problem-solving skills",
-            "Excellent attention to detail and quality of work",
-            "Good collaboration and communication skills",
-            "Proactive in taking on new challenges and learning"
-        ],
-        "Graduate": [
-            "Quick learner with strong technical foundation",
-            "Enthusiastic and eager to contribute to team success",
-            "Good communication skills and team player attitude",
-            "Shows potential for growth and development"
-        ]
-    }
-    
-    role_strengths = strengths_pool.get(person["level"], strengths_pool["Professional"])
+    role_strengths = STRENGTHS_POOL.get(person["level"], STRENGTHS_POOL["Professional"])
     
     if performance_level > 0.8:
         return random.choice(role_strengths[:2])  # Top strengths for high performers
@@ -136,35 +165,7 @@ def generate_strengths(person, performance_level):
 
 def generate_development_areas(person, performance_level):
     """Generate realistic development areas based on role and performance"""
-    development_pool = {
-        "VP": [
-            "Could benefit from more hands-on involvement in day-to-day operations",
-            "Opportunity to further develop next-generation leadership pipeline",
-            "Could enhance digital transformation and innovation leadership"
-        ],
-        "Director": [
-            "Would benefit from developing more strategic thinking capabilities",
-            "Opportunity to improve executive communication and presentation skills",
-            "Could enhance cross-functional stakeholder management"
-        ],
-        "Manager": [
-            "Would benefit from developing more advanced leadership skills",
-            "Opportunity to improve strategic planning and vision setting",
-            "Could enhance conflict resolution and difficult conversation skills"
-        ],
-        "Professional": [
-            "Would benefit from developing leadership and mentoring skills",
-            "Opportunity to improve strategic thinking and business acumen",
-            "Could enhance presentation and executive communication skills"
-        ],
-        "Graduate": [
-            "Would benefit from developing more advanced technical skills",
-            "Opportunity to improve project management and planning abilities",
-            "Could enhance professional communication and networking skills"
-        ]
-    }
-    
-    role_development = development_pool.get(person["level"], development_pool["Professional"])
+    role_development = DEVELOPMENT_POOL.get(person["level"], DEVELOPMENT_POOL["Professional"])
     return random.choice(role_development)
 
 def initialize_review_templates() -> Dict:
@@ -342,6 +343,332 @@ def generate_review_text(reviewee: Dict, reviewer_type: str, team_dynamics: Dict
     
     return " ".join(review_parts)
 
+
+# Synthetic organizations of any size, for load testing the analyzers
+
+ORG_LEVEL_SHARES = {"VP": 0.005, "Director": 0.03, "Manager": 0.12, "Graduate": 0.2}  # Professional takes the rest
+
+ORG_LEVEL_ROLES = {
+    "VP": ["VP Engineering", "VP Product", "VP Operations"],
+    "Director": ["Director Engineering", "Director Product", "Director Operations"],
+    "Manager": ["Senior Manager", "Engineering Manager", "Operations Manager"],
+    "Professional": ["Senior Developer", "Product Manager", "UX Designer", "Data Analyst", "Developer"],
+    "Graduate": ["Junior Developer", "Graduate Analyst"]
+}
+
+ORG_LEVEL_EXPERIENCE = {"VP": (12, 25), "Director": (8, 18), "Manager": (5, 14), "Professional": (2, 10), "Graduate": (0, 2)}
+
+ORG_LEVEL_REVIEWS = {"VP": 8, "Director": 6, "Manager": 5, "Professional": 4, "Graduate": 3}
+
+ORG_LEVEL_SENTENCES = {
+    "VP": "{name} provides strong strategic direction and has a clear vision for the organization's future.",
+    "Director": "{name} effectively balances strategic thinking with hands-on execution and team development.",
+    "Graduate": "{name} shows great potential and is eager to learn, though sometimes needs more guidance on complex projects."
+}
+
+FIRST_NAMES = [
+    "Sarah", "Michael", "Jennifer", "David", "Lisa", "Alex", "Maria", "James", "Priya", "Omar",
+    "Elena", "Kenji", "Fatima", "Lucas", "Aisha", "Daniel", "Sofia", "Ethan", "Grace", "Mateo",
+    "Hannah", "Ravi", "Chloe", "Noah", "Mei", "Samuel", "Nadia", "Oliver", "Zara", "Gabriel",
+    "Ingrid", "Tomas", "Amara", "Leo", "Yuki", "Isaac", "Leila", "Victor", "Anya", "Diego",
+    "Rosa", "Felix", "Keiko", "Hugo", "Nina", "Arjun", "Clara", "Marcus", "Lena", "Jonah",
+    "Tara", "Emil", "Maya", "Rafael", "Iris", "Kwame", "Julia", "Andre", "Vera", "Ibrahim",
+    "Paula", "Sven", "Hana", "Caleb"
+]
+
+LAST_NAMES = [
+    "Chen", "Rodriguez", "Kim", "Thompson", "Wang", "Johnson", "Garcia", "Wilson", "Patel", "Haddad",
+    "Petrova", "Tanaka", "Okafor", "Silva", "Khan", "Novak", "Rossi", "Murphy", "Nguyen", "Fernandez",
+    "Schmidt", "Iyer", "Dubois", "Andersen", "Liu", "Cohen", "Popescu", "Brown", "Mensah", "Costa",
+    "Larsen", "Kowalski", "Adeyemi", "Moreau", "Sato", "Becker", "Nasser", "Lindqvist", "Ivanova", "Ortiz",
+    "Jensen", "Hoffmann", "Yamamoto", "Lopez", "Kaur", "Walsh", "Osei", "Bauer", "Park", "Morales",
+    "Fischer", "Reddy", "Dimitrov", "Santos", "Ali", "Virtanen", "Romano", "Clarke", "Suzuki", "Herrera",
+    "Meyer", "Das", "Horvat", "Mbeki"
+]
+
+REVIEWER_TYPES = ["Manager", "Peer", "Direct Report", "Cross-functional Partner", "Self"]
+
+# Employees are generated in fixed-size blocks with their own random streams, so the
+# data for a seed is identical however the blocks are grouped into shards
+_ORG_BLOCK_SIZE = 1000
+
+
+def _unique_names(count: int, rng: np.random.Generator) -> np.ndarray:
+    """Return count distinct full names in random order
+
+    Names beyond the first/last name combinations get middle initials, which keeps
+    every name from appearing inside another one. Initials carry no period, since
+    sentence punctuation inside a name would split the sentences mentioning it.
+    """
+    combinations = len(FIRST_NAMES) * len(LAST_NAMES)
+    slots = rng.permutation(max(count, combinations))[:count] if count <= combinations else np.arange(count)
+    names = []
+    for slot in slots.tolist():
+        first = FIRST_NAMES[slot % len(FIRST_NAMES)]
+        last = LAST_NAMES[(slot // len(FIRST_NAMES)) % len(LAST_NAMES)]
+        middle = slot // combinations
+        initials = ""
+        while middle:
+            middle -= 1
+            initials = chr(ord("A") + middle % 26) + initials
+            middle //= 26
+        names.append(f"{first} {initials} {last}" if initials else f"{first} {last}")
+    names = np.array(names, dtype=object)
+    return names if count <= combinations else names[rng.permutation(count)]
+
+
+def _random_teammates(team_ids: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Pick a random other member of each employee's team, or -1 for one-person teams"""
+    order = np.argsort(team_ids, kind="stable")
+    sorted_teams = team_ids[order]
+    team_start = np.searchsorted(sorted_teams, team_ids, side="left")
+    team_size = np.searchsorted(sorted_teams, team_ids, side="right") - team_start
+
+    # Draw among the other team_size - 1 members, skipping over the employee itself
+    own_offset = np.empty(len(team_ids), dtype=np.int64)
+    own_offset[order] = np.arange(len(team_ids)) - team_start[order]
+    offset = (rng.random(len(team_ids)) * np.maximum(team_size - 1, 1)).astype(np.int64)
+    offset += offset >= own_offset
+    return np.where(team_size > 1, order[np.minimum(team_start + offset, len(team_ids) - 1)], -1)
+
+
+def generate_org_structure(num_employees: int, seed: int = 0, rivalry_rate: float = 0.15,
+                           partnership_rate: float = 0.3) -> pd.DataFrame:
+    """Generate the employees of a synthetic organization with a reporting hierarchy
+
+    Each employee reports to someone one level up, team_size counts direct reports,
+    and rivalries and partnerships are drawn between teammates, so their number
+    grows with team sizes.
+    """
+    if num_employees < 5:
+        raise ValueError("A synthetic organization needs at least 5 employees")
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(0,)))
+
+    counts = {level: max(1, int(round(num_employees * share))) for level, share in ORG_LEVEL_SHARES.items()}
+    counts["Professional"] = num_employees - sum(counts.values())
+    levels = np.repeat(
+        np.array(["VP", "Director", "Manager", "Professional", "Graduate"], dtype=object),
+        [counts["VP"], counts["Director"], counts["Manager"], counts["Professional"], counts["Graduate"]]
+    )
+    level_start = {level: int(np.argmax(levels == level)) for level in ORG_LEVEL_ROLES}
+
+    # Reporting lines: VPs report to nobody, everyone else to a random employee one level up
+    manager = np.full(num_employees, -1, dtype=np.int64)
+    for level, boss_level in [("Director", "VP"), ("Manager", "Director"), ("Professional", "Manager"), ("Graduate", "Manager")]:
+        members = levels == level
+        manager[members] = level_start[boss_level] + rng.integers(0, counts[boss_level], members.sum())
+    team_size = np.bincount(manager[manager >= 0], minlength=num_employees)
+
+    roles = np.empty(num_employees, dtype=object)
+    years = np.empty(num_employees, dtype=np.int64)
+    for level, level_roles in ORG_LEVEL_ROLES.items():
+        members = np.flatnonzero(levels == level)
+        # Roles cycle within a level so even small orgs hold every succession target role
+        roles[members] = np.array(level_roles, dtype=object)[np.arange(len(members)) % len(level_roles)]
+        low, high = ORG_LEVEL_EXPERIENCE[level]
+        years[members] = rng.integers(low, high + 1, len(members))
+
+    # Teammates share a manager; the VPs form one leadership team
+    rival = _random_teammates(manager, rng)
+    partner = _random_teammates(manager, rng)
+    rival[rng.random(num_employees) >= rivalry_rate] = -1
+    partner[(rng.random(num_employees) >= partnership_rate) | (partner == rival)] = -1
+    
+    # Relationships are mutual where the other side has none of its own yet
+    for related in (rival, partner):
+        sources = np.flatnonzero(related >= 0)
+        sources = sources[related[related[sources]] == -1]
+        related[related[sources]] = sources
+
+    return pd.DataFrame({
+        "employee_name": _unique_names(num_employees, rng),
+        "employee_role": roles,
+        "employee_level": levels,
+        "years_experience": years,
+        "team_size": team_size,
+        "manager": manager,
+        "rival": rival,
+        "partner": partner,
+        "base_performance": np.clip(rng.normal(0.7, 0.1, num_employees), 0.3, 0.98)
+    })
+
+
+def _generate_block_reviews(org: pd.DataFrame, block_start: int, seed: int, reviews_per_employee: float,
+                            as_of: pd.Timestamp, templates: Dict) -> Tuple[np.ndarray, pd.DataFrame]:
+    """Generate reviews for one block of employees from the block's own random stream"""
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(1, block_start // _ORG_BLOCK_SIZE)))
+    block = np.arange(block_start, min(len(org), block_start + _ORG_BLOCK_SIZE))
+    competencies = [
+        "leadership", "strategic_thinking", "communication", "technical_skills",
+        "problem_solving", "team_collaboration", "innovation", "decision_making",
+        "adaptability", "mentoring", "customer_focus", "results_delivery"
+    ]
+    comp_index = {comp: i for i, comp in enumerate(competencies)}
+    names = org["employee_name"].to_numpy()
+    
+    # Review counts follow the level, or a Poisson distribution around reviews_per_employee
+    if reviews_per_employee is None:
+        counts = np.array([ORG_LEVEL_REVIEWS[level] for level in org["employee_level"].to_numpy()[block]])
+    else:
+        counts = np.maximum(1, rng.poisson(reviews_per_employee, len(block)))
+    profiles = rng.normal(0.0, 0.08, (len(block), len(competencies)))
+    local = np.repeat(np.arange(len(block)), counts)
+    owner = block[local]
+    num_reviews = len(owner)
+    
+    reviewer = rng.integers(0, len(REVIEWER_TYPES), num_reviews)
+    days_ago = rng.integers(30, 91, num_reviews)
+    template_draw = rng.integers(0, 30, (num_reviews, 3))
+    tone_draw, rival_draw, partner_draw, strength_draw, development_draw = rng.random((5, num_reviews))
+    noise = rng.normal(0.0, 0.08, (num_reviews, len(competencies)))
+    
+    owner_levels = org["employee_level"].to_numpy()[owner]
+    owner_base = org["base_performance"].to_numpy()[owner]
+    rival = org["rival"].to_numpy()[owner]
+    partner = org["partner"].to_numpy()[owner]
+    
+    # Text tone follows performance; peers and partners comment on rivals and partners
+    positive = tone_draw < owner_base
+    leadership_comment = template_draw[:, 2] % 2 == 0
+    peer_like = np.isin(reviewer, [REVIEWER_TYPES.index("Peer"), REVIEWER_TYPES.index("Cross-functional Partner")])
+    toxic = peer_like & (rival >= 0) & (rival_draw < 0.3)
+    collaborative = peer_like & (partner >= 0) & (partner_draw < 0.6)
+    
+    review_texts = []
+    for row in range(num_reviews):
+        name = names[owner[row]]
+        topic = "leadership" if leadership_comment[row] else "communication"
+        topic_templates = templates[f"{'positive' if positive[row] else 'negative'}_{topic}"]
+        parts = [topic_templates[template_draw[row, 0] % len(topic_templates)].format(name=name)]
+        if collaborative[row]:
+            collaborative_templates = templates["collaborative_positive"]
+            parts.append(collaborative_templates[template_draw[row, 1] % len(collaborative_templates)].format(
+                name=name, other_name=names[partner[row]]))
+        if toxic[row]:
+            toxic_templates = templates["toxic_patterns"]
+            parts.append(toxic_templates[template_draw[row, 1] % len(toxic_templates)].format(
+                name=name, other_name=names[rival[row]]))
+        level_sentence = ORG_LEVEL_SENTENCES.get(owner_levels[row])
+        if level_sentence:
+            parts.append(level_sentence.format(name=name))
+        review_texts.append(" ".join(part if part.endswith(".") else part + "." for part in parts))
+    
+    # Scores: base performance + competency profile + reviewer leniency + text tone + noise
+    leniency = np.array([0.0, 0.02, 0.03, 0.0, 0.06])[reviewer]
+    scores = owner_base[:, None] + profiles[local] + leniency[:, None] + noise
+    commented = np.where(leadership_comment, comp_index["leadership"], comp_index["communication"])
+    scores[np.arange(num_reviews), commented] += np.where(positive, 0.05, -0.1)
+    scores[collaborative, comp_index["team_collaboration"]] += 0.05
+    scores[toxic, comp_index["team_collaboration"]] -= 0.1
+    scores = np.round(np.clip(scores, 0.0, 1.0), 2)
+    
+    strengths = np.empty(num_reviews, dtype=object)
+    development_areas = np.empty(num_reviews, dtype=object)
+    for level in ORG_LEVEL_ROLES:
+        rows = owner_levels == level
+        # High performers get the top strengths, as in the 8-person sample
+        strength_pool = np.array(STRENGTHS_POOL[level], dtype=object)
+        pool_size = np.where(owner_base[rows] > 0.8, 2, len(strength_pool))
+        strengths[rows] = strength_pool[(strength_draw[rows] * pool_size).astype(np.int64)]
+        development_pool = np.array(DEVELOPMENT_POOL[level], dtype=object)
+        development_areas[rows] = development_pool[(development_draw[rows] * len(development_pool)).astype(np.int64)]
+    
+    reviews = pd.DataFrame({
+        "employee_name": names[owner],
+        "employee_role": org["employee_role"].to_numpy()[owner],
+        "employee_level": owner_levels,
+        "years_experience": org["years_experience"].to_numpy()[owner],
+        "team_size": org["team_size"].to_numpy()[owner],
+        "reviewer_type": np.array(REVIEWER_TYPES, dtype=object)[reviewer],
+        "review_date": as_of - pd.to_timedelta(days_ago, unit="D"),
+        "review_text": review_texts
+    })
+    for comp, column in zip(competencies, scores.T):
+        reviews[f"{comp}_score"] = column
+    reviews["strengths"] = strengths
+    reviews["development_areas"] = development_areas
+    reviews["overall_rating"] = np.round(scores.mean(axis=1), 2)
+    return owner, reviews
+
+
+def generate_org_reviews(org: pd.DataFrame, start: int = 0, stop: int = None, seed: int = 0,
+                         reviews_per_employee: float = None, as_of: str = "2025-01-01") -> pd.DataFrame:
+    """Generate 360-degree reviews for employees start..stop of a synthetic organization
+    
+    Scores are drawn per review from the employee's base performance, a
+    per-competency profile, reviewer leniency and the tone of the generated text.
+    Employees are generated in blocks with their own random streams, so a range
+    always gets the same rows for a seed, whoever generates it.
+    """
+    stop = len(org) if stop is None else min(stop, len(org))
+    templates = initialize_review_templates()
+    batches = []
+    for block_start in range(start - start % _ORG_BLOCK_SIZE, stop, _ORG_BLOCK_SIZE):
+        owner, reviews = _generate_block_reviews(
+            org, block_start, seed, reviews_per_employee, pd.Timestamp(as_of), templates
+        )
+        batches.append(reviews[(owner >= start) & (owner < stop)])
+    return pd.concat(batches, ignore_index=True)
+
+
+def generate_synthetic_review_data(num_employees: int, reviews_per_employee: float = None,
+                                   seed: int = 0) -> pd.DataFrame:
+    """Generate reproducible 360-degree review data for a synthetic organization of any size"""
+    org = generate_org_structure(num_employees, seed)
+    return generate_org_reviews(org, seed=seed, reviews_per_employee=reviews_per_employee)
+
+
+_shard_org = None
+
+
+def _init_shard_worker(org: pd.DataFrame):
+    """Receive the organization once per worker process"""
+    global _shard_org
+    _shard_org = org
+
+
+def _write_review_shard(path: str, start: int, stop: int, seed: int, reviews_per_employee: float,
+                        file_format: str) -> str:
+    """Generate and write the reviews of one shard of employees"""
+    reviews = generate_org_reviews(_shard_org, start, stop, seed, reviews_per_employee)
+    if file_format == "parquet":
+        reviews.to_parquet(path, index=False)
+    else:
+        reviews.to_csv(path, index=False)
+    return path
+
+
+def write_synthetic_review_shards(output_dir: str, num_employees: int, num_shards: int = 8,
+                                  reviews_per_employee: float = None, seed: int = 0,
+                                  n_workers: int = None, file_format: str = "csv") -> List[str]:
+    """Generate a synthetic organization and write its reviews as shard files in parallel
+    
+    Shards hold whole blocks of 1000 employees, so small organizations get fewer
+    shards than requested. Together they contain exactly the rows of
+    generate_synthetic_review_data for the same arguments, whatever the number of
+    shards or workers.
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+    
+    if file_format not in ("csv", "parquet"):
+        raise ValueError(f"Unsupported file format: {file_format}")
+    os.makedirs(output_dir, exist_ok=True)
+    org = generate_org_structure(num_employees, seed)
+    
+    # Shard boundaries fall on generation blocks so no block is drawn twice
+    num_blocks = -(-num_employees // _ORG_BLOCK_SIZE)
+    block_bounds = np.linspace(0, num_blocks, min(num_shards, num_blocks) + 1).round().astype(int)
+    bounds = np.minimum(block_bounds * _ORG_BLOCK_SIZE, num_employees)
+    tasks = [
+        (os.path.join(output_dir, f"reviews-{shard:05d}.{file_format}"), int(start), int(stop),
+         seed, reviews_per_employee, file_format)
+        for shard, (start, stop) in enumerate(zip(bounds[:-1], bounds[1:]))
+    ]
+    
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_shard_worker, initargs=(org,)) as pool:
+        return list(pool.map(_write_review_shard, *zip(*tasks)))
+
 if __name__ == "__main__":
     df = generate_360_review_data()
     df.to_csv("360_reviews_sample.csv", index=False)
@@ -1,12 +1,15 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import numpy as np
-from sample_data import generate_360_review_data
-from succession_planning import SuccessionPlanningAnalyzer
-from team_dynamics import TeamDynamicsAnalyzer
+from analysis_core import (
+    READINESS_LEVELS, SuccessionPlanningAnalyzer, TeamDynamicsAnalyzer, compact_reviews, dataset_fingerprint,
+    first_name_aliases, stream_reviews_csv
+)
+from precompute import PrecomputeJob
+import instrumentation
+from instrumentation import span, traced
+
+# Plotly and the sample-data generator are imported on first use to keep cold start fast
 
 # Page config
 st.set_page_config(
@@ -71,37 +74,136 @@ st.markdown("""
         font-style: italic;
         color: #000000;
     }
+    .ci-track {
+        position: relative;
+        height: 6px;
+        background-color: #e1e5eb;
+        border-radius: 3px;
+        margin: 0.2rem 0 0.4rem 0;
+    }
+    .ci-range {
+        position: absolute;
+        height: 100%;
+        background-color: #9ecae1;
+        border-radius: 3px;
+    }
+    .ci-point {
+        position: absolute;
+        width: 3px;
+        height: 10px;
+        top: -2px;
+        background-color: #1f77b4;
+    }
 </style>
 """, unsafe_allow_html=True)
 
 @st.cache_data
 def load_sample_data():
     """Load and cache sample 360-degree review data"""
-    return generate_360_review_data()
+    from sample_data import generate_360_review_data
+    
+    return compact_reviews(generate_360_review_data())
 
-def load_csv_data(csv_file):
-    """Load CSV data from uploaded file"""
+@traced()
+def load_csv_data(csv_file, streaming=False):
+    """Load CSV data from uploaded file
+    
+    In streaming mode the file is ingested in chunks into on-disk storage and
+    analyzers built from per-employee aggregates are returned instead of a DataFrame.
+    """
+    if streaming:
+        return stream_reviews_csv(csv_file)
     df = pd.read_csv(csv_file)
     # Convert review_date to datetime if it exists
     if 'review_date' in df.columns:
         df['review_date'] = pd.to_datetime(df['review_date'])
-    return df
+    # Keep the session's resident copy compact with categorical strings
+    return compact_reviews(df)
 
-@st.cache_data
-def get_succession_analyzer(reviews_df):
-    """Create and cache succession planning analyzer"""
-    return SuccessionPlanningAnalyzer(reviews_df)
+# Analyzers are shared resources keyed by the fingerprint taken once when the data is
+# loaded, so reruns neither hash the reviews frame nor pickle the analyzers
+@st.cache_resource(max_entries=4)
+def get_succession_analyzer(data_fingerprint, _reviews_df):
+    """Create and cache the succession planning analyzer for a dataset"""
+    return SuccessionPlanningAnalyzer(_reviews_df)
+
+@st.cache_resource(max_entries=4)
+def get_dynamics_analyzer(data_fingerprint, _reviews_df):
+    """Create and cache the team dynamics analyzer for a dataset"""
+    # Reviews often mention colleagues by first name only
+    return TeamDynamicsAnalyzer(
+        _reviews_df, name_aliases=first_name_aliases(_reviews_df['employee_name'].dropna().unique())
+    )
 
+def get_current_succession_analyzer():
+    """Get the succession analyzer for the current dataset and score aggregation"""
+    if 'streamed_reviews' in st.session_state:
+        analyzer = st.session_state.streamed_reviews.succession_analyzer
+    else:
+        reviews_df = get_current_data()
+        analyzer = get_succession_analyzer(st.session_state.data_fingerprint, reviews_df)
+    
+    # The shared analyzer is never reconfigured; a session-local copy aggregates differently
+    reviewer_weights, calibrate_leniency = st.session_state.get('score_aggregation', (None, False))
+    if reviewer_weights is not None or calibrate_leniency:
+        analyzer = analyzer.with_score_aggregation(reviewer_weights, calibrate_leniency)
+    return analyzer
+
+def get_current_dynamics_analyzer():
+    """Get the team dynamics analyzer for the current dataset"""
+    if 'streamed_reviews' in st.session_state:
+        return st.session_state.streamed_reviews.dynamics_analyzer
+    reviews_df = get_current_data()
+    return get_dynamics_analyzer(st.session_state.data_fingerprint, reviews_df)
+
+def clear_streamed_reviews():
+    """Drop a previously streamed dataset and its on-disk review store"""
+    streamed = st.session_state.pop('streamed_reviews', None)
+    if streamed is not None:
+        cancel_precompute()
+        streamed.review_store.close()
+
+def start_precompute():
+    """Warm every page's results for the current dataset on a background thread"""
+    cancel_precompute()
+    st.session_state.precompute_job = PrecomputeJob(
+        get_current_succession_analyzer(), get_current_dynamics_analyzer()
+    ).start()
+
+def cancel_precompute():
+    """Stop the background precomputation for a dataset that is being replaced"""
+    job = st.session_state.pop('precompute_job', None)
+    if job is not None:
+        job.cancel()
+
+def display_precompute_status():
+    """Show background precomputation progress"""
+    job = st.session_state.get('precompute_job')
+    if job is None:
+        return
+    if job.running:
+        st.progress(job.progress, text=f"⏳ Preparing results: {job.current_step} ({job.steps_done}/{job.total_steps})")
+    elif job.error is not None:
+        st.caption(f"⚠️ Background precomputation failed: {job.error}")
+    else:
+        st.caption("✅ All results are ready")
+
+# Poll the progress without rerunning the page where fragments exist (Streamlit 1.37+)
+if hasattr(st, 'fragment'):
+    display_precompute_status = st.fragment(run_every=1.0)(display_precompute_status)
+
+@traced()
 def display_employee_radar_chart(analyzer, employee_name):
     """Display radar chart for employee competencies"""
-    employee_scores = analyzer.calculate_employee_scores()
-    employee_data = employee_scores[employee_scores['name'] == employee_name]
+    import plotly.graph_objects as go
+    
+    employee_data = analyzer.get_employee_scores(employee_name)
     
-    if len(employee_data) == 0:
+    if employee_data is None:
         return
     
     competencies = [comp.replace('_', ' ').title() for comp in analyzer.competencies]
-    scores = [employee_data.iloc[0][comp] for comp in analyzer.competencies]
+    scores = [employee_data[comp] for comp in analyzer.competencies]
     
     fig = go.Figure()
     
@@ -126,20 +228,131 @@ def display_employee_radar_chart(analyzer, employee_name):
     
     return fig
 
-def display_succession_candidates():
+def display_aggregation_controls():
+    """Sidebar controls for how reviews are aggregated into employee scores"""
+    reviews_df = get_current_data()
+    reviewer_weights = None
+    if 'reviewer_type' in reviews_df.columns:
+        if st.checkbox("Weight reviews by reviewer type", key="aggregation_weighted"):
+            reviewer_types = sorted(reviews_df['reviewer_type'].dropna().astype(str).unique())
+            reviewer_weights = {
+                reviewer_type: st.slider(
+                    reviewer_type, 0.0, 3.0, 1.0, 0.25, key=f"aggregation_weight_{reviewer_type}"
+                )
+                for reviewer_type in reviewer_types
+            }
+    calibrate_leniency = st.checkbox(
+        "Calibrate reviewer leniency", key="aggregation_calibrate",
+        help="Z-score each competency within reviewer type and review quarter before averaging, "
+             "so lenient or harsh reviewer groups don't skew the scores"
+    )
+    st.session_state.score_aggregation = (reviewer_weights, calibrate_leniency)
+
+def reset_what_if():
+    """Return every what-if control to the analyzer's configured value"""
+    for key in [key for key in st.session_state if str(key).startswith("what_if_")]:
+        del st.session_state[key]
+
+def display_what_if_controls(analyzer):
+    """Sidebar controls for succession weights, role requirements, bonus caps and readiness thresholds
+    
+    Returns the scoring overrides that differ from the analyzer's configuration
+    (empty when nothing is changed), the role requirements (None when unchanged)
+    and the two readiness thresholds.
+    """
+    st.caption("Re-rank candidates live. Changes apply to this session only.")
+    
+    # Every level's sliders are rendered in tabs so their values survive switching tabs
+    role_weights = {}
+    role_requirements = {}
+    tabs = st.tabs(list(analyzer.role_weights))
+    for tab, (level, weights) in zip(tabs, analyzer.role_weights.items()):
+        with tab:
+            role_weights[level] = {}
+            for comp in analyzer.competencies:
+                weight = st.slider(
+                    comp.replace('_', ' ').title(), 0.0, 0.5, float(weights.get(comp, 0.0)), 0.05,
+                    key=f"what_if_{level}_{comp}"
+                )
+                if weight:
+                    role_weights[level][comp] = weight
+            st.caption(f"Weights sum to {sum(role_weights[level].values()):.2f}")
+            
+            if level in analyzer.role_requirements:
+                st.markdown("**Minimum scores** (bench strength)")
+                role_requirements[level] = {
+                    comp: st.slider(
+                        comp.replace('_', ' ').title(), 0.0, 1.0, float(required_score), 0.05,
+                        key=f"what_if_req_{level}_{comp}"
+                    )
+                    for comp, required_score in analyzer.role_requirements[level].items()
+                }
+    # Levels without sliders keep their configured requirements
+    role_requirements = {**analyzer.role_requirements, **role_requirements}
+    
+    experience_bonus_cap = st.slider(
+        "Experience bonus cap", 0.0, 0.3, float(analyzer.experience_bonus_cap), 0.01,
+        key="what_if_experience_bonus_cap", help="1% per year of experience, up to this cap"
+    )
+    team_bonus_cap = st.slider(
+        "Team size bonus cap (VP and Director roles)", 0.0, 0.3, float(analyzer.team_bonus_cap), 0.01,
+        key="what_if_team_bonus_cap", help="1% per team member, up to this cap"
+    )
+    ready_now_gap = st.slider(
+        "Ready now: largest gap at most", 0.0, 0.3, 0.0, 0.01, key="what_if_ready_now_gap"
+    )
+    one_cycle_gap = st.slider(
+        "Ready in one cycle: largest gap at most", 0.0, 0.5, float(analyzer.high_priority_gap), 0.01,
+        key="what_if_one_cycle_gap"
+    )
+    st.button("Reset to defaults", on_click=reset_what_if)
+    
+    # Compare with the configuration so unchanged settings use the cached rankings
+    configured_weights = {
+        level: {comp: float(weight) for comp, weight in weights.items() if weight}
+        for level, weights in analyzer.role_weights.items()
+    }
+    scoring = {}
+    if role_weights != configured_weights:
+        scoring['role_weights'] = role_weights
+    if experience_bonus_cap != analyzer.experience_bonus_cap:
+        scoring['experience_bonus_cap'] = experience_bonus_cap
+    if team_bonus_cap != analyzer.team_bonus_cap:
+        scoring['team_bonus_cap'] = team_bonus_cap
+    
+    return {
+        'scoring': scoring,
+        'role_requirements': role_requirements if role_requirements != analyzer.role_requirements else None,
+        'ready_now_gap': ready_now_gap,
+        'one_cycle_gap': max(one_cycle_gap, ready_now_gap),
+    }
+
+@traced()
+def display_succession_candidates(what_if):
     """Display succession planning candidates"""
     st.header("🎯 Succession Planning Dashboard")
     
-    reviews_df = get_current_data()
-    analyzer = get_succession_analyzer(reviews_df)
+    analyzer = get_current_succession_analyzer()
     
-    # Get succession candidates
-    succession_candidates = analyzer.identify_succession_candidates()
+    # Get succession candidates, re-ranked from the resident competency matrix under what-if scoring
+    if what_if['scoring']:
+        st.info("🎛️ What-if scoring is active. Reset it in the sidebar to return to the configured weights.")
+        succession_candidates = analyzer.rank_succession_candidates(**what_if['scoring'])
+    else:
+        succession_candidates = analyzer.identify_succession_candidates()
     
     if not succession_candidates:
         st.warning("No succession candidates identified.")
         return
     
+    # Bootstrap intervals follow the configured role weights, so succession score intervals
+    # are only shown while no what-if weights are applied
+    intervals = analyzer.calculate_score_intervals()
+    if what_if['scoring']:
+        st.caption("Confidence intervals are shown for overall scores only while what-if scoring is active.")
+    else:
+        st.caption("Ranges are 95% bootstrap confidence intervals over each employee's reviews.")
+    
     # Display current leadership and candidates
     for target_role, data in succession_candidates.items():
         st.subheader(f"Succession Planning for {target_role}")
@@ -165,27 +378,114 @@ def display_succession_candidates():
             for i, candidate in enumerate(data['candidates'][:3]):
                 rank_emoji = ["🥇", "🥈", "🥉"][i]
                 
+                name = candidate['name']
+                succession_low = succession_high = np.nan
+                if not what_if['scoring'] and target_role in intervals['succession_score_low'].columns:
+                    succession_low = intervals['succession_score_low'].at[name, target_role]
+                    succession_high = intervals['succession_score_high'].at[name, target_role]
+                succession_line = score_with_interval(
+                    "Succession Score", candidate['succession_score'], succession_low, succession_high
+                )
+                overall_line = score_with_interval(
+                    "Overall Performance", candidate['overall_score'],
+                    intervals['overall_score'].at[name, 'low'], intervals['overall_score'].at[name, 'high']
+                )
+                
                 st.markdown(f"""
                 <div class="candidate-card">
-                    {rank_emoji} <strong>{candidate['name']}</strong><br>
+                    {rank_emoji} <strong>{name}</strong><br>
                     {candidate['role']} | {candidate['level']}<br>
-                    Succession Score: {candidate['succession_score']:.2f}<br>
-                    Overall Performance: {candidate['overall_score']:.2f}<br>
+                    {succession_line}
+                    {overall_line}
                     Experience: {candidate['years_experience']} years
                 </div>
                 """, unsafe_allow_html=True)
         
         st.markdown("---")
+    
+    display_bench_strength(analyzer, what_if)
+
+def score_with_interval(label, score, low, high):
+    """Score line with its confidence interval as text and as an error bar on a 0-1 track"""
+    if pd.isna(low) or pd.isna(high):
+        return f"{label}: {score:.2f}<br>"
+    # Bonuses can push succession scores slightly past 1, so the track is clipped
+    left, right, point = (min(max(value, 0.0), 1.0) * 100 for value in (low, high, score))
+    return f"""{label}: {score:.2f} <small>(95% CI {low:.2f}–{high:.2f})</small>
+    <div class="ci-track">
+        <div class="ci-range" style="left: {left:.1f}%; width: {right - left:.1f}%;"></div>
+        <div class="ci-point" style="left: {point:.1f}%;"></div>
+    </div>"""
+
+@traced()
+def display_bench_strength(analyzer, what_if):
+    """Display ready-now / one-cycle / not-ready candidate counts for every target role"""
+    import plotly.express as px
+    
+    st.subheader("🪑 Bench Strength")
+    st.caption(
+        "Candidates are classified by their largest gap against the target role's requirements. "
+        "Adjust the thresholds under What-if Scoring in the sidebar to see how the bench changes."
+    )
+    
+    bench = analyzer.assess_bench_strength(
+        ready_now_gap=what_if['ready_now_gap'], one_cycle_gap=what_if['one_cycle_gap'],
+        role_requirements=what_if['role_requirements'], **what_if['scoring']
+    )
+    summary, candidates = bench['summary'], bench['candidates']
+    
+    with span("display_bench_strength.bar_figure", rows=len(summary)):
+        fig = px.bar(
+            summary,
+            x='target_role',
+            y=READINESS_LEVELS,
+            color_discrete_sequence=["#2ca02c", "#ff7f0e", "#d62728"],
+            labels={'target_role': "Target Role", 'value': "Candidates", 'variable': "Readiness"},
+            title="Succession Bench by Readiness"
+        )
+        fig.update_layout(height=400)
+    st.plotly_chart(fig, use_container_width=True)
+    st.dataframe(summary, use_container_width=True, hide_index=True)
+    
+    # Drill down into one role's candidates
+    col1, col2 = st.columns(2)
+    with col1:
+        drill_role = st.selectbox("Drill down into role:", list(summary['target_role']), key="bench_role")
+    with col2:
+        drill_levels = st.multiselect(
+            "Readiness:", READINESS_LEVELS, default=READINESS_LEVELS[:2], key="bench_readiness"
+        )
+    drill_down = candidates[
+        (candidates['target_role'] == drill_role) & candidates['readiness'].isin(drill_levels)
+    ]
+    st.dataframe(drill_down.round(3), use_container_width=True, hide_index=True)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            "Export bench summary (CSV)",
+            summary.to_csv(index=False),
+            file_name="bench_strength_summary.csv",
+            mime="text/csv"
+        )
+    with col2:
+        # Only the drill-down is serialized, so large benches don't slow every slider change
+        st.download_button(
+            "Export drill-down (CSV)",
+            drill_down.to_csv(index=False),
+            file_name=f"bench_strength_{drill_role.replace(' ', '_').lower()}.csv",
+            mime="text/csv"
+        )
 
+@traced()
 def display_development_plans():
     """Display personalized development plans"""
     st.header("📈 Personalized Development Plans")
     
-    reviews_df = get_current_data()
-    analyzer = get_succession_analyzer(reviews_df)
+    analyzer = get_current_succession_analyzer()
     
     # Employee selection
-    employees = reviews_df['employee_name'].unique()
+    employees = analyzer.calculate_employee_scores()['name']
     selected_employee = st.selectbox("Select Employee for Development Plan:", employees)
     
     if selected_employee:
@@ -234,12 +534,14 @@ def display_development_plans():
                 </div>
                 """, unsafe_allow_html=True)
 
+@traced()
 def display_team_analytics():
     """Display team-level analytics and insights"""
+    import plotly.express as px
+    
     st.header("📊 Team Analytics & Insights")
     
-    reviews_df = get_current_data()
-    analyzer = get_succession_analyzer(reviews_df)
+    analyzer = get_current_succession_analyzer()
     employee_scores = analyzer.calculate_employee_scores()
     
     col1, col2, col3 = st.columns(3)
@@ -259,32 +561,33 @@ def display_team_analytics():
     # Team competency heatmap
     st.markdown("### Team Competency Heatmap")
     
-    # Prepare data for heatmap
-    heatmap_data = []
-    for _, employee in employee_scores.iterrows():
-        for comp in analyzer.competencies:
-            heatmap_data.append({
-                'Employee': employee['name'],
-                'Competency': comp.replace('_', ' ').title(),
-                'Score': employee[comp]
-            })
-    
-    heatmap_df = pd.DataFrame(heatmap_data)
-    pivot_df = heatmap_df.pivot(index='Employee', columns='Competency', values='Score')
-    
-    fig = px.imshow(
-        pivot_df,
-        labels=dict(x="Competency", y="Employee", color="Score"),
-        x=pivot_df.columns,
-        y=pivot_df.index,
-        color_continuous_scale="RdYlBu_r",
-        aspect="auto"
-    )
-    
-    fig.update_layout(
-        title="Team Competency Scores",
-        height=400
-    )
+    with span("display_team_analytics.heatmap_figure", rows=len(employee_scores)):
+        # Prepare data for heatmap
+        heatmap_data = []
+        for _, employee in employee_scores.iterrows():
+            for comp in analyzer.competencies:
+                heatmap_data.append({
+                    'Employee': employee['name'],
+                    'Competency': comp.replace('_', ' ').title(),
+                    'Score': employee[comp]
+                })
+        
+        heatmap_df = pd.DataFrame(heatmap_data)
+        pivot_df = heatmap_df.pivot(index='Employee', columns='Competency', values='Score')
+        
+        fig = px.imshow(
+            pivot_df,
+            labels=dict(x="Competency", y="Employee", color="Score"),
+            x=pivot_df.columns,
+            y=pivot_df.index,
+            color_continuous_scale="RdYlBu_r",
+            aspect="auto"
+        )
+        
+        fig.update_layout(
+            title="Team Competency Scores",
+            height=400
+        )
     
     st.plotly_chart(fig, use_container_width=True)
     
@@ -294,32 +597,34 @@ def display_team_analytics():
     col1, col2 = st.columns(2)
     
     with col1:
-        fig_hist = px.histogram(
-            employee_scores, 
-            x='overall_score', 
-            nbins=10,
-            title="Overall Score Distribution"
-        )
+        with span("display_team_analytics.histogram_figure", rows=len(employee_scores)):
+            fig_hist = px.histogram(
+                employee_scores, 
+                x='overall_score', 
+                nbins=10,
+                title="Overall Score Distribution"
+            )
         st.plotly_chart(fig_hist, use_container_width=True)
     
     with col2:
-        fig_scatter = px.scatter(
-            employee_scores,
-            x='years_experience',
-            y='overall_score',
-            size='team_size',
-            color='level',
-            hover_name='name',
-            title="Experience vs Performance"
-        )
+        with span("display_team_analytics.scatter_figure", rows=len(employee_scores)):
+            fig_scatter = px.scatter(
+                employee_scores,
+                x='years_experience',
+                y='overall_score',
+                size='team_size',
+                color='level',
+                hover_name='name',
+                title="Experience vs Performance"
+            )
         st.plotly_chart(fig_scatter, use_container_width=True)
 
+@traced()
 def display_team_dynamics():
     """Display team dynamics analysis including toxic behavior detection"""
     st.header("🤝 Team Dynamics Analysis")
     
-    reviews_df = get_current_data()
-    dynamics_analyzer = TeamDynamicsAnalyzer(reviews_df)
+    dynamics_analyzer = get_current_dynamics_analyzer()
     
     # Generate team health report
     health_report = dynamics_analyzer.generate_team_health_report()
@@ -477,15 +782,15 @@ def display_team_dynamics():
             for edge in negative_edges[:3]:  # Show first 3
                 st.markdown(f"• {edge['from']} → {edge['to']}: *{edge['context']}*")
 
+@traced()
 def display_enhanced_development_plans():
     """Display enhanced development plans with review text analysis"""
     st.header("📈 Enhanced Development Plans")
     
-    reviews_df = get_current_data()
-    analyzer = get_succession_analyzer(reviews_df)
+    analyzer = get_current_succession_analyzer()
     
     # Employee selection
-    employees = reviews_df['employee_name'].unique()
+    employees = analyzer.calculate_employee_scores()['name']
     selected_employee = st.selectbox("Select Employee for Development Plan:", employees)
     
     if selected_employee:
@@ -510,7 +815,7 @@ def display_enhanced_development_plans():
         # Show original review texts
         st.markdown("### 📝 Original Review Texts")
         
-        employee_reviews = reviews_df[reviews_df['employee_name'] == selected_employee]
+        employee_reviews = analyzer.get_employee_reviews(selected_employee)
         
         for _, review in employee_reviews.iterrows():
             # Handle date formatting safely
@@ -555,12 +860,42 @@ def display_enhanced_development_plans():
                 </div>
                 """, unsafe_allow_html=True)
 
+def display_diagnostics(recorder):
+    """Display the per-stage timings this session's recorder collected"""
+    summary = instrumentation.summarize(recorder=recorder)
+    if not summary:
+        if instrumentation.is_enabled():
+            st.caption("No timings recorded yet.")
+        return
+    
+    summary_df = pd.DataFrame(summary)[['name', 'calls', 'total_ms', 'mean_ms', 'max_ms', 'rows', 'rows_per_s']]
+    st.dataframe(summary_df.round(2), use_container_width=True, hide_index=True)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            "Export trace",
+            instrumentation.export_trace(recorder=recorder),
+            file_name="succession_trace.json",
+            mime="application/json",
+            help="Chrome trace format, viewable in chrome://tracing or ui.perfetto.dev"
+        )
+    with col2:
+        if st.button("Clear timings"):
+            recorder.clear()
+            st.rerun()
+
+def set_current_data(reviews_df, data_source):
+    """Make reviews_df the session's dataset, fingerprinting it once"""
+    st.session_state.current_data = reviews_df
+    st.session_state.data_source = data_source
+    st.session_state.data_fingerprint = dataset_fingerprint(reviews_df)
+
 def get_current_data():
     """Get current dataset from session state or sample data"""
-    if 'current_data' in st.session_state:
-        return st.session_state.current_data
-    else:
-        return load_sample_data()
+    if 'current_data' not in st.session_state:
+        set_current_data(load_sample_data(), "sample")
+    return st.session_state.current_data
 
 def main():
     """Main application"""
@@ -577,8 +912,29 @@ def main():
         ["Succession Planning", "Development Plans", "Team Dynamics", "Team Analytics", "Raw Data"]
     )
     
+    with st.sidebar:
+        display_precompute_status()
+    
+    # Diagnostics are switched on before the page runs and summarized after it. Each session
+    # records into its own recorder, set for this script run only, so sessions never share spans
+    if 'timing_recorder' not in st.session_state:
+        st.session_state.timing_recorder = instrumentation.Recorder()
+    diagnostics = st.sidebar.expander("⏱️ Diagnostics")
+    with diagnostics:
+        if st.checkbox("Record stage timings", key="record_timings"):
+            instrumentation.enable(st.session_state.timing_recorder)
+        else:
+            instrumentation.disable()
+    
+    # Sidebar settings are rendered on every page so they survive page switches
+    with st.sidebar.expander("⚖️ Score Aggregation"):
+        display_aggregation_controls()
+    
+    with st.sidebar.expander("🎛️ What-if Scoring"):
+        what_if = display_what_if_controls(get_current_succession_analyzer())
+    
     if page == "Succession Planning":
-        display_succession_candidates()
+        display_succession_candidates(what_if)
     elif page == "Development Plans":
         display_enhanced_development_plans()
     elif page == "Team Dynamics":
@@ -596,46 +952,83 @@ def main():
             key="csv_uploader"
         )
         
+        streaming = st.checkbox(
+            "Stream large file (bounded memory)",
+            help="Ingest the CSV in chunks, keeping only per-employee aggregates in memory and raw reviews on disk"
+        )
+        
         # Load data from uploaded file or use sample data
         if uploaded_file is not None:
             try:
-                reviews_df = load_csv_data(uploaded_file)
-                st.session_state.current_data = reviews_df
-                st.session_state.data_source = "uploaded"
-                st.success(f"✅ Successfully loaded {len(reviews_df)} records from uploaded file")
+                # Parse and fingerprint a given upload only once, not on every rerun
+                upload_key = (uploaded_file.name, uploaded_file.size)
+                if streaming:
+                    if st.session_state.get('streamed_upload') != upload_key:
+                        clear_streamed_reviews()
+                        st.session_state.pop('loaded_upload', None)
+                        streamed = load_csv_data(uploaded_file, streaming=True)
+                        st.session_state.streamed_reviews = streamed
+                        st.session_state.streamed_upload = upload_key
+                        set_current_data(streamed.review_store.head(), "streamed")
+                        start_precompute()
+                    reviews_df = st.session_state.current_data
+                    st.success(f"✅ Successfully streamed {st.session_state.streamed_reviews.num_reviews} records from uploaded file")
+                else:
+                    if st.session_state.get('loaded_upload') != upload_key:
+                        clear_streamed_reviews()
+                        st.session_state.pop('streamed_upload', None)
+                        set_current_data(load_csv_data(uploaded_file), "uploaded")
+                        st.session_state.loaded_upload = upload_key
+                        start_precompute()
+                    reviews_df = st.session_state.current_data
+                    st.success(f"✅ Successfully loaded {len(reviews_df)} records from uploaded file")
             except Exception as e:
                 st.error(f"❌ Error loading CSV file: {str(e)}")
                 st.info("Using sample data instead...")
+                cancel_precompute()
+                clear_streamed_reviews()
+                st.session_state.pop('streamed_upload', None)
+                st.session_state.pop('loaded_upload', None)
                 reviews_df = load_sample_data()
-                st.session_state.current_data = reviews_df
-                st.session_state.data_source = "sample"
+                set_current_data(reviews_df, "sample")
         else:
             # If no file uploaded, use current data or sample data
             if 'current_data' in st.session_state:
                 reviews_df = st.session_state.current_data
-                if st.session_state.get('data_source') == 'uploaded':
+                if st.session_state.get('data_source') in ('uploaded', 'streamed'):
                     st.info("📁 Using previously uploaded data. Upload a new file to replace it.")
                 else:
                     st.info("📁 Showing sample data. Upload your own CSV file above to use custom data.")
             else:
                 reviews_df = load_sample_data()
-                st.session_state.current_data = reviews_df
-                st.session_state.data_source = "sample"
+                set_current_data(reviews_df, "sample")
                 st.info("📁 Showing sample data. Upload your own CSV file above to use custom data.")
         
         # Display the data table
+        if st.session_state.get('data_source') == 'streamed':
+            st.caption(f"Showing the first {len(reviews_df)} streamed reviews")
         st.dataframe(reviews_df, use_container_width=True)
         
-        # Data summary
+        # Data summary; streamed data is summarized from its aggregates
+        if 'streamed_reviews' in st.session_state:
+            total_reviews = st.session_state.streamed_reviews.num_reviews
+            num_employees = len(get_current_succession_analyzer().calculate_employee_scores())
+        else:
+            total_reviews = len(reviews_df)
+            num_employees = reviews_df['employee_name'].nunique()
+        
         st.markdown("### Data Summary")
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.metric("Total Reviews", len(reviews_df))
+            st.metric("Total Reviews", total_reviews)
         with col2:
-            st.metric("Employees", reviews_df['employee_name'].nunique())
+            st.metric("Employees", num_employees)
         with col3:
-            st.metric("Avg Reviews per Employee", f"{len(reviews_df) / reviews_df['employee_name'].nunique():.1f}")
+            st.metric("Avg Reviews per Employee", f"{total_reviews / num_employees:.1f}")
+    
+    with diagnostics:
+        display_diagnostics(st.session_state.timing_recorder)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,211 @@
+"""Headless batch run of the full succession and team dynamics analysis
+
+Loads a reviews file, computes succession candidates, development plans for every
+employee and the team health report, and writes them as JSON or Parquet. Only the
+analysis modules are imported, never Streamlit or Plotly.
+
+Usage:
+    python succession_batch.py reviews.csv --output-dir results --format parquet --workers 8
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+import instrumentation
+from analysis_core import (
+    SuccessionPlanningAnalyzer, TeamDynamicsAnalyzer, compact_reviews, first_name_aliases, stream_reviews_csv
+)
+
+
+def load_reviews(path: str) -> pd.DataFrame:
+    """Load a reviews CSV or Parquet file into a compact frame"""
+    if path.endswith('.parquet'):
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path)
+    if 'review_date' in df.columns:
+        df['review_date'] = pd.to_datetime(df['review_date'])
+    return compact_reviews(df)
+
+
+def generate_all_development_plans(succession_analyzer: SuccessionPlanningAnalyzer) -> Dict[str, pd.DataFrame]:
+    """Generate development plans for every employee as columnar tables"""
+    return succession_analyzer.generate_development_plans()
+
+
+def development_plan_records(development_plans: Dict[str, pd.DataFrame]) -> List[Dict]:
+    """Nest the columnar plans into one dict per employee, shaped like generate_development_plan"""
+    gaps_by_employee = {}
+    for gap in development_plans['gaps'].to_dict('records'):
+        gaps_by_employee.setdefault(gap.pop('employee_name'), {})[gap.pop('competency')] = gap
+    actions_by_employee = {}
+    for action in development_plans['actions'].to_dict('records'):
+        actions_by_employee.setdefault(action.pop('employee_name'), []).append(action)
+
+    plans = development_plans['plans']
+    score_columns = [col for col in plans.columns if col.endswith('_score')]
+    return [
+        {
+            'employee_name': plan['employee_name'],
+            'current_role': plan['current_role'],
+            'target_role': plan['target_role'],
+            'current_scores': {col[:-len('_score')]: plan[col] for col in score_columns},
+            'development_gaps': gaps_by_employee.get(plan['employee_name'], {}),
+            'development_actions': actions_by_employee.get(plan['employee_name'], []),
+            'strengths': plan['strengths'],
+            'development_areas': plan['development_areas'],
+            'timeline': plan['timeline'],
+        }
+        for plan in plans.to_dict('records')
+    ]
+
+
+def run_analysis(args: argparse.Namespace) -> Dict:
+    """Run every analysis and return the results keyed by output name"""
+    if args.stream:
+        streamed = stream_reviews_csv(
+            args.input, chunksize=args.chunk_rows, n_workers=args.workers, chunk_size=args.chunk_size
+        )
+        try:
+            succession_analyzer = streamed.succession_analyzer
+            return {
+                'succession_candidates': succession_analyzer.identify_succession_candidates(),
+                'development_plans': generate_all_development_plans(succession_analyzer),
+                'team_health_report': streamed.dynamics_analyzer.generate_team_health_report(),
+            }
+        finally:
+            streamed.review_store.close()
+
+    reviews_df = load_reviews(args.input)
+    succession_analyzer = SuccessionPlanningAnalyzer(reviews_df)
+    dynamics_analyzer = TeamDynamicsAnalyzer(
+        reviews_df, name_aliases=first_name_aliases(reviews_df['employee_name'].dropna().unique()),
+        n_workers=args.workers, chunk_size=args.chunk_size
+    )
+    return {
+        'succession_candidates': succession_analyzer.identify_succession_candidates(),
+        'development_plans': generate_all_development_plans(succession_analyzer),
+        'team_health_report': dynamics_analyzer.generate_team_health_report(),
+    }
+
+
+def _json_default(value):
+    """Convert numpy and pandas scalars for JSON output"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, (set, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def write_json(results: Dict, output_dir: str) -> List[str]:
+    """Write all results to a single JSON document"""
+    path = os.path.join(output_dir, 'analysis.json')
+    results = {**results, 'development_plans': development_plan_records(results['development_plans'])}
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2, default=_json_default)
+    return [path]
+
+
+def write_parquet(results: Dict, output_dir: str) -> List[str]:
+    """Write results as flat Parquet tables"""
+    candidates = pd.DataFrame([
+        {
+            'target_role': target_role,
+            'current_holder': info['current_holder']['name'],
+            'rank': rank,
+            **candidate
+        }
+        for target_role, info in results['succession_candidates'].items()
+        for rank, candidate in enumerate(info['candidates'], start=1)
+    ])
+
+    # The batch plan tables are already flat
+    development_plans = results['development_plans']['plans'].drop(columns=['current_level'])
+    development_actions = results['development_plans']['actions']
+
+    report = results['team_health_report']
+    team_health = pd.DataFrame([{
+        key: value for key, value in report.items() if key != 'tension_details'
+    }])
+    # Evidence is a list of sentences or a dict of examples per behavior, so store it as JSON
+    team_tensions = pd.DataFrame([
+        {**tension, 'evidence': json.dumps(tension['evidence'], default=_json_default)}
+        for tension in report['tension_details']
+    ])
+
+    paths = []
+    for name, table in [
+        ('succession_candidates', candidates),
+        ('development_plans', development_plans),
+        ('development_actions', development_actions),
+        ('team_health', team_health),
+        ('team_tensions', team_tensions),
+    ]:
+        path = os.path.join(output_dir, f"{name}.parquet")
+        table.to_parquet(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Run succession planning and team dynamics analysis without the Streamlit app"
+    )
+    parser.add_argument('input', help="Reviews file (.csv or .parquet)")
+    parser.add_argument('--output-dir', default='.', help="Directory for result files (default: current)")
+    parser.add_argument('--format', choices=['json', 'parquet'], default='json', help="Output format")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help="Worker processes for text analysis (default: all cores)")
+    parser.add_argument('--chunk-size', type=int, default=None,
+                        help="Employees per text analysis task (default: automatic)")
+    parser.add_argument('--stream', action='store_true',
+                        help="Stream a CSV in chunks with bounded memory instead of loading it whole")
+    parser.add_argument('--chunk-rows', type=int, default=50_000, help="Rows per chunk when streaming")
+    parser.add_argument('--trace', help="Write a Chrome trace of per-stage timings to this file "
+                                        "(work in worker processes appears as one span per stage)")
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.stream and args.input.endswith('.parquet'):
+        parser.error("--stream only supports CSV input")
+    if args.format == 'parquet':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            parser.error("Parquet output requires pyarrow (pip install pyarrow)")
+
+    if args.trace:
+        instrumentation.enable()
+
+    start = time.perf_counter()
+    results = run_analysis(args)
+    os.makedirs(args.output_dir, exist_ok=True)
+    writer = write_parquet if args.format == 'parquet' else write_json
+    paths = writer(results, args.output_dir)
+    if args.trace:
+        instrumentation.export_trace(args.trace)
+        paths.append(args.trace)
+
+    print(
+        f"Analyzed {len(results['development_plans']['plans'])} employees in {time.perf_counter() - start:.1f}s",
+        file=sys.stderr
+    )
+    for path in paths:
+        print(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
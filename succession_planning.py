@@ -1,12 +1,24 @@
+import copy
+import threading
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
-import streamlit as st
+from typing import Dict, Iterator, List, Tuple
+from aggregates import EmployeeRowIndex, EmployeeTotals
+from result_cache import ResultCache, cached_result, chain_fingerprint, dataset_fingerprint, default_cache
+from instrumentation import traced
+
+# Bench-strength readiness levels, in the order of their codes
+READINESS_LEVELS = ["Ready now", "Ready in one cycle", "Not ready"]
 
 class SuccessionPlanningAnalyzer:
     """Analyzes 360-degree reviews to identify succession candidates and create development plans"""
     
-    def __init__(self, reviews_df: pd.DataFrame):
+    def __init__(self, reviews_df: pd.DataFrame, cache: ResultCache = None, review_store=None):
+        self.cache = cache if cache is not None else default_cache
+        # Analyzers are shared across Streamlit sessions, so lazy state is built under a lock
+        self._state_lock = threading.RLock()
+        # With an on-disk review store, appended batches are not kept in memory
+        self.review_store = review_store
         self.reviews_df = reviews_df
         self.competencies = [
             "leadership", "strategic_thinking", "communication", "technical_skills",
@@ -15,157 +27,862 @@ class SuccessionPlanningAnalyzer:
         ]
         self.level_hierarchy = ["Graduate", "Professional", "Manager", "Director", "VP"]
         
-    def calculate_employee_scores(self) -> pd.DataFrame:
-        """Calculate aggregated scores for each employee"""
-        employee_scores = []
+        # Define role-specific competency weights
+        self.role_weights = {
+            "VP": {
+                "leadership": 0.25, "strategic_thinking": 0.25, "communication": 0.15,
+                "decision_making": 0.15, "mentoring": 0.1, "results_delivery": 0.1
+            },
+            "Director": {
+                "leadership": 0.2, "strategic_thinking": 0.2, "communication": 0.15,
+                "team_collaboration": 0.15, "problem_solving": 0.15, "results_delivery": 0.15
+            },
+            "Manager": {
+                "leadership": 0.2, "team_collaboration": 0.2, "communication": 0.15,
+                "mentoring": 0.15, "problem_solving": 0.15, "results_delivery": 0.15
+            }
+        }
         
-        for employee in self.reviews_df['employee_name'].unique():
-            emp_data = self.reviews_df[self.reviews_df['employee_name'] == employee]
-            
-            # Calculate average scores across all competencies
-            competency_scores = {}
-            for comp in self.competencies:
-                comp_col = f"{comp}_score"
-                if comp_col in emp_data.columns:
-                    competency_scores[comp] = emp_data[comp_col].mean()
-            
-            # Calculate overall performance score
-            overall_score = np.mean(list(competency_scores.values()))
-            
-            # Get employee metadata
-            emp_info = emp_data.iloc[0]
-            
-            employee_scores.append({
-                'name': employee,
-                'role': emp_info['employee_role'],
-                'level': emp_info['employee_level'],
-                'years_experience': emp_info['years_experience'],
-                'team_size': emp_info['team_size'],
-                'overall_score': overall_score,
-                'num_reviews': len(emp_data),
-                **competency_scores
-            })
-        
-        return pd.DataFrame(employee_scores)
-    
-    def identify_succession_candidates(self, target_roles: List[str] = None) -> Dict:
-        """Identify top succession candidates for leadership roles"""
-        employee_scores = self.calculate_employee_scores()
+        # Succession bonuses: 1% per year of experience up to the cap, and 1% per team member
+        # up to the cap for VP and Director roles
+        self.experience_bonus_cap = 0.1
+        self.team_bonus_cap = 0.05
+        
+        # Minimum competency scores needed for each target level
+        self.role_requirements = {
+            "VP": {"leadership": 0.85, "strategic_thinking": 0.85, "communication": 0.80},
+            "Director": {"leadership": 0.75, "strategic_thinking": 0.70, "communication": 0.75},
+            "Manager": {"leadership": 0.70, "team_collaboration": 0.75, "mentoring": 0.65}
+        }
+        
+        # Gaps above this are High priority and keep a candidate from being ready within one cycle
+        self.high_priority_gap = 0.15
+        
+        # Score aggregation: reviewer_weights maps reviewer types to weights (None weighs every
+        # review equally; unlisted types weigh 1.0), and calibrate_leniency z-scores each
+        # competency within reviewer type and review cycle (a review_date period) first
+        self.reviewer_weights = None
+        self.calibrate_leniency = False
+        self.review_cycle = "Q"
         
         # Define role progression paths - map to actual role names
-        succession_paths = {
+        self.succession_paths = {
             "VP Engineering": ["Director", "Manager"],
             "Director Product": ["Manager", "Professional"],
             "Director Engineering": ["Manager", "Professional"],
             "Senior Manager": ["Professional", "Graduate"]
         }
         
+    @property
+    def reviews_df(self) -> pd.DataFrame:
+        """360-degree review rows the analyzer works on
+        
+        Streamed reviews only live in the review store and are never loaded whole;
+        read them with iter_review_chunks() instead.
+        """
+        if self.review_store is not None and self._streamed_rows:
+            raise RuntimeError("Streamed reviews are not held in memory; read them with iter_review_chunks()")
+        if self._pending_batches:
+            self._reviews_df = pd.concat([self._reviews_df, *self._pending_batches], ignore_index=True)
+            self._pending_batches = []
+        return self._reviews_df
+    
+    @reviews_df.setter
+    def reviews_df(self, reviews_df: pd.DataFrame):
+        # Cached results are keyed by content, so new reviews never see stale results
+        self._reviews_df = reviews_df
+        self._pending_batches = []
+        self._streamed_rows = 0
+        self._score_totals = None
+        self._score_totals_cols = None
+        self.fingerprint = dataset_fingerprint(reviews_df)
+    
+    @traced(rows=lambda self, new_reviews_df: len(new_reviews_df))
+    def append_reviews(self, new_reviews_df: pd.DataFrame):
+        """Absorb a new batch of reviews, updating running score totals incrementally"""
+        if len(new_reviews_df) == 0:
+            return
+        self.fingerprint = chain_fingerprint(self.fingerprint, dataset_fingerprint(new_reviews_df))
+        if self.review_store is not None:
+            # The batch is already in the store; only the running totals keep it
+            self._get_score_totals()
+            self._add_to_score_totals(new_reviews_df)
+            self._streamed_rows += len(new_reviews_df)
+            return
+        self._pending_batches.append(new_reviews_df)
+        if self._score_totals is not None:
+            self._add_to_score_totals(new_reviews_df)
+    
+    def _get_score_totals(self) -> EmployeeTotals:
+        """Return running per-employee score sums and counts, building them on first use"""
+        with self._state_lock:
+            score_cols = self._score_columns(self._reviews_df)
+            if self._score_totals is None or self._score_totals_cols != score_cols:
+                self._score_totals_cols = score_cols
+                self._score_totals = EmployeeTotals(
+                    [f"{col}_sum" for col in score_cols] + [f"{col}_count" for col in score_cols] + ['num_reviews']
+                )
+                for chunk in self.iter_review_chunks():
+                    self._add_to_score_totals(chunk)
+            return self._score_totals
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_state_lock']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._state_lock = threading.RLock()
+    
+    def _add_to_score_totals(self, reviews_df: pd.DataFrame):
+        """Add one batch of reviews to the running score totals"""
+        scores = reviews_df[self._score_totals_cols].to_numpy(dtype=float)
+        self._add_reviews_to_totals(self._score_totals, reviews_df, scores)
+    
+    def _add_reviews_to_totals(self, totals: EmployeeTotals, reviews_df: pd.DataFrame, scores: np.ndarray,
+                               weights: np.ndarray = None):
+        """Add one batch of review scores to employee totals, optionally weighting each review"""
+        # Sums, counts and a review count are filled into one array in place, so no
+        # intermediate copies of the batch stay alive while the totals are added
+        num_cols = scores.shape[1]
+        values = np.empty((len(reviews_df), 2 * num_cols + 1))
+        sums, counts = values[:, :num_cols], values[:, num_cols:2 * num_cols]
+        missing = np.isnan(scores)
+        sums[:] = scores
+        sums[missing] = 0.0
+        counts[:] = ~missing
+        values[:, -1] = 1.0
+        if weights is not None:
+            sums *= weights[:, None]
+            counts *= weights[:, None]
+        new_names = totals.add(reviews_df['employee_name'], values)
+        
+        # Employee metadata comes from each employee's first review row
+        if new_names:
+            first_rows = reviews_df.drop_duplicates('employee_name').set_index('employee_name')
+            first_rows = first_rows.loc[new_names, ['employee_role', 'employee_level', 'years_experience', 'team_size']]
+            totals.metadata.update(zip(new_names, first_rows.itertuples(index=False, name=None)))
+    
+    def iter_review_chunks(self) -> Iterator[pd.DataFrame]:
+        """Yield the reviews in order, chunk by chunk from the store when streamed"""
+        if self.review_store is not None and self._streamed_rows:
+            yield from self.review_store.iter_chunks()
+        else:
+            yield self.reviews_df
+    
+    def _weighted_score_totals(self, score_cols: List[str]) -> EmployeeTotals:
+        """Per-employee score totals weighted by reviewer type and optionally leniency-calibrated
+        
+        One grouped pass over the reviews (two when calibrating), chunk by chunk, with
+        employees in their order of first appearance as in the running totals.
+        """
+        totals = EmployeeTotals(
+            [f"{col}_sum" for col in score_cols] + [f"{col}_count" for col in score_cols] + ['num_reviews']
+        )
+        leniency = self._leniency_stats(score_cols) if self.calibrate_leniency else None
+        for chunk in self.iter_review_chunks():
+            scores = chunk[score_cols].to_numpy(dtype=float)
+            if leniency is not None:
+                scores = self._calibrate_scores(chunk, scores, leniency)
+            self._add_reviews_to_totals(totals, chunk, scores, self._review_weights(chunk))
+        return totals
+    
+    def _review_weights(self, reviews_df: pd.DataFrame) -> np.ndarray:
+        """Weight of each review from its reviewer type, or None for equal weights"""
+        if self.reviewer_weights is None or 'reviewer_type' not in reviews_df.columns:
+            return None
+        weights = reviews_df['reviewer_type'].astype(object).map(self.reviewer_weights)
+        return weights.to_numpy(dtype=float, na_value=1.0)
+    
+    def _calibration_groups(self, reviews_df: pd.DataFrame) -> List[np.ndarray]:
+        """Review cycle and reviewer type of each review, the leniency calibration groups"""
+        if 'review_date' in reviews_df.columns:
+            cycles = pd.PeriodIndex(pd.to_datetime(reviews_df['review_date']), freq=self.review_cycle).asi8
+        else:
+            cycles = np.zeros(len(reviews_df), dtype=np.int64)
+        if 'reviewer_type' in reviews_df.columns:
+            reviewer_types = reviews_df['reviewer_type'].to_numpy(dtype=object)
+        else:
+            reviewer_types = np.full(len(reviews_df), None, dtype=object)
+        return [cycles, reviewer_types]
+    
+    def _leniency_stats(self, score_cols: List[str]) -> Dict:
+        """Per-group and overall mean and standard deviation of each competency score"""
+        partials = []
+        for chunk in self.iter_review_chunks():
+            scores = chunk[score_cols].to_numpy(dtype=float)
+            present = ~np.isnan(scores)
+            values = np.where(present, scores, 0.0)
+            partial = pd.DataFrame(np.hstack([values, values ** 2, present]))
+            partials.append(partial.groupby(self._calibration_groups(chunk), dropna=False, sort=False).sum())
+        group_totals = pd.concat(partials).groupby(level=[0, 1], dropna=False, sort=False).sum()
+        
+        n = len(score_cols)
+        sums, squares, counts = np.hsplit(group_totals.to_numpy(), [n, 2 * n])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / counts
+            stds = np.sqrt(np.maximum(squares / counts - means ** 2, 0.0))
+            overall_means = sums.sum(axis=0) / counts.sum(axis=0)
+            overall_stds = np.sqrt(np.maximum(squares.sum(axis=0) / counts.sum(axis=0) - overall_means ** 2, 0.0))
+        # Groups of one review or without spread are left uncalibrated
+        calibrated = (counts >= 2) & (stds > 0)
+        return {
+            'groups': group_totals.index,
+            'means': means,
+            'stds': np.where(calibrated, stds, 1.0),
+            'calibrated': calibrated,
+            'overall_means': overall_means,
+            'overall_stds': overall_stds,
+        }
+    
+    def _calibrate_scores(self, reviews_df: pd.DataFrame, scores: np.ndarray, leniency: Dict) -> np.ndarray:
+        """Z-score each review within its group, mapped back onto the overall score scale"""
+        groups = leniency['groups'].get_indexer(pd.MultiIndex.from_arrays(self._calibration_groups(reviews_df)))
+        z_scores = (scores - leniency['means'][groups]) / leniency['stds'][groups]
+        calibrated = leniency['overall_means'] + z_scores * leniency['overall_stds']
+        return np.where(leniency['calibrated'][groups], calibrated, scores)
+    
+    def with_score_aggregation(self, reviewer_weights: Dict[str, float] = None,
+                               calibrate_leniency: bool = False) -> "SuccessionPlanningAnalyzer":
+        """Copy of the analyzer that aggregates employee scores differently
+        
+        The copy shares the reviews, running totals and result cache, so switching
+        between aggregation modes reuses every result already computed for either.
+        """
+        analyzer = copy.copy(self)
+        analyzer.reviewer_weights = reviewer_weights
+        analyzer.calibrate_leniency = calibrate_leniency
+        return analyzer
+    
+    def _score_columns(self, reviews_df: pd.DataFrame) -> List[str]:
+        """Competency score columns present in the reviews"""
+        return [f"{comp}_score" for comp in self.competencies if f"{comp}_score" in reviews_df.columns]
+    
+    def _cache_config(self) -> str:
+        """Configuration that cached results depend on besides the reviews"""
+        return repr((
+            self.competencies, self.level_hierarchy, self.role_weights, self.succession_paths,
+            self.experience_bonus_cap, self.team_bonus_cap, self.role_requirements, self.high_priority_gap,
+            self.reviewer_weights, self.calibrate_leniency, self.review_cycle
+        ))
+        
+    @traced()
+    @cached_result
+    def calculate_employee_scores(self) -> pd.DataFrame:
+        """Calculate aggregated scores for each employee
+        
+        Each competency score is the mean of the employee's reviews, weighted by
+        reviewer_weights and leniency-calibrated when those are set.
+        """
+        if self.reviewer_weights is None and not self.calibrate_leniency:
+            totals = self._get_score_totals()
+            score_cols = self._score_totals_cols
+        else:
+            score_cols = self._score_columns(self._reviews_df)
+            totals = self._weighted_score_totals(score_cols)
+        totals_df = totals.to_frame()
+        
+        # Employees keep their order of first appearance
+        sums = totals_df[[f"{col}_sum" for col in score_cols]].to_numpy()
+        counts = totals_df[[f"{col}_count" for col in score_cols]].to_numpy()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = np.where(counts > 0, sums / counts, np.nan)
+        competency_means = pd.DataFrame(
+            means, index=totals_df.index, columns=[col[:-len("_score")] for col in score_cols]
+        )
+        
+        # Overall performance score across all competencies; each employee's row is made
+        # contiguous so it is summed in the same order as a per-employee np.mean
+        overall_scores = np.mean(np.ascontiguousarray(means), axis=1)
+        
+        emp_info = pd.DataFrame(
+            [totals.metadata[name] for name in totals.names],
+            columns=['employee_role', 'employee_level', 'years_experience', 'team_size']
+        )
+        
+        employee_scores = pd.DataFrame({
+            'name': competency_means.index,
+            'role': emp_info['employee_role'].to_numpy(),
+            'level': emp_info['employee_level'].to_numpy(),
+            'years_experience': emp_info['years_experience'].to_numpy(),
+            'team_size': emp_info['team_size'].to_numpy(),
+            'overall_score': overall_scores,
+            'num_reviews': totals_df['num_reviews'].to_numpy().astype(np.int64),
+        })
+
+        for comp in competency_means.columns:
+            employee_scores[comp] = competency_means[comp].to_numpy()
+
+        return employee_scores
+    
+    @traced()
+    @cached_result
+    def identify_succession_candidates(self, target_roles: List[str] = None) -> Dict:
+        """Identify top succession candidates for leadership roles"""
         if not target_roles:
-            target_roles = list(succession_paths.keys())
+            target_roles = list(self.succession_paths.keys())
+        
+        index = self.get_succession_index()
+        
+        # Roles outside succession_paths are ranked on demand with default eligibility
+        if any(role not in index for role in target_roles):
+            index = self.build_succession_index(target_roles)
         
         succession_candidates = {}
         
         for target_role in target_roles:
-            # Find current role holder - exact match to avoid duplicates
-            current_holder = employee_scores[
-                employee_scores['role'].str.replace(' ', '') == target_role.replace(' ', '')
-            ]
-            
-            if len(current_holder) == 0:
+            current_holder = index.current_holder(target_role)
+            if current_holder is None:
                 continue
-                
-            # Get eligible candidate levels
-            eligible_levels = succession_paths.get(target_role, ["Professional", "Manager"])
-            
-            # Filter candidates
-            candidates = employee_scores[
-                employee_scores['level'].isin(eligible_levels)
-            ].copy()
             
-            if len(candidates) == 0:
+            # Rank candidates
+            top_candidates = index.top_successors(target_role, 3)
+            if not top_candidates:
                 continue
             
-            # Calculate succession readiness score
-            candidates['succession_score'] = self._calculate_succession_score(candidates, target_role)
+            succession_candidates[target_role] = {
+                'current_holder': current_holder,
+                'candidates': top_candidates
+            }
+        
+        return succession_candidates
+    
+    @traced()
+    def rank_succession_candidates(self, role_weights: Dict[str, Dict[str, float]] = None,
+                                   experience_bonus_cap: float = None, team_bonus_cap: float = None,
+                                   target_roles: List[str] = None, n: int = 3) -> Dict:
+        """Re-rank succession candidates under what-if weights and bonus caps
+        
+        Returns the same structure as identify_succession_candidates. The competency
+        matrix, eligibility and current holders stay resident per dataset, so each
+        call only redoes the matrix product and a top-n selection per role.
+        """
+        if not target_roles:
+            target_roles = list(self.succession_paths.keys())
+        target_roles = list(dict.fromkeys(target_roles))
+        
+        # The index holds every employee's score record, whatever roles it ranks
+        index = self.get_succession_index()
+        eligible, holder_positions = self._succession_eligibility(target_roles)
+        scores = self._score_competency_matrix(
+            self.get_competency_matrix(), target_roles, role_weights, experience_bonus_cap, team_bonus_cap
+        )
+        
+        succession_candidates = {}
+        for col, target_role in enumerate(target_roles):
+            if holder_positions[col] is None:
+                continue
             
-            # Rank candidates
-            top_candidates = candidates.nlargest(3, 'succession_score')
+            role_scores = scores[:, col]
+            positions = np.flatnonzero(eligible[col] & ~np.isnan(role_scores))
+            if len(positions) > n:
+                # Keep everything tied with the n-th best so ties resolve in employee order
+                nth_best = -np.partition(-role_scores[positions], n - 1)[n - 1]
+                positions = positions[role_scores[positions] >= nth_best]
+            positions = positions[np.lexsort((positions, -role_scores[positions]))][:n]
+            if not len(positions):
+                continue
             
             succession_candidates[target_role] = {
-                'current_holder': current_holder.iloc[0].to_dict() if len(current_holder) > 0 else None,
-                'candidates': top_candidates.to_dict('records')
+                'current_holder': index.employee_record(holder_positions[col]),
+                'candidates': [
+                    {**index.employee_record(pos), 'succession_score': float(role_scores[pos])}
+                    for pos in positions
+                ]
             }
         
         return succession_candidates
     
-    def _calculate_succession_score(self, candidates: pd.DataFrame, target_role: str) -> pd.Series:
-        """Calculate succession readiness score based on role requirements"""
+    @cached_result
+    def _succession_eligibility(self, target_roles: List[str]) -> Tuple[np.ndarray, List[int]]:
+        """Eligible candidates (roles x employees) and the current holder row of each target role"""
+        employee_scores = self.calculate_employee_scores()
+        levels = employee_scores['level'].to_numpy()
+        normalized_roles = employee_scores['role'].str.replace(' ', '').to_numpy()
         
-        # Define role-specific competency weights
-        role_weights = {
-            "VP": {
-                "leadership": 0.25, "strategic_thinking": 0.25, "communication": 0.15,
-                "decision_making": 0.15, "mentoring": 0.1, "results_delivery": 0.1
-            },
-            "Director": {
-                "leadership": 0.2, "strategic_thinking": 0.2, "communication": 0.15,
-                "team_collaboration": 0.15, "problem_solving": 0.15, "results_delivery": 0.15
-            },
-            "Manager": {
-                "leadership": 0.2, "team_collaboration": 0.2, "communication": 0.15,
-                "mentoring": 0.15, "problem_solving": 0.15, "results_delivery": 0.15
-            }
+        eligible = np.zeros((len(target_roles), len(employee_scores)), dtype=bool)
+        holder_positions = []
+        for row, role in enumerate(target_roles):
+            eligible[row] = np.isin(levels, self.succession_paths.get(role, ["Professional", "Manager"]))
+            # Find current role holder - exact match to avoid duplicates
+            holders = np.flatnonzero(normalized_roles == role.replace(' ', ''))
+            holder_positions.append(int(holders[0]) if len(holders) > 0 else None)
+        
+        return eligible, holder_positions
+    
+    def get_succession_index(self) -> "SuccessionCandidateIndex":
+        """Return the ranked candidate index for all succession paths, built once per dataset"""
+        return self.build_succession_index(list(self.succession_paths.keys()))
+    
+    @traced()
+    @cached_result
+    def build_succession_index(self, target_roles: List[str]) -> "SuccessionCandidateIndex":
+        """Build a ranked candidate index for the given target roles"""
+        employee_scores = self.calculate_employee_scores()
+        
+        # Score every employee against every target role in one matrix product
+        succession_scores = self.calculate_succession_scores(employee_scores, target_roles)
+        
+        eligible_levels = {
+            role: self.succession_paths.get(role, ["Professional", "Manager"])
+            for role in target_roles
         }
+        return SuccessionCandidateIndex(employee_scores, succession_scores, eligible_levels)
+    
+    @traced()
+    def calculate_succession_scores(self, employee_scores: pd.DataFrame = None, target_roles: List[str] = None,
+                                    role_weights: Dict[str, Dict[str, float]] = None,
+                                    experience_bonus_cap: float = None,
+                                    team_bonus_cap: float = None) -> pd.DataFrame:
+        """Score every employee against every target role (employees x roles)
         
-        # Determine target level from role
-        target_level = "VP" if "VP" in target_role else "Director" if "Director" in target_role else "Manager"
-        weights = role_weights.get(target_level, role_weights["Manager"])
+        role_weights and the bonus caps override the analyzer's settings for this
+        call only. Without employee_scores, the resident competency matrix of the
+        dataset is reused, so only the matrix product is recomputed.
+        """
+        if employee_scores is None:
+            employee_scores = self.calculate_employee_scores()
+            matrix = self.get_competency_matrix()
+        else:
+            matrix = self._build_competency_matrix(employee_scores)
+        if not target_roles:
+            target_roles = list(self.role_weights.keys())
+        
+        # Deduplicate while keeping order so each role is one matrix column
+        target_roles = list(dict.fromkeys(target_roles))
+        final_scores = self._score_competency_matrix(
+            matrix, target_roles, role_weights, experience_bonus_cap, team_bonus_cap
+        )
+        return pd.DataFrame(final_scores, index=employee_scores.index, columns=target_roles)
+    
+    @cached_result
+    def get_competency_matrix(self) -> Dict[str, np.ndarray]:
+        """Employees x competencies matrix and bonus inputs of calculate_employee_scores(),
+        built once per dataset and kept resident for re-scoring"""
+        return self._build_competency_matrix(self.calculate_employee_scores())
+    
+    def _build_competency_matrix(self, employee_scores: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Competency scores with missing values zeroed, their missing mask and bonus inputs"""
+        # Competencies missing from the score table contribute nothing
+        competency_matrix = np.zeros((len(employee_scores), len(self.competencies)))
+        for i, comp in enumerate(self.competencies):
+            if comp in employee_scores.columns:
+                competency_matrix[:, i] = employee_scores[comp].to_numpy(dtype=float)
+        missing = np.isnan(competency_matrix)
+        return {
+            'scores': np.where(missing, 0.0, competency_matrix),
+            'missing': missing.astype(float),
+            'years_experience': employee_scores['years_experience'].to_numpy(dtype=float),
+            'team_size': employee_scores['team_size'].to_numpy(dtype=float),
+        }
+    
+    def _score_competency_matrix(self, matrix: Dict[str, np.ndarray], target_roles: List[str],
+                                 role_weights: Dict[str, Dict[str, float]] = None,
+                                 experience_bonus_cap: float = None,
+                                 team_bonus_cap: float = None) -> np.ndarray:
+        """Succession scores (employees x roles) from a competency matrix"""
+        weight_matrix, team_bonus_mask = self._compile_role_weights(target_roles, role_weights)
         
-        # Calculate weighted competency score
-        succession_scores = []
-        for _, candidate in candidates.iterrows():
-            weighted_score = 0
+        # A missing score only poisons the roles that actually weight that competency
+        weighted_scores = matrix['scores'] @ weight_matrix.T
+        weighted_scores[(matrix['missing'] @ (weight_matrix != 0).T) > 0] = np.nan
+        
+        return weighted_scores + self._succession_bonus(
+            matrix, team_bonus_mask, experience_bonus_cap, team_bonus_cap
+        )
+    
+    def _succession_bonus(self, matrix: Dict[str, np.ndarray], team_bonus_mask: np.ndarray,
+                          experience_bonus_cap: float = None, team_bonus_cap: float = None) -> np.ndarray:
+        """Experience and team size bonuses of every employee for every role (employees x roles)"""
+        if experience_bonus_cap is None:
+            experience_bonus_cap = self.experience_bonus_cap
+        if team_bonus_cap is None:
+            team_bonus_cap = self.team_bonus_cap
+        
+        # Add experience bonus (1% per year, capped)
+        experience_bonus = np.minimum(experience_bonus_cap, matrix['years_experience'] / 100)
+        
+        # Add team size bonus for leadership roles (1% per team member, capped)
+        team_bonus = np.minimum(team_bonus_cap, matrix['team_size'] / 100)
+        
+        return experience_bonus[:, None] + team_bonus[:, None] * team_bonus_mask[None, :]
+    
+    def _compile_role_weights(self, target_roles: List[str],
+                              role_weights: Dict[str, Dict[str, float]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Compile role weights into a roles x competencies matrix plus a team-bonus mask"""
+        if role_weights is None:
+            role_weights = self.role_weights
+        weight_matrix = np.zeros((len(target_roles), len(self.competencies)))
+        team_bonus_mask = np.zeros(len(target_roles))
+        comp_index = {comp: i for i, comp in enumerate(self.competencies)}
+        
+        for row, target_role in enumerate(target_roles):
+            target_level = self._get_target_level(target_role)
+            weights = role_weights.get(target_level, role_weights["Manager"])
             for competency, weight in weights.items():
-                if competency in candidate:
-                    weighted_score += candidate[competency] * weight
-            
-            # Add experience bonus (up to 10% bonus)
-            experience_bonus = min(0.1, candidate['years_experience'] / 100)
-            
-            # Add team size bonus for leadership roles (up to 5% bonus)
-            team_bonus = min(0.05, candidate['team_size'] / 100) if target_level in ["VP", "Director"] else 0
+                if competency in comp_index:
+                    weight_matrix[row, comp_index[competency]] = weight
+            if target_level in ["VP", "Director"]:
+                team_bonus_mask[row] = 1.0
+        
+        return weight_matrix, team_bonus_mask
+    
+    @traced()
+    @cached_result
+    def calculate_readiness_gaps(self, target_roles: List[str] = None,
+                                 role_requirements: Dict[str, Dict[str, float]] = None) -> pd.DataFrame:
+        """Largest requirement gap of every employee for every target role (employees x roles)
+        
+        A gap of 0 means every required competency is met. Employees whose level
+        is not on the role's succession path are NaN. role_requirements replaces the
+        analyzer's minimum scores per target level for what-if analysis.
+        """
+        employee_scores = self.calculate_employee_scores()
+        if not target_roles:
+            target_roles = list(self.succession_paths.keys())
+        target_roles = list(dict.fromkeys(target_roles))
+        
+        required_competencies, required, _ = self._compile_role_requirements(target_roles, role_requirements)
+        current = self._requirement_scores(employee_scores, required_competencies)
+        
+        # employees x roles x competencies; missing (NaN) scores never show a gap
+        with np.errstate(invalid='ignore'):
+            gaps = required[None, :, :] - current[:, None, :]
+        gaps = np.where(np.isnan(gaps), 0.0, gaps)
+        max_gaps = np.maximum(gaps.max(axis=2, initial=0.0), 0.0)
+        
+        eligible, _ = self._succession_eligibility(target_roles)
+        max_gaps[~eligible.T] = np.nan
+        
+        return pd.DataFrame(max_gaps, index=employee_scores.index, columns=target_roles)
+    
+    @traced()
+    def assess_bench_strength(self, target_roles: List[str] = None, ready_now_gap: float = 0.0,
+                              one_cycle_gap: float = None, role_weights: Dict[str, Dict[str, float]] = None,
+                              experience_bonus_cap: float = None, team_bonus_cap: float = None,
+                              role_requirements: Dict[str, Dict[str, float]] = None) -> Dict[str, pd.DataFrame]:
+        """Classify every eligible candidate's readiness for every target role
+        
+        A candidate is ready now when their largest requirement gap is at most
+        ready_now_gap, ready in one cycle when it is at most one_cycle_gap (by
+        default high_priority_gap, i.e. no High priority gaps) and not ready
+        otherwise. Gaps are measured against role_requirements when given, as in
+        calculate_readiness_gaps. Candidates need a succession score, which
+        role_weights and the bonus caps override as in rank_succession_candidates.
+        Returns two DataFrames:
+        
+        - ``summary``: one row per target role with its current holder and the
+          number of candidates at each readiness level
+        - ``candidates``: one row per eligible candidate and role, ordered by role,
+          readiness and succession score
+        
+        Only thresholding (and re-scoring, for what-if weights) runs per call; gap
+        matrices are cached per dataset and set of requirements.
+        """
+        if not target_roles:
+            target_roles = list(self.succession_paths.keys())
+        target_roles = list(dict.fromkeys(target_roles))
+        if one_cycle_gap is None:
+            one_cycle_gap = self.high_priority_gap
+        
+        employee_scores = self.calculate_employee_scores()
+        rows, cols, max_gaps, succession_scores = self._bench_pairs(target_roles)
+        if role_requirements is not None:
+            # Eligibility does not depend on requirements, so the pairs stay the same
+            max_gaps = self.calculate_readiness_gaps(target_roles, role_requirements).to_numpy()[rows, cols]
+        if role_weights is not None or experience_bonus_cap is not None or team_bonus_cap is not None:
+            what_if_scores = self._score_competency_matrix(
+                self.get_competency_matrix(), target_roles, role_weights, experience_bonus_cap, team_bonus_cap
+            )
+            succession_scores = what_if_scores[rows, cols]
+            # Ties keep employee order, as in the cached default ordering
+            order = np.lexsort((rows, -succession_scores, cols))
+            rows, cols, max_gaps, succession_scores = rows[order], cols[order], max_gaps[order], succession_scores[order]
+        scored = ~np.isnan(succession_scores)
+        rows, cols, max_gaps, succession_scores = rows[scored], cols[scored], max_gaps[scored], succession_scores[scored]
+        
+        readiness = np.select([max_gaps <= ready_now_gap, max_gaps <= one_cycle_gap], [0, 1], 2).astype(np.int8)
+        group_codes = cols * len(READINESS_LEVELS) + readiness
+        counts = np.bincount(group_codes, minlength=len(target_roles) * len(READINESS_LEVELS))
+        counts = counts.reshape(len(target_roles), len(READINESS_LEVELS))
+        
+        index = self.build_succession_index(target_roles)
+        summary = pd.DataFrame({
+            'target_role': target_roles,
+            'current_holder': [
+                (index.current_holder(role) or {}).get('name') for role in target_roles
+            ],
+        })
+        for code, level in enumerate(READINESS_LEVELS):
+            summary[level] = counts[:, code]
+        summary['Total'] = counts.sum(axis=1)
+        
+        # Pairs are already ordered by role and score, so a stable sort on readiness within
+        # each role keeps the best prospects first
+        order = np.argsort(group_codes, kind='stable')
+        rows, cols, readiness = rows[order], cols[order], readiness[order]
+        candidates = employee_scores.iloc[rows][['name', 'role', 'level']].reset_index(drop=True)
+        candidates.insert(0, 'target_role', pd.Categorical.from_codes(cols, target_roles))
+        candidates['readiness'] = pd.Categorical.from_codes(readiness, READINESS_LEVELS, ordered=True)
+        candidates['max_gap'] = max_gaps[order]
+        candidates['succession_score'] = succession_scores[order]
+        candidates['overall_score'] = employee_scores['overall_score'].to_numpy()[rows]
+        candidates['years_experience'] = employee_scores['years_experience'].to_numpy()[rows]
+        
+        return {'summary': summary, 'candidates': candidates}
+    
+    @cached_result
+    def _bench_pairs(self, target_roles: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Employee rows, role columns, largest gaps and succession scores of every eligible
+        (employee, role) pair, ordered by role and then by descending succession score
+        (pairs without a score last)"""
+        max_gaps = self.calculate_readiness_gaps(target_roles).to_numpy()
+        succession_scores = self.calculate_succession_scores(None, target_roles).to_numpy()
+        
+        # Roles major, so pairs come out grouped by role
+        cols, rows = np.nonzero(~np.isnan(max_gaps.T))
+        scores = succession_scores[rows, cols]
+        order = np.lexsort((-scores, cols))
+        rows, cols = rows[order], cols[order].astype(np.int16)
+        return rows, cols, max_gaps[rows, cols], scores[order]
+    
+    @traced()
+    @cached_result
+    def calculate_score_intervals(self, n_resamples: int = 1000, confidence: float = 0.95,
+                                  target_roles: List[str] = None, seed: int = 0) -> Dict[str, pd.DataFrame]:
+        """Bootstrap confidence intervals of overall and succession scores
+        
+        Each employee's reviews are resampled with replacement n_resamples times.
+        Both scores are linear in the competency means, so every review is first
+        projected onto one value per score (missing competency scores take the
+        employee's mean), and a resample only averages those projections, with
+        reviewer weights when configured. All employees and resamples are drawn as
+        batched arrays, in blocks of employees that bound memory use. Returns
+        DataFrames indexed by employee name:
+        
+        - ``overall_score``: ``low`` and ``high`` bounds
+        - ``succession_score_low`` and ``succession_score_high``: employees x roles
+        
+        Results are reproducible for a given seed.
+        """
+        employee_scores = self.calculate_employee_scores()
+        if not target_roles:
+            target_roles = list(self.succession_paths.keys())
+        target_roles = list(dict.fromkeys(target_roles))
+        score_cols = self._score_columns(self._reviews_df)
+        competencies = [col[:-len("_score")] for col in score_cols]
+        
+        # Projection of one review's scores onto the overall score and each role's weighted score
+        weight_matrix, team_bonus_mask = self._compile_role_weights(target_roles)
+        comp_index = {comp: i for i, comp in enumerate(self.competencies)}
+        projection = np.column_stack([
+            np.full(len(competencies), 1 / len(competencies)) if competencies else np.zeros(0),
+            weight_matrix[:, [comp_index[comp] for comp in competencies]].T
+        ])
+        
+        owners, values, weights = self._projected_review_values(employee_scores, score_cols, projection)
+        low, high = self._bootstrap_mean_intervals(
+            owners, values, weights, len(employee_scores), n_resamples, confidence, seed
+        )
+        
+        # Scores without a point estimate get no interval; succession bounds add the bonuses
+        overall = employee_scores['overall_score'].to_numpy(dtype=float)
+        succession = self.calculate_succession_scores(None, target_roles).to_numpy()
+        bonus = self._succession_bonus(self.get_competency_matrix(), team_bonus_mask)
+        names = pd.Index(employee_scores['name'], name='employee_name')
+        undefined = np.isnan(succession)
+        return {
+            'overall_score': pd.DataFrame({
+                'low': np.where(np.isnan(overall), np.nan, low[:, 0]),
+                'high': np.where(np.isnan(overall), np.nan, high[:, 0]),
+            }, index=names),
+            'succession_score_low': pd.DataFrame(
+                np.where(undefined, np.nan, low[:, 1:] + bonus), index=names, columns=target_roles
+            ),
+            'succession_score_high': pd.DataFrame(
+                np.where(undefined, np.nan, high[:, 1:] + bonus), index=names, columns=target_roles
+            ),
+        }
+    
+    def _projected_review_values(self, employee_scores: pd.DataFrame, score_cols: List[str],
+                                 projection: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Employee position, projected values and weight of every review, chunk by chunk"""
+        names = pd.Index(employee_scores['name'])
+        employee_means = employee_scores[[col[:-len("_score")] for col in score_cols]].to_numpy(dtype=float)
+        leniency = self._leniency_stats(score_cols) if self.calibrate_leniency else None
+        
+        owners, values, weights = [], [], []
+        for chunk in self.iter_review_chunks():
+            chunk_owners = names.get_indexer(chunk['employee_name'])
+            scores = chunk[score_cols].to_numpy(dtype=float)
+            if leniency is not None:
+                scores = self._calibrate_scores(chunk, scores, leniency)
             
-            final_score = weighted_score + experience_bonus + team_bonus
-            succession_scores.append(final_score)
+            # Missing scores take the employee's mean, so resamples stay centered on it;
+            # competencies nobody scored leave the affected scores without an interval
+            scores = np.where(np.isnan(scores), employee_means[chunk_owners], scores)
+            known = chunk_owners >= 0
+            owners.append(chunk_owners[known])
+            values.append(np.nan_to_num(scores[known]) @ projection)
+            chunk_weights = self._review_weights(chunk)
+            weights.append(np.ones(known.sum()) if chunk_weights is None else chunk_weights[known])
         
-        return pd.Series(succession_scores, index=candidates.index)
+        if not owners:
+            return np.empty(0, dtype=np.int64), np.empty((0, projection.shape[1])), np.empty(0)
+        return np.concatenate(owners), np.concatenate(values), np.concatenate(weights)
+    
+    def _bootstrap_mean_intervals(self, owners: np.ndarray, values: np.ndarray, weights: np.ndarray,
+                                  num_employees: int, n_resamples: int, confidence: float,
+                                  seed: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Percentile intervals of each employee's (weighted) mean value under resampling
+        
+        A resample is summarized by how often it draws each of the employee's reviews,
+        so its (weighted) sums are one small matrix product. Employees with the same
+        number of reviews are resampled together, in blocks that bound memory.
+        Returns low and high bounds of shape employees x values, NaN for employees
+        without reviews.
+        """
+        rng = np.random.default_rng(seed)
+        num_values = values.shape[1]
+        low = np.full((num_employees, num_values), np.nan)
+        high = np.full((num_employees, num_values), np.nan)
+        positions = [q * (n_resamples - 1) for q in ((1 - confidence) / 2, (1 + confidence) / 2)]
+        
+        # Reviews grouped by employee; float32 halves the memory traffic
+        order = np.argsort(owners, kind='stable')
+        weights = weights[order].astype(np.float32)
+        weighted = bool(np.any(weights != 1))
+        # One row per value plus the weight row, so weighted sums and their normalizers
+        # come out of the same product
+        terms = values[order].astype(np.float32) * weights[:, None]
+        if weighted:
+            terms = np.column_stack([terms, weights])
+        counts = np.bincount(owners, minlength=num_employees)
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        
+        for num_reviews in np.unique(counts[counts > 0]):
+            num_reviews = int(num_reviews)
+            group = np.flatnonzero(counts == num_reviews)
+            # Blocks of employees keep each array of draws around 4M entries
+            block_size = max(1, (1 << 22) // (n_resamples * num_reviews))
+            draw_dtype = np.uint8 if num_reviews <= 256 else np.int32
+            for block in range(0, len(group), block_size):
+                employees = group[block:block + block_size]
+                draws = rng.integers(0, num_reviews, (num_reviews, len(employees), n_resamples), dtype=draw_dtype)
+                
+                # Times each review is drawn, employees x reviews x resamples; comparing
+                # against every review is cheaper than scattering for the usual few reviews
+                drawn = np.zeros((len(employees), num_reviews, n_resamples), dtype=np.float32)
+                if num_reviews <= 32:
+                    for review in range(num_reviews):
+                        drawn[:, review] = (draws == review).sum(axis=0)
+                else:
+                    base = (np.arange(len(employees))[:, None] * num_reviews * n_resamples
+                            + np.arange(n_resamples))
+                    flat = drawn.reshape(-1)
+                    for draw in draws:
+                        # Each (employee, resample) appears once per draw, so no index repeats
+                        flat[base + draw.astype(np.int64) * n_resamples] += 1
+                
+                rows = starts[employees][:, None] + np.arange(num_reviews)
+                sums = np.matmul(terms[rows].transpose(0, 2, 1), drawn)
+                if weighted:
+                    with np.errstate(invalid='ignore', divide='ignore'):
+                        means = sums[:, :num_values] / sums[:, num_values:]
+                else:
+                    means = sums / num_reviews
+                
+                # Sorting float32 rows is much faster than partitioning them; quantiles are
+                # then interpolated linearly, as np.quantile does
+                means.sort(axis=2)
+                for bound, position in zip((low, high), positions):
+                    below = int(np.floor(position))
+                    above = min(below + 1, n_resamples - 1)
+                    fraction = position - below
+                    bound[employees] = means[..., below] + fraction * (means[..., above] - means[..., below])
+        
+        return low, high
+    
+    def _calculate_succession_score(self, candidates: pd.DataFrame, target_role: str) -> pd.Series:
+        """Calculate succession readiness score based on role requirements"""
+        return self.calculate_succession_scores(candidates, [target_role])[target_role]
+    
+    def _get_target_level(self, target_role: str) -> str:
+        """Determine target level from role"""
+        return "VP" if "VP" in target_role else "Director" if "Director" in target_role else "Manager"
+    
+    @cached_result
+    def get_employee_index(self) -> EmployeeRowIndex:
+        """Row positions of each employee's reviews, built once per dataset"""
+        return EmployeeRowIndex(self.reviews_df['employee_name'])
+    
+    def get_employee_reviews(self, employee_name: str) -> pd.DataFrame:
+        """Return all review rows of one employee"""
+        if self.review_store is not None and self._streamed_rows:
+            return self.review_store.employee_reviews(employee_name)
+        return self.reviews_df.iloc[self.get_employee_index().positions(employee_name)]
     
+    def _employee_score_index(self) -> EmployeeRowIndex:
+        """Index whose employee codes are rows of calculate_employee_scores()"""
+        if self.review_store is not None and self._streamed_rows:
+            return self._streamed_score_index()
+        # Employee scores follow first appearance in the reviews, as the review index numbers
+        # employees, so one index (and one name lookup table) serves both
+        return self.get_employee_index()
+    
+    @cached_result
+    def _streamed_score_index(self) -> EmployeeRowIndex:
+        """Row position of each employee in calculate_employee_scores() when streamed"""
+        return EmployeeRowIndex(self.calculate_employee_scores()['name'])
+    
+    def get_employee_scores(self, employee_name: str) -> pd.Series:
+        """Return one employee's aggregated scores, or None for unknown employees"""
+        code = self._employee_score_index().code(employee_name)
+        if code < 0:
+            return None
+        return self.calculate_employee_scores().iloc[code]
+    
+    def _employee_feedback(self, employee_name: str) -> Tuple[List[str], List[str]]:
+        """Strengths and development areas from each of an employee's reviews"""
+        if self.review_store is not None and self._streamed_rows:
+            employee_data = self.review_store.employee_reviews(employee_name)
+            return employee_data['strengths'].tolist(), employee_data['development_areas'].tolist()
+        positions = self.get_employee_index().positions(employee_name)
+        return tuple(uniques[codes[positions]].tolist() for codes, uniques in self._feedback_codes())
+    
+    @cached_result
+    def _feedback_codes(self) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Strengths and development areas as (codes, distinct values), built once per dataset
+        
+        Taking a few rows from a chunked Arrow string column costs time proportional to
+        the column, so per-employee lookups index small arrays of codes instead.
+        """
+        feedback_codes = []
+        for col in ['strengths', 'development_areas']:
+            codes, uniques = pd.factorize(self.reviews_df[col], use_na_sentinel=False)
+            feedback_codes.append((codes.astype(np.int32), np.asarray(uniques, dtype=object)))
+        return feedback_codes
+    
+    @traced()
+    @cached_result
     def generate_development_plan(self, employee_name: str, target_role: str = None) -> Dict:
         """Generate personalized development plan for an employee"""
-        employee_data = self.reviews_df[self.reviews_df['employee_name'] == employee_name]
+        emp_info = self.get_employee_scores(employee_name)
         
-        if len(employee_data) == 0:
+        if emp_info is None:
             return {"error": "Employee not found"}
         
-        # Calculate current competency scores
-        current_scores = {}
-        for comp in self.competencies:
-            comp_col = f"{comp}_score"
-            if comp_col in employee_data.columns:
-                current_scores[comp] = employee_data[comp_col].mean()
-        
-        # Get employee info
-        emp_info = employee_data.iloc[0]
-        current_level = emp_info['employee_level']
+        # Current competency scores are the employee's aggregated means
+        # (plans always report plain floats, whatever the storage dtype)
+        current_scores = {
+            comp: float(emp_info[comp]) for comp in self.competencies if comp in emp_info.index
+        }
+        current_level = emp_info['level']
         
         # Determine target role if not specified
         if not target_role:
-            level_index = self.level_hierarchy.index(current_level)
-            if level_index < len(self.level_hierarchy) - 1:
-                target_level = self.level_hierarchy[level_index + 1]
-                target_role = f"{target_level} Role"
-            else:
-                target_role = "Senior Leadership Role"
+            target_role = self._default_target_role(current_level)
         
         # Identify development gaps
         development_gaps = self._identify_development_gaps(current_scores, target_role)
@@ -174,12 +891,11 @@ class SuccessionPlanningAnalyzer:
         development_actions = self._generate_development_actions(development_gaps, emp_info)
         
         # Compile qualitative feedback
-        strengths = employee_data['strengths'].tolist()
-        development_areas = employee_data['development_areas'].tolist()
+        strengths, development_areas = self._employee_feedback(employee_name)
         
         return {
             'employee_name': employee_name,
-            'current_role': emp_info['employee_role'],
+            'current_role': emp_info['role'],
             'target_role': target_role,
             'current_scores': current_scores,
             'development_gaps': development_gaps,
@@ -189,16 +905,176 @@ class SuccessionPlanningAnalyzer:
             'timeline': "12-18 months"
         }
     
+    @traced()
+    @cached_result
+    def generate_development_plans(self, employee_names: List[str] = None,
+                                   target_role: str = None) -> Dict[str, pd.DataFrame]:
+        """Generate development plans for many employees at once, as columnar tables
+        
+        Gaps against the role requirements are computed as one employees x
+        competencies matrix. Returns three DataFrames:
+        
+        - ``plans``: one row per employee with current role and level, target role,
+          timeline, competency scores and deduplicated strengths and development areas
+        - ``gaps``: one row per competency below its requirement, as in
+          ``development_gaps`` of a single plan
+        - ``actions``: the ``development_actions`` of every plan, with rounded scores
+        
+        Rows follow the order of calculate_employee_scores(), or of employee_names
+        when given; unknown names are skipped. Gaps and actions are listed per
+        employee in requirement order, matching generate_development_plan.
+        """
+        employee_scores = self.calculate_employee_scores()
+        if employee_names is not None:
+            score_index = self._employee_score_index()
+            positions = np.fromiter((score_index.code(name) for name in employee_names), dtype=np.int64)
+            employee_scores = employee_scores.iloc[positions[positions >= 0]]
+        employee_scores = employee_scores.reset_index(drop=True)
+        names = employee_scores['name'].to_numpy(dtype=object)
+        
+        # Target role and level for every employee, resolved once per distinct level
+        if target_role:
+            target_roles = np.full(len(employee_scores), target_role, dtype=object)
+        else:
+            levels = employee_scores['level'].astype(object)
+            target_roles = levels.map({
+                level: self._default_target_role(level) for level in levels.unique()
+            }).to_numpy(dtype=object)
+        
+        # Required score and requirement order of every competency for every distinct target role
+        role_codes, unique_roles = pd.factorize(pd.Series(target_roles, dtype=object))
+        required_competencies, required, requirement_order = self._compile_role_requirements(list(unique_roles))
+        
+        # Competencies without scores count as 0; missing (NaN) scores never show a gap
+        current = self._requirement_scores(employee_scores, required_competencies)
+        targets = required[role_codes]
+        with np.errstate(invalid='ignore'):
+            gap_matrix = targets - current
+            has_gap = current < targets
+        
+        rows, cols = np.nonzero(has_gap)
+        order = np.lexsort((requirement_order[role_codes[rows], cols], rows))
+        rows, cols = rows[order], cols[order]
+        gap_competencies = np.array(required_competencies, dtype=object)[cols] if len(cols) else np.empty(0, dtype=object)
+        gaps = pd.DataFrame({
+            'employee_name': names[rows],
+            'competency': gap_competencies,
+            'current': current[rows, cols],
+            'target': targets[rows, cols],
+            'gap': gap_matrix[rows, cols],
+        })
+        
+        # Actions come from the templates of gap competencies, with the top two per competency
+        action_templates = self._action_templates()
+        has_template = np.fromiter(
+            (comp in action_templates for comp in gap_competencies), dtype=bool, count=len(gap_competencies)
+        )
+        action_gaps = gaps[has_template]
+        actions = pd.DataFrame({
+            'employee_name': action_gaps['employee_name'].to_numpy(),
+            'competency': [comp.replace('_', ' ').title() for comp in action_gaps['competency']],
+            'current_score': [round(value, 2) for value in action_gaps['current'].tolist()],
+            'target_score': [round(value, 2) for value in action_gaps['target'].tolist()],
+            'gap': [round(value, 2) for value in action_gaps['gap'].tolist()],
+            'priority': np.where(action_gaps['gap'].to_numpy() > self.high_priority_gap, "High", "Medium"),
+            'recommended_actions': [action_templates[comp][:2] for comp in action_gaps['competency']],
+        })
+        
+        strengths, development_areas = self._all_employee_feedback(names)
+        plans = pd.DataFrame({
+            'employee_name': names,
+            'current_role': employee_scores['role'].to_numpy(dtype=object),
+            'current_level': employee_scores['level'].to_numpy(dtype=object),
+            'target_role': target_roles,
+            'timeline': "12-18 months",
+        })
+        for comp in self.competencies:
+            if comp in employee_scores.columns:
+                plans[f"{comp}_score"] = employee_scores[comp].to_numpy(dtype=float)
+        plans['strengths'] = strengths
+        plans['development_areas'] = development_areas
+        
+        return {'plans': plans, 'gaps': gaps, 'actions': actions}
+    
+    def _all_employee_feedback(self, names: np.ndarray) -> Tuple[List[List[str]], List[List[str]]]:
+        """Deduplicated strengths and development areas of each employee, in first-seen order"""
+        if self.review_store is not None and self._streamed_rows:
+            # One pass over the stored reviews instead of a query per employee
+            collected = {name: ({}, {}) for name in names}
+            for chunk in self.review_store.iter_chunks():
+                for name, strength, area in zip(chunk['employee_name'], chunk['strengths'], chunk['development_areas']):
+                    if name in collected:
+                        collected[name][0].setdefault(strength)
+                        collected[name][1].setdefault(area)
+            return (
+                [list(collected[name][0]) for name in names],
+                [list(collected[name][1]) for name in names]
+            )
+        
+        # Review rows grouped by employee, each employee's rows in review order
+        index = self.get_employee_index()
+        employee_positions = [index.positions(name) for name in names]
+        rows = np.concatenate(employee_positions + [np.empty(0, dtype=np.int64)])
+        owners = np.repeat(np.arange(len(names)), [len(positions) for positions in employee_positions])
+        
+        feedback = []
+        for codes, values in self._feedback_codes():
+            row_codes = codes[rows]
+            # Keep the first row of every (employee, value) pair; rows are already grouped
+            # by employee, so sorted first positions keep first-seen order per employee
+            _, first = np.unique(owners * len(values) + row_codes, return_index=True)
+            first.sort()
+            bounds = np.searchsorted(owners[first], np.arange(len(names) + 1))
+            kept_values = values[row_codes[first]]
+            feedback.append([kept_values[bounds[i]:bounds[i + 1]].tolist() for i in range(len(names))])
+        return feedback[0], feedback[1]
+    
+    def _default_target_role(self, current_level: str) -> str:
+        """Target role one level up from current_level"""
+        level_index = self.level_hierarchy.index(current_level)
+        if level_index < len(self.level_hierarchy) - 1:
+            target_level = self.level_hierarchy[level_index + 1]
+            return f"{target_level} Role"
+        return "Senior Leadership Role"
+    
+    def _compile_role_requirements(self, target_roles: List[str],
+                                   role_requirements: Dict = None) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Compile role requirements (the analyzer's by default) into roles x competencies matrices
+        
+        Returns the required competencies, the required scores (NaN where a role does
+        not require a competency) and each competency's position in its role's requirements.
+        """
+        if role_requirements is None:
+            role_requirements = self.role_requirements
+        required_competencies = list(dict.fromkeys(
+            comp for requirements in role_requirements.values() for comp in requirements
+        ))
+        comp_index = {comp: i for i, comp in enumerate(required_competencies)}
+        required = np.full((len(target_roles), len(required_competencies)), np.nan)
+        requirement_order = np.zeros(required.shape, dtype=np.int64)
+        
+        for row, target_role in enumerate(target_roles):
+            target_level = self._get_target_level(target_role)
+            requirements = role_requirements.get(target_level, role_requirements["Manager"])
+            for order, (competency, required_score) in enumerate(requirements.items()):
+                required[row, comp_index[competency]] = required_score
+                requirement_order[row, comp_index[competency]] = order
+        
+        return required_competencies, required, requirement_order
+    
+    def _requirement_scores(self, employee_scores: pd.DataFrame, competencies: List[str]) -> np.ndarray:
+        """Employees x competencies score matrix; competencies without scores count as 0"""
+        current = np.zeros((len(employee_scores), len(competencies)))
+        for i, comp in enumerate(competencies):
+            if comp in employee_scores.columns:
+                current[:, i] = employee_scores[comp].to_numpy(dtype=float)
+        return current
+    
     def _identify_development_gaps(self, current_scores: Dict, target_role: str) -> Dict:
         """Identify competency gaps for target role"""
-        # Define minimum scores needed for different roles
-        role_requirements = {
-            "VP": {"leadership": 0.85, "strategic_thinking": 0.85, "communication": 0.80},
-            "Director": {"leadership": 0.75, "strategic_thinking": 0.70, "communication": 0.75},
-            "Manager": {"leadership": 0.70, "team_collaboration": 0.75, "mentoring": 0.65}
-        }
+        role_requirements = self.role_requirements
         
-        target_level = "VP" if "VP" in target_role else "Director" if "Director" in target_role else "Manager"
+        target_level = self._get_target_level(target_role)
         requirements = role_requirements.get(target_level, role_requirements["Manager"])
         
         gaps = {}
@@ -213,9 +1089,9 @@ class SuccessionPlanningAnalyzer:
         
         return gaps
     
-    def _generate_development_actions(self, gaps: Dict, emp_info: pd.Series) -> List[Dict]:
-        """Generate specific development actions based on gaps"""
-        action_templates = {
+    def _action_templates(self) -> Dict[str, List[str]]:
+        """Development actions per competency, most recommended first"""
+        return {
             "leadership": [
                 "Enroll in executive leadership program",
                 "Take on cross-functional project leadership role",
@@ -247,11 +1123,15 @@ class SuccessionPlanningAnalyzer:
                 "Establish mentoring circles or communities"
             ]
         }
+    
+    def _generate_development_actions(self, gaps: Dict, emp_info: pd.Series) -> List[Dict]:
+        """Generate specific development actions based on gaps"""
+        action_templates = self._action_templates()
         
         actions = []
         for competency, gap_info in gaps.items():
             if competency in action_templates:
-                priority = "High" if gap_info['gap'] > 0.15 else "Medium"
+                priority = "High" if gap_info['gap'] > self.high_priority_gap else "Medium"
                 actions.append({
                     'competency': competency.replace('_', ' ').title(),
                     'current_score': round(gap_info['current'], 2),
@@ -261,4 +1141,82 @@ class SuccessionPlanningAnalyzer:
                     'recommended_actions': action_templates[competency][:2]  # Top 2 actions
                 })
         
-        return actions
\ No newline at end of file
+        return actions
+
+
+class SuccessionCandidateIndex:
+    """Precomputed per-role candidate rankings for fast succession lookups"""
+    
+    def __init__(self, employee_scores: pd.DataFrame, succession_scores: pd.DataFrame,
+                 eligible_levels: Dict[str, List[str]]):
+        self.target_roles = list(succession_scores.columns)
+        self._records = employee_scores.to_dict('records')
+        self._positions = {record['name']: pos for pos, record in enumerate(self._records)}
+        self._role_positions = {role: i for i, role in enumerate(self.target_roles)}
+        
+        levels = employee_scores['level'].to_numpy()
+        normalized_roles = employee_scores['role'].str.replace(' ', '').to_numpy()
+        score_matrix = succession_scores.to_numpy()
+        
+        # Ranked row positions per role, and each employee's rank for every role
+        unranked = np.iinfo(np.int32).max
+        self._ranked_positions = []
+        self._ranked_scores = []
+        self._rank_matrix = np.full((len(self.target_roles), len(self._records)), unranked, dtype=np.int32)
+        self._holder_positions = []
+        
+        for row, role in enumerate(self.target_roles):
+            # Find current role holder - exact match to avoid duplicates
+            holders = np.flatnonzero(normalized_roles == role.replace(' ', ''))
+            self._holder_positions.append(int(holders[0]) if len(holders) > 0 else None)
+            
+            scores = score_matrix[:, row]
+            eligible = np.flatnonzero(np.isin(levels, eligible_levels[role]) & ~np.isnan(scores))
+            
+            # Stable sort keeps ties in employee order, matching nlargest(keep='first')
+            order = eligible[np.argsort(-scores[eligible], kind='stable')]
+            self._ranked_positions.append(order)
+            self._ranked_scores.append(scores[order])
+            self._rank_matrix[row, order] = np.arange(len(order), dtype=np.int32)
+    
+    def __contains__(self, target_role: str) -> bool:
+        return target_role in self._role_positions
+    
+    def employee_record(self, position: int) -> Dict:
+        """Return the score record at a row position of calculate_employee_scores()"""
+        return dict(self._records[position])
+    
+    def current_holder(self, target_role: str) -> Dict:
+        """Return the current holder of a target role, if any"""
+        if target_role not in self._role_positions:
+            return None
+        pos = self._holder_positions[self._role_positions[target_role]]
+        return dict(self._records[pos]) if pos is not None else None
+    
+    def top_successors(self, target_role: str, n: int = 3) -> List[Dict]:
+        """Return the top N succession candidates for a target role"""
+        if target_role not in self._role_positions:
+            return []
+        row = self._role_positions[target_role]
+        positions = self._ranked_positions[row][:n]
+        scores = self._ranked_scores[row][:n]
+        return [
+            {**self._records[pos], 'succession_score': float(score)}
+            for pos, score in zip(positions, scores)
+        ]
+    
+    def roles_for_candidate(self, employee_name: str, n: int = 3) -> List[Dict]:
+        """Return the target roles for which an employee is a top N candidate"""
+        if employee_name not in self._positions:
+            return []
+        ranks = self._rank_matrix[:, self._positions[employee_name]]
+        rows = np.flatnonzero(ranks < n)
+        rows = rows[np.argsort(ranks[rows], kind='stable')]
+        return [
+            {
+                'target_role': self.target_roles[row],
+                'rank': int(ranks[row]) + 1,
+                'succession_score': float(self._ranked_scores[row][ranks[row]])
+            }
+            for row in rows
+        ]
@@ -1,17 +1,466 @@
+import os
+import threading
+import time
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Set
-import re
+from typing import Dict, Iterator, List, Tuple, Set
+from bisect import bisect_right
 from collections import defaultdict, Counter
+from aggregates import EmployeeTotals
+from instrumentation import StageTotals, is_enabled as instrumentation_enabled, traced
+from result_cache import ResultCache, cached_result, chain_fingerprint, dataset_fingerprint, default_cache
+from text_matching import NameMentionAutomaton, PatternMatcher, split_sentences
+
+# Per-process analyzer used by pool workers, set up once by _init_text_worker
+_worker_analyzer = None
+
+
+def _init_text_worker(analyzer_cls, name_aliases: Dict[str, str], pattern_matcher: PatternMatcher,
+                      roster: List[str]):
+    """Build the worker's own analyzer with the parent's patterns, aliases and roster"""
+    global _worker_analyzer
+    _worker_analyzer = analyzer_cls(
+        pd.DataFrame({'employee_name': [], 'reviewer_type': [], 'review_text': []}),
+        name_aliases, roster=roster
+    )
+    _worker_analyzer.pattern_matcher = pattern_matcher
+
+
+def _build_text_features_shard(reviews_shard: pd.DataFrame) -> pd.DataFrame:
+    """Build text features for one shard of employees in a pool worker"""
+    return _worker_analyzer._build_text_features(reviews_shard)
+
+
+def _example_lists() -> defaultdict:
+    """Example sentences per hit category; module-level so analyzers stay picklable"""
+    return defaultdict(list)
+
 
 class TeamDynamicsAnalyzer:
     """Analyzes team dynamics and toxic behaviors from 360-degree review text"""
     
-    def __init__(self, reviews_df: pd.DataFrame):
+    def __init__(self, reviews_df: pd.DataFrame, name_aliases: Dict[str, str] = None,
+                 cache: ResultCache = None, review_store=None, roster: List[str] = None,
+                 n_workers: int = 1, chunk_size: int = None):
+        self._name_automaton = None
+        # Text analysis shards employees across n_workers processes (None uses every core);
+        # chunk_size is the number of employees per task, sized automatically when None
+        self.n_workers = n_workers if n_workers is not None else os.cpu_count()
+        self.chunk_size = chunk_size
+        self.cache = cache if cache is not None else default_cache
+        # Analyzers are shared across Streamlit sessions, so lazy state is built under a lock
+        self._state_lock = threading.RLock()
+        self.name_aliases = name_aliases or {}
+        # With an on-disk review store, appended batches and their features are not kept in memory
+        self.review_store = review_store
         self.reviews_df = reviews_df
+        # A roster known up front (e.g. from a first pass over a file) avoids late-mention rescans
+        if roster is not None:
+            self._roster = list(roster)
         self.toxic_patterns = self._initialize_toxic_patterns()
         self.positive_patterns = self._initialize_positive_patterns()
+        self.pattern_matcher = PatternMatcher({
+            "toxic": self.toxic_patterns,
+            "positive": self.positive_patterns
+        })
+        
+    @property
+    def reviews_df(self) -> pd.DataFrame:
+        """360-degree review rows the analyzer works on
+        
+        Streamed reviews only live in the review store and are never loaded whole;
+        read them with iter_review_chunks() instead.
+        """
+        if self.review_store is not None and self._streamed_rows:
+            raise RuntimeError("Streamed reviews are not held in memory; read them with iter_review_chunks()")
+        if self._pending_batches:
+            self._reviews_df = pd.concat([self._reviews_df, *self._pending_batches], ignore_index=True)
+            self._pending_batches = []
+        return self._reviews_df
+    
+    @reviews_df.setter
+    def reviews_df(self, reviews_df: pd.DataFrame):
+        # The name automaton and text state are only valid for the reviews they were
+        # built from; cached results are keyed by content, so they never go stale
+        self._reviews_df = reviews_df
+        self._pending_batches = []
+        self._streamed_rows = 0
+        self.fingerprint = dataset_fingerprint(reviews_df)
+        self._roster = None
+        self._name_automaton = None
+        self._feature_batches = None
+    
+    @traced(rows=lambda self, new_reviews_df: len(new_reviews_df))
+    def append_reviews(self, new_reviews_df: pd.DataFrame):
+        """Absorb a new batch of reviews, updating hit tallies and the relationship graph incrementally
+        
+        Only the new rows are scanned. When the batch introduces employees that were not
+        seen before, earlier reviews are rescanned for those names alone so that mentions
+        of them are not missed; such mentions are appended after existing relationships.
+        """
+        if len(new_reviews_df) == 0:
+            return
+        self.fingerprint = chain_fingerprint(self.fingerprint, dataset_fingerprint(new_reviews_df))
+        
+        if self.review_store is not None:
+            self._ensure_text_state()
+        elif self._feature_batches is None:
+            # Nothing has been analyzed yet, so the batch is simply analyzed with the rest later
+            self._pending_batches.append(new_reviews_df)
+            self._roster = None
+            self._name_automaton = None
+            return
+        
+        roster = set(self._roster)
+        new_names = [name for name in new_reviews_df['employee_name'].unique() if name not in roster]
+        if new_names:
+            self._roster = self._roster + new_names
+            self._name_automaton = None
+        
+        history_size = self._num_absorbed
+        if self.review_store is not None:
+            self._streamed_rows += len(new_reviews_df)
+        else:
+            self._pending_batches.append(new_reviews_df)
+        self._absorb_features(self._build_text_features(new_reviews_df))
+        
+        if new_names and history_size:
+            self._resolve_late_mentions(new_names, history_size)
+    
+    def iter_review_chunks(self) -> Iterator[pd.DataFrame]:
+        """Yield the reviews in order, chunk by chunk from the store when streamed"""
+        if self.review_store is not None and self._streamed_rows:
+            yield from self.review_store.iter_chunks()
+        else:
+            yield self.reviews_df
+    
+    def _cache_config(self) -> str:
+        """Configuration that cached results depend on besides the reviews"""
+        return repr((self.toxic_patterns, self.positive_patterns, self.name_aliases))
+    
+    def _name_roster(self) -> List[str]:
+        """Employees whose mentions are detected, in order of first appearance"""
+        if self._roster is None:
+            roster = {}
+            for chunk in self.iter_review_chunks():
+                roster.update(dict.fromkeys(chunk['employee_name'].unique()))
+            self._roster = list(roster)
+        return self._roster
+    
+    def get_name_automaton(self) -> NameMentionAutomaton:
+        """Return the name-mention automaton over all employees and aliases, building it once"""
+        if self._name_automaton is None:
+            self._name_automaton = NameMentionAutomaton(self._name_roster(), self.name_aliases)
+        return self._name_automaton
+    
+    @traced()
+    @cached_result
+    def get_text_features(self) -> pd.DataFrame:
+        """Return the per-review text feature table, built once per dataset
+        
+        One row per review with the reviewee, reviewer type, a hit count column per
+        pattern category (named ``<family>__<category>``), the example sentences for
+        each hit category and the resolved mentions of other employees. Streamed
+        features are not retained, so they are read with iter_text_features() instead.
+        """
+        if self.review_store is not None and self._streamed_rows:
+            raise RuntimeError("Streamed text features are not held in memory; read them with iter_text_features()")
+        self._ensure_text_state()
+        with self._state_lock:
+            if len(self._feature_batches) > 1:
+                # Keep the joined table as the only batch, so features are not held twice
+                self._feature_batches = [pd.concat(self._feature_batches, ignore_index=True)]
+            return self._feature_batches[0]
+    
+    def iter_text_features(self) -> Iterator[pd.DataFrame]:
+        """Yield the per-review text feature table chunk by chunk, rebuilt from the store when streamed"""
+        if self.review_store is not None and self._streamed_rows:
+            self.get_name_automaton()
+            for chunk in self.review_store.iter_chunks():
+                yield self._build_text_features(chunk)
+        else:
+            yield self.get_text_features()
+    
+    def _ensure_text_state(self):
+        """Build the text features and running per-employee tallies on first use"""
+        with self._state_lock:
+            if self._feature_batches is not None:
+                return
+            hit_columns = [
+                f"{family}__{category}"
+                for family, categories in self.pattern_matcher.pattern_families.items()
+                for category in categories
+            ]
+            self._hit_totals = EmployeeTotals(hit_columns + ['num_reviews'])
+            self._employee_examples = defaultdict(_example_lists)
+            self._relationships = defaultdict(list)
+            self._feature_batches = []
+            self._num_absorbed = 0
+            self.get_name_automaton()
+            for chunk in self.iter_review_chunks():
+                self._absorb_features(self._build_text_features(chunk))
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_state_lock']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._state_lock = threading.RLock()
+    
+    @traced(rows=lambda self, features: len(features))
+    def _absorb_features(self, features: pd.DataFrame):
+        """Fold a batch of per-review features into the running per-employee tallies"""
+        if self.review_store is None or not self._num_absorbed:
+            self._feature_batches.append(features)
+        self._num_absorbed += len(features)
+        
+        hit_counts = features[self._hit_totals.columns[:-1]].to_numpy(dtype=float)
+        self._hit_totals.add(
+            features['employee_name'], np.hstack([hit_counts, np.ones((len(features), 1))])
+        )
+        
+        # Example sentences and mentions are kept per employee in review order
+        for employee, reviewer_type, review_examples, mentions in zip(
+            features['employee_name'], features['reviewer_type'], features['examples'], features['mentions']
+        ):
+            for key, sentences in review_examples.items():
+                self._employee_examples[employee][key].extend(sentences)
+            for mention in mentions:
+                self._relationships[employee].append(self._mention_record(mention, reviewer_type))
+    
+    @traced()
+    def _resolve_late_mentions(self, new_names: List[str], history_size: int):
+        """Find mentions of newly seen employees in reviews absorbed before them"""
+        new_name_set = set(new_names)
+        aliases = {alias: name for alias, name in self.name_aliases.items() if name in new_name_set}
+        automaton = NameMentionAutomaton(new_names, aliases)
+        
+        late_mentions_by_row = {}
+        row = 0
+        for history in self._history_chunks(history_size):
+            for reviewee, review_text, reviewer_type in zip(
+                history['employee_name'], history['review_text'], history['reviewer_type']
+            ):
+                late_mentions = self._resolve_mentions(
+                    review_text, [match for match in automaton.find(review_text) if match[0] != reviewee]
+                )
+                if late_mentions:
+                    late_mentions_by_row[row] = late_mentions
+                    for mention in late_mentions:
+                        self._relationships[reviewee].append(self._mention_record(mention, reviewer_type))
+                row += 1
+        
+        # Patch the retained feature batches that hold those reviews
+        row_offset = 0
+        for batch_index, features in enumerate(self._feature_batches):
+            batch_rows = [
+                row - row_offset for row in late_mentions_by_row
+                if row_offset <= row < row_offset + len(features)
+            ]
+            if batch_rows:
+                updated_mentions = list(features['mentions'])
+                for row in batch_rows:
+                    updated_mentions[row] = updated_mentions[row] + late_mentions_by_row[row + row_offset]
+                features = features.copy()
+                features['mentions'] = updated_mentions
+                self._feature_batches[batch_index] = features
+            row_offset += len(features)
+    
+    def _history_chunks(self, history_size: int):
+        """Yield the first history_size reviews in order, from memory or the review store"""
+        if self.review_store is None:
+            yield self.reviews_df.iloc[:history_size]
+            return
+        remaining = history_size
+        for chunk in self.review_store.iter_chunks():
+            if remaining <= 0:
+                break
+            yield chunk.iloc[:remaining]
+            remaining -= len(chunk)
+    
+    @traced(rows=lambda self, reviews_df: len(reviews_df))
+    def _build_text_features(self, reviews_df: pd.DataFrame) -> pd.DataFrame:
+        """Segment, pattern-scan and resolve mentions for every review in one pass"""
+        if self.n_workers > 1:
+            shards = self._employee_shards(reviews_df)
+            if len(shards) > 1:
+                return self._build_text_features_parallel(reviews_df, shards)
+        return self._scan_text_features(reviews_df)
+    
+    def _employee_shards(self, reviews_df: pd.DataFrame) -> List[np.ndarray]:
+        """Split review row positions into shards of whole employees, in order of first appearance"""
+        codes, uniques = pd.factorize(reviews_df['employee_name'])
+        # Reviews without a reviewee are kept together after every named employee
+        num_groups = len(uniques) + int((codes < 0).any())
+        codes = np.where(codes < 0, len(uniques), codes)
+        chunk_size = self.chunk_size or max(1, -(-num_groups // (self.n_workers * 4)))
+        
+        # Rows grouped by employee, each employee's rows kept in review order
+        order = np.argsort(codes, kind='stable')
+        boundaries = np.searchsorted(codes[order], np.arange(chunk_size, num_groups, chunk_size))
+        return [shard for shard in np.split(order, boundaries) if len(shard)]
+    
+    def _build_text_features_parallel(self, reviews_df: pd.DataFrame, shards: List[np.ndarray]) -> pd.DataFrame:
+        """Build text features with employee shards spread over a process pool
+        
+        Shard results are put back in the original row order, so the features, and
+        every tally built from them, are identical to a single-process build.
+        """
+        # Imported here so single-process use does not load multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
         
+        text_columns = reviews_df[['employee_name', 'reviewer_type', 'review_text']]
+        with ProcessPoolExecutor(
+            max_workers=min(self.n_workers, len(shards)),
+            initializer=_init_text_worker,
+            initargs=(type(self), self.name_aliases, self.pattern_matcher, self._name_roster())
+        ) as pool:
+            shard_features = list(pool.map(
+                _build_text_features_shard, [text_columns.iloc[shard] for shard in shards]
+            ))
+        
+        positions = np.concatenate(shards)
+        row_order = np.empty(len(positions), dtype=np.int64)
+        row_order[positions] = np.arange(len(positions))
+        features = pd.concat(shard_features, ignore_index=True).iloc[row_order]
+        features.index = reviews_df.index
+        return features
+    
+    def _scan_text_features(self, reviews_df: pd.DataFrame) -> pd.DataFrame:
+        """Build text features for every review in this process"""
+        hit_columns = [
+            (family, category)
+            for family, categories in self.pattern_matcher.pattern_families.items()
+            for category in categories
+        ]
+        column_positions = {key: i for i, key in enumerate(hit_columns)}
+        hit_counts = np.zeros((len(reviews_df), len(hit_columns)), dtype=np.int64)
+        examples = []
+        mentions = []
+        
+        # Per-stage timing runs only while instrumentation is recording
+        stages = StageTotals() if instrumentation_enabled() else None
+        extract = self._extract_review_features if stages is None else self._extract_review_features_timed
+        scan_start = time.perf_counter()
+        
+        for row, (reviewee, review_text) in enumerate(zip(reviews_df['employee_name'], reviews_df['review_text'])):
+            review_hits, review_examples, review_mentions = extract(reviewee, review_text, stages)
+            for key, count in review_hits.items():
+                hit_counts[row, column_positions[key]] = count
+            examples.append(review_examples)
+            mentions.append(review_mentions)
+        
+        features = pd.DataFrame(
+            hit_counts,
+            columns=[f"{family}__{category}" for family, category in hit_columns],
+            index=reviews_df.index
+        )
+        features.insert(0, 'employee_name', reviews_df['employee_name'].to_numpy())
+        features.insert(1, 'reviewer_type', reviews_df['reviewer_type'].to_numpy())
+        features['examples'] = examples
+        features['mentions'] = mentions
+        if stages is not None:
+            stages.flush(f"{type(self).__qualname__}.review_text", scan_start, len(reviews_df))
+        return features
+    
+    def _extract_review_features(self, reviewee: str, review_text: str,
+                                 stages: StageTotals = None) -> Tuple[Counter, Dict, List]:
+        """Extract pattern hits, example sentences and mentions from a single review"""
+        hits = self.pattern_matcher.scan(review_text)
+        found_mentions = [
+            match for match in self.get_name_automaton().find(review_text) if match[0] != reviewee
+        ]
+        if not hits and not found_mentions:
+            return Counter(), {}, []
+        
+        # Split once and map every hit and mention offset to its sentence
+        sentences, starts = split_sentences(review_text)
+        hit_counts, examples = self._collect_hit_examples(hits, sentences, starts)
+        mentions = self._resolve_mentions(review_text, found_mentions, sentences, starts)
+        
+        return hit_counts, examples, mentions
+    
+    def _extract_review_features_timed(self, reviewee: str, review_text: str,
+                                       stages: StageTotals) -> Tuple[Counter, Dict, List]:
+        """_extract_review_features, adding the time spent in each stage to stages"""
+        clock = time.perf_counter
+        t0 = clock()
+        hits = self.pattern_matcher.scan(review_text)
+        t1 = clock()
+        found_mentions = [
+            match for match in self.get_name_automaton().find(review_text) if match[0] != reviewee
+        ]
+        t2 = clock()
+        stages.add('pattern_scan', t1 - t0)
+        stages.add('mention_detection', t2 - t1)
+        if not hits and not found_mentions:
+            return Counter(), {}, []
+        
+        sentences, starts = split_sentences(review_text)
+        t3 = clock()
+        hit_counts, examples = self._collect_hit_examples(hits, sentences, starts)
+        t4 = clock()
+        mentions = self._resolve_mentions(review_text, found_mentions, sentences, starts)
+        t5 = clock()
+        stages.add('sentence_split', t3 - t2)
+        stages.add('example_collection', t4 - t3)
+        stages.add('mention_sentiment', t5 - t4)
+        
+        return hit_counts, examples, mentions
+    
+    def _collect_hit_examples(self, hits: List[Tuple[str, str, int, int]], sentences: List[str],
+                              starts: List[int]) -> Tuple[Counter, Dict]:
+        """Count pattern hits per category and gather the sentences they occur in"""
+        hit_counts = Counter()
+        example_keys = set()
+        for family, category, pattern_index, offset in hits:
+            hit_counts[(family, category)] += 1
+            example_keys.add((family, category, pattern_index, bisect_right(starts, offset) - 1))
+        
+        # Store each sentence once per matching pattern, in pattern then sentence order
+        examples = defaultdict(list)
+        for family, category, _, sentence_index in sorted(example_keys, key=lambda key: key[2:]):
+            examples[(family, category)].append(sentences[sentence_index].strip())
+        
+        return hit_counts, dict(examples)
+    
+    def _resolve_mentions(self, review_text: str, found_mentions: List[Tuple[str, int, int]],
+                          sentences: List[str] = None, starts: List[int] = None) -> List[Tuple[str, float, str]]:
+        """Turn mention offsets into (person, sentiment, context) using the sentences that contain them"""
+        if not found_mentions:
+            return []
+        if sentences is None:
+            sentences, starts = split_sentences(review_text)
+        
+        mention_sentences = {}
+        for other_employee, start, end in found_mentions:
+            sentence_ids = mention_sentences.setdefault(other_employee, set())
+            sentence_index = bisect_right(starts, start) - 1
+            if end <= starts[sentence_index] + len(sentences[sentence_index]):
+                sentence_ids.add(sentence_index)
+        
+        mentions = []
+        for other_employee, sentence_ids in mention_sentences.items():
+            relevant_sentences = [sentences[i] for i in sorted(sentence_ids)]
+            mentions.append((
+                other_employee,
+                self._analyze_mention_sentiment(relevant_sentences),
+                self._extract_mention_context(relevant_sentences)
+            ))
+        return mentions
+    
+    def _mention_record(self, mention: Tuple[str, float, str], reviewer_type: str) -> Dict:
+        """Relationship network entry for one resolved mention"""
+        other_employee, sentiment, context = mention
+        return {
+            'mentioned_person': other_employee,
+            'reviewer_type': reviewer_type,
+            'sentiment': sentiment,
+            'context': context
+        }
+    
     def _initialize_toxic_patterns(self) -> Dict[str, List[str]]:
         """Initialize patterns that indicate toxic team dynamics"""
         return {
@@ -98,39 +547,13 @@ class TeamDynamicsAnalyzer:
             ]
         }
     
+    @traced()
+    @cached_result
     def analyze_toxic_behaviors(self) -> Dict[str, Dict]:
         """Analyze toxic behaviors across the team"""
         toxic_analysis = {}
         
-        for employee in self.reviews_df['employee_name'].unique():
-            employee_reviews = self.reviews_df[
-                self.reviews_df['employee_name'] == employee
-            ]['review_text'].tolist()
-            
-            toxic_scores = {}
-            toxic_examples = {}
-            
-            for pattern_type, patterns in self.toxic_patterns.items():
-                matches = []
-                total_mentions = 0
-                
-                for review_text in employee_reviews:
-                    for pattern in patterns:
-                        found = re.findall(pattern, review_text, re.IGNORECASE)
-                        if found:
-                            matches.extend(found)
-                            total_mentions += len(found)
-                            # Store example sentences
-                            sentences = re.split(r'[.!?]+', review_text)
-                            for sentence in sentences:
-                                if re.search(pattern, sentence, re.IGNORECASE):
-                                    if pattern_type not in toxic_examples:
-                                        toxic_examples[pattern_type] = []
-                                    toxic_examples[pattern_type].append(sentence.strip())
-                
-                # Calculate severity score (0-1)
-                toxic_scores[pattern_type] = min(1.0, total_mentions / max(len(employee_reviews), 1))
-            
+        for employee, (toxic_scores, toxic_examples) in self._analyze_pattern_family("toxic").items():
             # Calculate overall toxicity score
             overall_toxicity = np.mean(list(toxic_scores.values())) if toxic_scores else 0
             
@@ -143,38 +566,13 @@ class TeamDynamicsAnalyzer:
         
         return toxic_analysis
     
+    @traced()
+    @cached_result
     def analyze_positive_dynamics(self) -> Dict[str, Dict]:
         """Analyze positive team dynamics"""
         positive_analysis = {}
         
-        for employee in self.reviews_df['employee_name'].unique():
-            employee_reviews = self.reviews_df[
-                self.reviews_df['employee_name'] == employee
-            ]['review_text'].tolist()
-            
-            positive_scores = {}
-            positive_examples = {}
-            
-            for pattern_type, patterns in self.positive_patterns.items():
-                matches = []
-                total_mentions = 0
-                
-                for review_text in employee_reviews:
-                    for pattern in patterns:
-                        found = re.findall(pattern, review_text, re.IGNORECASE)
-                        if found:
-                            matches.extend(found)
-                            total_mentions += len(found)
-                            # Store example sentences
-                            sentences = re.split(r'[.!?]+', review_text)
-                            for sentence in sentences:
-                                if re.search(pattern, sentence, re.IGNORECASE):
-                                    if pattern_type not in positive_examples:
-                                        positive_examples[pattern_type] = []
-                                    positive_examples[pattern_type].append(sentence.strip())
-                
-                positive_scores[pattern_type] = min(1.0, total_mentions / max(len(employee_reviews), 1))
-            
+        for employee, (positive_scores, positive_examples) in self._analyze_pattern_family("positive").items():
             overall_positivity = np.mean(list(positive_scores.values())) if positive_scores else 0
             
             positive_analysis[employee] = {
@@ -186,31 +584,42 @@ class TeamDynamicsAnalyzer:
         
         return positive_analysis
     
+    def _analyze_pattern_family(self, family: str) -> Dict[str, Tuple[Dict, Dict]]:
+        """Score each employee against one pattern family and collect example sentences"""
+        self._ensure_text_state()
+        categories = list(self.pattern_matcher.pattern_families[family].keys())
+        totals = self._hit_totals.to_frame()
+        
+        mention_totals = totals[[f"{family}__{category}" for category in categories]].to_numpy()
+        num_reviews = np.maximum(totals['num_reviews'].to_numpy(), 1)
+        
+        # Calculate severity score (0-1)
+        severity = np.minimum(1.0, mention_totals / num_reviews[:, None])
+        
+        family_analysis = {}
+        for employee, employee_severity in zip(totals.index, severity):
+            scores = dict(zip(categories, employee_severity.tolist()))
+            examples = self._employee_examples.get(employee, {})
+            ordered_examples = {
+                category: list(examples[(family, category)])
+                for category in categories if (family, category) in examples
+            }
+            family_analysis[employee] = (scores, ordered_examples)
+        
+        return family_analysis
+    
+    @traced()
+    @cached_result
     def analyze_relationship_network(self) -> Dict[str, List[Dict]]:
         """Analyze relationships and mention patterns between team members"""
-        relationships = defaultdict(list)
-        all_employees = set(self.reviews_df['employee_name'].unique())
-        
-        for _, review in self.reviews_df.iterrows():
-            reviewee = review['employee_name']
-            review_text = review['review_text']
-            reviewer_type = review['reviewer_type']
-            
-            # Find mentions of other employees
-            for other_employee in all_employees:
-                if other_employee != reviewee and other_employee in review_text:
-                    # Analyze sentiment of the mention
-                    sentiment = self._analyze_mention_sentiment(review_text, other_employee)
-                    
-                    relationships[reviewee].append({
-                        'mentioned_person': other_employee,
-                        'reviewer_type': reviewer_type,
-                        'sentiment': sentiment,
-                        'context': self._extract_mention_context(review_text, other_employee)
-                    })
-        
-        return dict(relationships)
+        self._ensure_text_state()
+        return {
+            reviewee: [dict(mention) for mention in mentions]
+            for reviewee, mentions in self._relationships.items()
+        }
     
+    @traced()
+    @cached_result
     def identify_team_tensions(self) -> List[Dict]:
         """Identify specific team tensions and conflicts"""
         tensions = []
@@ -230,33 +639,41 @@ class TeamDynamicsAnalyzer:
                 }
                 tensions.append(tension)
         
-        # Look for mutual negative mentions
-        for person1, mentions in relationships.items():
-            negative_mentions = [m for m in mentions if m['sentiment'] < -0.3]
-            if negative_mentions:
-                for mention in negative_mentions:
-                    person2 = mention['mentioned_person']
-                    
-                    # Check if it's mutual
-                    reverse_mentions = relationships.get(person2, [])
-                    mutual_negative = any(
-                        m['mentioned_person'] == person1 and m['sentiment'] < -0.3 
-                        for m in reverse_mentions
-                    )
-                    
-                    if mutual_negative:
-                        tension = {
-                            'person': f"{person1} ↔ {person2}",
-                            'tension_type': 'Interpersonal Conflict',
-                            'severity': 'High' if mention['sentiment'] < -0.6 else 'Medium',
-                            'description': f"Mutual negative sentiment between {person1} and {person2}",
-                            'evidence': [mention['context']],
-                            'recommendations': self._generate_conflict_resolution_recommendations(person1, person2)
-                        }
-                        tensions.append(tension)
+        # Look for mutual negative mentions, one tension per pair of people
+        negative_edges = self._negative_edge_index(relationships)
+        reported_pairs = set()
+        for (person1, person2), mentions in negative_edges.items():
+            reverse_mentions = negative_edges.get((person2, person1))
+            # Report each pair once, in the direction seen first
+            if reverse_mentions is None or (person2, person1) in reported_pairs:
+                continue
+            reported_pairs.add((person1, person2))
+            
+            pair_mentions = mentions + reverse_mentions
+            worst_sentiment = min(m['sentiment'] for m in pair_mentions)
+            tension = {
+                'person': f"{person1} ↔ {person2}",
+                'tension_type': 'Interpersonal Conflict',
+                'severity': 'High' if worst_sentiment < -0.6 else 'Medium',
+                'description': f"Mutual negative sentiment between {person1} and {person2}",
+                'evidence': list(dict.fromkeys(m['context'] for m in pair_mentions)),
+                'recommendations': self._generate_conflict_resolution_recommendations(person1, person2)
+            }
+            tensions.append(tension)
         
         return tensions
     
+    def _negative_edge_index(self, relationships: Dict[str, List[Dict]]) -> Dict[Tuple[str, str], List[Dict]]:
+        """Index negative mentions by (reviewee, mentioned person) edge, in mention order"""
+        negative_edges = defaultdict(list)
+        for person, mentions in relationships.items():
+            for mention in mentions:
+                if mention['sentiment'] < -0.3:
+                    negative_edges[(person, mention['mentioned_person'])].append(mention)
+        return negative_edges
+    
+    @traced()
+    @cached_result
     def generate_team_health_report(self) -> Dict:
         """Generate comprehensive team health report"""
         toxic_analysis = self.analyze_toxic_behaviors()
@@ -317,12 +734,8 @@ class TeamDynamicsAnalyzer:
         else:
             return "Needs Improvement"
     
-    def _analyze_mention_sentiment(self, text: str, mentioned_person: str) -> float:
-        """Analyze sentiment of mentions of other people"""
-        # Find sentences containing the mentioned person
-        sentences = re.split(r'[.!?]+', text)
-        relevant_sentences = [s for s in sentences if mentioned_person in s]
-        
+    def _analyze_mention_sentiment(self, relevant_sentences: List[str]) -> float:
+        """Analyze sentiment of the sentences mentioning another person"""
         if not relevant_sentences:
             return 0.0
         
@@ -343,13 +756,9 @@ class TeamDynamicsAnalyzer:
         
         return total_sentiment / len(relevant_sentences)
     
-    def _extract_mention_context(self, text: str, mentioned_person: str) -> str:
+    def _extract_mention_context(self, relevant_sentences: List[str]) -> str:
         """Extract context around mentions of other people"""
-        sentences = re.split(r'[.!?]+', text)
-        for sentence in sentences:
-            if mentioned_person in sentence:
-                return sentence.strip()
-        return ""
+        return relevant_sentences[0].strip() if relevant_sentences else ""
     
     def _generate_intervention_recommendations(self, person: str, toxic_data: Dict) -> List[str]:
         """Generate specific intervention recommendations"""
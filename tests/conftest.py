@@ -0,0 +1,10 @@
+import pandas as pd
+import pytest
+
+from sample_data import generate_synthetic_review_data
+
+
+@pytest.fixture(scope="session")
+def reviews_df() -> pd.DataFrame:
+    """Synthetic reviews shared by every test; copy before modifying"""
+    return generate_synthetic_review_data(300, seed=7)
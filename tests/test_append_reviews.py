@@ -0,0 +1,77 @@
+import pickle
+
+import pandas as pd
+import pytest
+
+from analysis_core import ResultCache, SuccessionPlanningAnalyzer, TeamDynamicsAnalyzer
+
+
+def batches(reviews_df: pd.DataFrame, num_batches: int = 3):
+    bounds = [len(reviews_df) * i // num_batches for i in range(num_batches + 1)]
+    return [reviews_df.iloc[start:stop].reset_index(drop=True) for start, stop in zip(bounds, bounds[1:])]
+
+
+def appended(analyzer_cls, reviews_df: pd.DataFrame, analyze_between: bool):
+    first, *rest = batches(reviews_df)
+    analyzer = analyzer_cls(first, cache=ResultCache())
+    for batch in rest:
+        if analyze_between:
+            # Analyzing before each append forces the incremental path instead of deferring the batch
+            if isinstance(analyzer, TeamDynamicsAnalyzer):
+                analyzer.generate_team_health_report()
+            else:
+                analyzer.calculate_employee_scores()
+        analyzer.append_reviews(batch)
+    return analyzer
+
+
+def sorted_network(network):
+    return {
+        reviewee: sorted(mentions, key=lambda mention: (mention['mentioned_person'], mention['context']))
+        for reviewee, mentions in network.items()
+    }
+
+
+@pytest.mark.parametrize("analyze_between", [False, True])
+def test_appended_employee_scores_match_full_load(reviews_df, analyze_between):
+    expected = SuccessionPlanningAnalyzer(reviews_df, cache=ResultCache())
+    actual = appended(SuccessionPlanningAnalyzer, reviews_df, analyze_between)
+    # Batches add partial sums, so scores may differ from a single pass in the last bits
+    pd.testing.assert_frame_equal(actual.calculate_employee_scores(), expected.calculate_employee_scores())
+    assert actual.identify_succession_candidates().keys() == expected.identify_succession_candidates().keys()
+
+
+@pytest.mark.parametrize("analyze_between", [False, True])
+def test_appended_team_dynamics_match_full_load(reviews_df, analyze_between):
+    expected = TeamDynamicsAnalyzer(reviews_df, cache=ResultCache())
+    actual = appended(TeamDynamicsAnalyzer, reviews_df, analyze_between)
+    assert actual.analyze_toxic_behaviors() == expected.analyze_toxic_behaviors()
+    assert actual.analyze_positive_dynamics() == expected.analyze_positive_dynamics()
+    # Mentions of employees introduced by a later batch are appended after existing ones
+    assert sorted_network(actual.analyze_relationship_network()) == \
+        sorted_network(expected.analyze_relationship_network())
+    assert actual.generate_team_health_report() == expected.generate_team_health_report()
+
+
+def test_analyzers_pickle_after_analysis(reviews_df):
+    succession = SuccessionPlanningAnalyzer(reviews_df, cache=ResultCache())
+    dynamics = appended(TeamDynamicsAnalyzer, reviews_df, analyze_between=True)
+    succession.identify_succession_candidates()
+    report = dynamics.generate_team_health_report()
+
+    restored = pickle.loads(pickle.dumps(dynamics))
+    assert restored.generate_team_health_report() == report
+    restored.append_reviews(reviews_df.iloc[:5])
+    restored = pickle.loads(pickle.dumps(succession))
+    pd.testing.assert_frame_equal(restored.calculate_employee_scores(), succession.calculate_employee_scores())
+
+
+def test_text_features_held_once_after_appends(reviews_df):
+    expected = TeamDynamicsAnalyzer(reviews_df, cache=ResultCache()).get_text_features()
+    actual = appended(TeamDynamicsAnalyzer, reviews_df, analyze_between=True)
+    features = actual.get_text_features()
+    assert len(actual._feature_batches) == 1 and actual._feature_batches[0] is features
+    pd.testing.assert_frame_equal(features.drop(columns='mentions'), expected.drop(columns='mentions'))
+    # Mentions of employees introduced by a later batch are appended after existing ones
+    assert [sorted(map(repr, mentions)) for mentions in features['mentions']] == \
+        [sorted(map(repr, mentions)) for mentions in expected['mentions']]
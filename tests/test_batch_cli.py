@@ -0,0 +1,66 @@
+import json
+
+import pandas as pd
+import pytest
+
+import succession_batch
+from analysis_core import ResultCache, SuccessionPlanningAnalyzer, TeamDynamicsAnalyzer, first_name_aliases
+
+
+@pytest.fixture(scope="module")
+def reviews_csv(reviews_df, tmp_path_factory):
+    path = tmp_path_factory.mktemp("batch") / "reviews.csv"
+    reviews_df.to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def expected(reviews_csv):
+    reviews_df = pd.read_csv(reviews_csv, parse_dates=['review_date'])
+    succession = SuccessionPlanningAnalyzer(reviews_df, cache=ResultCache())
+    dynamics = TeamDynamicsAnalyzer(
+        reviews_df, name_aliases=first_name_aliases(reviews_df['employee_name'].unique()), cache=ResultCache()
+    )
+    return succession, dynamics
+
+
+def candidate_names(succession_candidates: dict) -> dict:
+    return {role: [c['name'] for c in info['candidates']] for role, info in succession_candidates.items()}
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_json_output_matches_analyzers(reviews_csv, expected, tmp_path, stream):
+    succession, dynamics = expected
+    argv = [reviews_csv, '--output-dir', str(tmp_path), '--workers', '1'] + (['--stream'] if stream else [])
+    assert succession_batch.main(argv) == 0
+    with open(tmp_path / 'analysis.json') as f:
+        results = json.load(f)
+
+    assert candidate_names(results['succession_candidates']) == \
+        candidate_names(succession.identify_succession_candidates())
+    assert results['team_health_report'] == json.loads(
+        json.dumps(dynamics.generate_team_health_report(), default=succession_batch._json_default)
+    )
+    plans = {plan['employee_name']: plan for plan in results['development_plans']}
+    assert list(plans) == list(succession.calculate_employee_scores()['name'])
+    for name in list(plans)[::25]:
+        plan = succession.generate_development_plan(name)
+        assert plans[name]['target_role'] == plan['target_role']
+        assert plans[name]['development_gaps'].keys() == plan['development_gaps'].keys()
+        assert [action['competency'] for action in plans[name]['development_actions']] == \
+            [action['competency'] for action in plan['development_actions']]
+
+
+def test_parquet_output_tables(reviews_csv, expected, tmp_path):
+    succession, dynamics = expected
+    assert succession_batch.main([reviews_csv, '--output-dir', str(tmp_path), '--format', 'parquet']) == 0
+
+    candidates = pd.read_parquet(tmp_path / 'succession_candidates.parquet')
+    assert candidates.groupby('target_role', sort=False)['name'].agg(list).to_dict() == \
+        candidate_names(succession.identify_succession_candidates())
+    plans = pd.read_parquet(tmp_path / 'development_plans.parquet')
+    assert plans['employee_name'].tolist() == succession.calculate_employee_scores()['name'].tolist()
+    actions = pd.read_parquet(tmp_path / 'development_actions.parquet')
+    assert len(actions) == len(succession.generate_development_plans()['actions'])
+    tensions = pd.read_parquet(tmp_path / 'team_tensions.parquet')
+    assert len(tensions) == len(dynamics.generate_team_health_report()['tension_details'])
@@ -0,0 +1,39 @@
+import copy
+
+import pandas as pd
+
+from analysis_core import ResultCache, SuccessionPlanningAnalyzer
+
+
+def what_if_requirements(analyzer: SuccessionPlanningAnalyzer):
+    role_requirements = copy.deepcopy(analyzer.role_requirements)
+    role_requirements["VP"]["leadership"] = 0.5
+    role_requirements["Director"]["communication"] = 0.95
+    return role_requirements
+
+
+def test_configured_requirements_change_nothing(reviews_df):
+    analyzer = SuccessionPlanningAnalyzer(reviews_df, cache=ResultCache())
+    expected = analyzer.assess_bench_strength()
+    actual = analyzer.assess_bench_strength(role_requirements=copy.deepcopy(analyzer.role_requirements))
+    pd.testing.assert_frame_equal(actual['summary'], expected['summary'])
+    pd.testing.assert_frame_equal(actual['candidates'], expected['candidates'])
+
+
+def test_requirement_override_matches_reconfigured_analyzer(reviews_df):
+    analyzer = SuccessionPlanningAnalyzer(reviews_df, cache=ResultCache())
+    role_requirements = what_if_requirements(analyzer)
+    reconfigured = SuccessionPlanningAnalyzer(reviews_df, cache=ResultCache())
+    reconfigured.role_requirements = role_requirements
+
+    pd.testing.assert_frame_equal(
+        analyzer.calculate_readiness_gaps(role_requirements=role_requirements),
+        reconfigured.calculate_readiness_gaps()
+    )
+    expected = reconfigured.assess_bench_strength(role_weights=reconfigured.role_weights, team_bonus_cap=0.1)
+    actual = analyzer.assess_bench_strength(
+        role_weights=analyzer.role_weights, team_bonus_cap=0.1, role_requirements=role_requirements
+    )
+    pd.testing.assert_frame_equal(actual['summary'], expected['summary'])
+    pd.testing.assert_frame_equal(actual['candidates'], expected['candidates'])
+    assert not actual['summary'].equals(analyzer.assess_bench_strength()['summary'])
@@ -0,0 +1,33 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules the analysis core and the batch CLI must never load
+UI_PREFIXES = ("streamlit", "plotly", "sample_data")
+
+
+def modules_loaded_by(module: str):
+    """Modules loaded by importing one module in a fresh interpreter"""
+    probe = f"import json, sys\nimport {module}\nprint(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run(
+        [sys.executable, "-c", probe], cwd=REPO_ROOT, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+@pytest.mark.parametrize("module", ["analysis_core", "succession_batch"])
+def test_core_does_not_import_ui_dependencies(module):
+    loaded = modules_loaded_by(module)
+    assert "pandas" in loaded
+    assert [name for name in loaded if name.startswith(UI_PREFIXES)] == []
+
+
+def test_app_loads_charts_and_sample_data_lazily():
+    # Streamlit itself loads plotly.graph_objects, but not plotly.express
+    loaded = modules_loaded_by("succession_app")
+    assert [name for name in loaded if name.startswith(("plotly.express", "sample_data"))] == []
@@ -0,0 +1,87 @@
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis_core import ResultCache, SuccessionPlanningAnalyzer, compact_reviews
+from sample_data import generate_360_review_data
+
+ACTION_FIELDS = ['competency', 'current_score', 'target_score', 'gap', 'priority', 'recommended_actions']
+
+
+def sample_reviews() -> pd.DataFrame:
+    random.seed(11)
+    np.random.seed(11)
+    return generate_360_review_data()
+
+
+def rows_by_employee(table: pd.DataFrame):
+    return {name: group.to_dict('records') for name, group in table.groupby('employee_name', sort=False)}
+
+
+def assert_batch_matches_single_plans(reviews_df: pd.DataFrame, employee_names=None, target_role=None):
+    analyzer = SuccessionPlanningAnalyzer(reviews_df, cache=ResultCache())
+    batch = analyzer.generate_development_plans(employee_names, target_role)
+    gaps, actions = rows_by_employee(batch['gaps']), rows_by_employee(batch['actions'])
+
+    for row in batch['plans'].to_dict('records'):
+        name = row['employee_name']
+        plan = analyzer.generate_development_plan(name, target_role)
+        assert row['current_role'] == plan['current_role']
+        assert row['target_role'] == plan['target_role']
+        assert {
+            comp: row[f'{comp}_score'] for comp in analyzer.competencies if f'{comp}_score' in row
+        } == plan['current_scores']
+        assert {
+            gap['competency']: {'current': gap['current'], 'target': gap['target'], 'gap': gap['gap']}
+            for gap in gaps.get(name, [])
+        } == plan['development_gaps']
+        assert [
+            {field: action[field] for field in ACTION_FIELDS} for action in actions.get(name, [])
+        ] == plan['development_actions']
+        assert sorted(map(str, row['strengths'])) == sorted(map(str, plan['strengths']))
+        assert sorted(map(str, row['development_areas'])) == sorted(map(str, plan['development_areas']))
+    return batch['plans']
+
+
+@pytest.mark.parametrize("target_role", [None, "VP Engineering"])
+def test_sample_batch_matches_single_plans(target_role):
+    plans = assert_batch_matches_single_plans(sample_reviews(), target_role=target_role)
+    assert len(plans) > 0
+
+
+def test_synthetic_batch_matches_single_plans(reviews_df):
+    assert_batch_matches_single_plans(reviews_df)
+
+
+def test_compacted_batch_matches_single_plans(reviews_df):
+    assert_batch_matches_single_plans(compact_reviews(reviews_df))
+
+
+def test_subset_follows_given_order_and_skips_unknown_names(reviews_df):
+    names = list(reviews_df['employee_name'].unique()[::-3])
+    plans = assert_batch_matches_single_plans(reviews_df, names + ['Nobody Known'])
+    assert list(plans['employee_name']) == names
+
+
+def test_compacted_plans_identical_at_requirement_thresholds(reviews_df):
+    reviews_df = reviews_df.copy()
+    # Half the employees score exactly at requirement values (the last level listed wins
+    # for competencies several levels require)
+    analyzer = SuccessionPlanningAnalyzer(reviews_df, cache=ResultCache())
+    at_threshold = reviews_df['employee_name'].isin(reviews_df['employee_name'].unique()[::2])
+    for requirements in analyzer.role_requirements.values():
+        for comp, required_score in requirements.items():
+            reviews_df.loc[at_threshold, f"{comp}_score"] = required_score
+
+    full = SuccessionPlanningAnalyzer(reviews_df, cache=ResultCache())
+    compacted = SuccessionPlanningAnalyzer(compact_reviews(reviews_df), cache=ResultCache())
+    for expected, actual in [
+        (full.generate_development_plans(), compacted.generate_development_plans()),
+        (full.assess_bench_strength(), compacted.assess_bench_strength()),
+    ]:
+        for table in expected:
+            pd.testing.assert_frame_equal(actual[table], expected[table], check_categorical=False)
+    for name in reviews_df['employee_name'].unique()[:20]:
+        assert compacted.generate_development_plan(name) == full.generate_development_plan(name)
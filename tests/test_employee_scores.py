@@ -0,0 +1,66 @@
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from result_cache import ResultCache
+from sample_data import generate_360_review_data
+from succession_planning import SuccessionPlanningAnalyzer
+
+
+def baseline_employee_scores(reviews_df: pd.DataFrame, competencies) -> pd.DataFrame:
+    """The original per-employee loop that calculate_employee_scores replaced"""
+    employee_scores = []
+    for employee in reviews_df['employee_name'].unique():
+        emp_data = reviews_df[reviews_df['employee_name'] == employee]
+        competency_scores = {}
+        for comp in competencies:
+            comp_col = f"{comp}_score"
+            if comp_col in emp_data.columns:
+                competency_scores[comp] = emp_data[comp_col].mean()
+        overall_score = np.mean(list(competency_scores.values()))
+        emp_info = emp_data.iloc[0]
+        employee_scores.append({
+            'name': employee,
+            'role': emp_info['employee_role'],
+            'level': emp_info['employee_level'],
+            'years_experience': emp_info['years_experience'],
+            'team_size': emp_info['team_size'],
+            'overall_score': overall_score,
+            'num_reviews': len(emp_data),
+            **competency_scores
+        })
+    return pd.DataFrame(employee_scores)
+
+
+def sample_reviews(seed: int) -> pd.DataFrame:
+    random.seed(seed)
+    np.random.seed(seed)
+    return generate_360_review_data()
+
+
+def assert_scores_identical(reviews_df: pd.DataFrame):
+    analyzer = SuccessionPlanningAnalyzer(reviews_df, cache=ResultCache())
+    expected = baseline_employee_scores(reviews_df, analyzer.competencies)
+    actual = analyzer.calculate_employee_scores()
+    assert list(actual['name']) == list(expected['name'])
+    for col in expected.columns:
+        # Bit-for-bit, not approximately: rounded plan values must not flip
+        np.testing.assert_array_equal(actual[col].to_numpy(), expected[col].to_numpy(), err_msg=col)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_sample_scores_match_baseline(seed):
+    assert_scores_identical(sample_reviews(seed))
+
+
+def test_synthetic_scores_match_baseline(reviews_df):
+    assert_scores_identical(reviews_df)
+
+
+def test_missing_scores_match_baseline():
+    reviews_df = sample_reviews(0)
+    reviews_df.loc[reviews_df.index[::3], 'leadership_score'] = np.nan
+    reviews_df['mentoring_score'] = np.nan
+    assert_scores_identical(reviews_df)
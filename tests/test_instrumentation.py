@@ -0,0 +1,57 @@
+import json
+import threading
+
+import instrumentation
+from instrumentation import Recorder, span, traced
+
+
+@traced()
+def work(label: str):
+    with span(f"work.{label}"):
+        return label
+
+
+def run_session(recorder: Recorder, label: str, recording: bool, started: threading.Barrier,
+                switched: threading.Barrier):
+    if recording:
+        instrumentation.enable(recorder)
+    else:
+        instrumentation.disable()
+    started.wait()
+    # The other session switches its own recording while this one keeps working
+    switched.wait()
+    work(label)
+
+
+def test_sessions_record_independently():
+    first, second = Recorder(), Recorder()
+    started, switched = threading.Barrier(2), threading.Barrier(2)
+    threads = [
+        threading.Thread(target=run_session, args=(first, "first", True, started, switched)),
+        threading.Thread(target=run_session, args=(second, "second", False, started, switched)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [span_data['name'] for span_data in first.get_spans()] == ["work.first", "work"]
+    assert second.get_spans() == []
+    assert {entry['name'] for entry in instrumentation.summarize(recorder=first)} == {"work", "work.first"}
+    events = json.loads(instrumentation.export_trace(recorder=first))['traceEvents']
+    assert {event['name'] for event in events} == {"work", "work.first"}
+
+
+def test_default_recorder_and_disable():
+    instrumentation.enable()
+    try:
+        instrumentation.clear()
+        work("default")
+        assert instrumentation.is_enabled()
+        assert [span_data['name'] for span_data in instrumentation.get_spans()] == ["work.default", "work"]
+    finally:
+        instrumentation.disable()
+    work("ignored")
+    assert not instrumentation.is_enabled()
+    assert len(instrumentation.get_spans()) == 2
+    instrumentation.clear()
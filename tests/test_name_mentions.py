@@ -0,0 +1,52 @@
+import io
+import random
+
+import numpy as np
+import pandas as pd
+
+from analysis_core import ResultCache, TeamDynamicsAnalyzer, first_name_aliases, stream_reviews_csv
+from sample_data import generate_360_review_data
+
+
+def reviews_with_first_name_mention() -> pd.DataFrame:
+    random.seed(0)
+    np.random.seed(0)
+    reviews_df = generate_360_review_data()
+    reviewee = reviews_df.loc[0, 'employee_name']
+    other = next(name for name in reviews_df['employee_name'].unique() if name != reviewee)
+    reviews_df.loc[0, 'review_text'] = f"Working with {other.split()[0]} is difficult."
+    return reviews_df, reviewee, other
+
+
+def mentioned(network, reviewee):
+    # Only mentions from the rewritten review count, not full-name mentions elsewhere
+    return {
+        mention['mentioned_person'] for mention in network.get(reviewee, [])
+        if mention['context'].startswith("Working with")
+    }
+
+
+def test_first_name_aliases_skip_ambiguous_names():
+    aliases = first_name_aliases(["Sarah Chen", "Sarah Park", "Lisa Wang", "Lisa"])
+    assert aliases == {}
+    assert first_name_aliases(["Sarah Chen", "Lisa Wang"]) == {"Sarah": "Sarah Chen", "Lisa": "Lisa Wang"}
+
+
+def test_first_name_mentions_detected_in_memory():
+    reviews_df, reviewee, other = reviews_with_first_name_mention()
+    analyzer = TeamDynamicsAnalyzer(
+        reviews_df, name_aliases=first_name_aliases(reviews_df['employee_name'].unique()), cache=ResultCache()
+    )
+    assert other in mentioned(analyzer.analyze_relationship_network(), reviewee)
+
+
+def test_streamed_reviews_detect_first_name_mentions():
+    reviews_df, reviewee, other = reviews_with_first_name_mention()
+    buffer = io.StringIO()
+    reviews_df.to_csv(buffer, index=False)
+    buffer.seek(0)
+    streamed = stream_reviews_csv(buffer, chunksize=10)
+    try:
+        assert other in mentioned(streamed.dynamics_analyzer.analyze_relationship_network(), reviewee)
+    finally:
+        streamed.review_store.close()
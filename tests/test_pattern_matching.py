@@ -0,0 +1,71 @@
+import random
+import re
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from sample_data import generate_360_review_data
+from team_dynamics import TeamDynamicsAnalyzer
+from text_matching import PatternMatcher
+
+
+def pattern_families():
+    analyzer = TeamDynamicsAnalyzer.__new__(TeamDynamicsAnalyzer)
+    return {
+        "toxic": analyzer._initialize_toxic_patterns(),
+        "positive": analyzer._initialize_positive_patterns(),
+    }
+
+
+def example_phrase(pattern: str) -> str:
+    """A phrase the pattern matches: first alternative of every group, optional characters dropped"""
+    phrase = re.sub(r"\(\?:([^|)]*)[^)]*\)\??", r"\1", pattern)
+    return re.sub(r".\?", "", phrase)
+
+
+def mixed_case_texts(seed: int = 0):
+    rng = random.Random(seed)
+    phrases = [
+        example_phrase(pattern)
+        for categories in pattern_families().values()
+        for category_patterns in categories.values()
+        for pattern in category_patterns
+    ]
+    texts = []
+    for phrase in phrases:
+        texts.append(f"{phrase.upper()}. Then {phrase.title()} and {phrase} again!")
+        texts.append("".join(char.upper() if rng.random() < 0.5 else char for char in phrase))
+    # Several patterns in one text, some overlapping, plus text that changes length when lower-cased
+    texts.append(" ".join(rng.sample(phrases, 12)).swapcase())
+    texts.append("İstanbul: " + " ".join(phrases[:5]).upper())
+    return texts
+
+
+def review_texts():
+    random.seed(2)
+    np.random.seed(2)
+    return generate_360_review_data()['review_text'].tolist()
+
+
+def findall_counts(text: str):
+    return Counter({
+        (family, category, pattern_index): len(re.findall(pattern, text, re.IGNORECASE))
+        for family, categories in pattern_families().items()
+        for category, category_patterns in categories.items()
+        for pattern_index, pattern in enumerate(category_patterns)
+    })
+
+
+@pytest.mark.parametrize("texts", [mixed_case_texts(), review_texts()], ids=["mixed_case", "sample_reviews"])
+def test_scan_matches_findall_for_every_pattern(texts):
+    matcher = PatternMatcher(pattern_families())
+    for text in texts:
+        hits = Counter((family, category, index) for family, category, index, _ in matcher.scan(text))
+        assert hits == +findall_counts(text), text
+
+
+def test_every_pattern_is_exercised():
+    matcher = PatternMatcher(pattern_families())
+    hit_patterns = {hit[:3] for text in mixed_case_texts() for hit in matcher.scan(text)}
+    assert hit_patterns == set(findall_counts(""))
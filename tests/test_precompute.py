@@ -0,0 +1,71 @@
+import threading
+
+import pytest
+
+from analysis_core import ResultCache, SuccessionPlanningAnalyzer, TeamDynamicsAnalyzer
+from precompute import PrecomputeJob
+
+
+@pytest.fixture
+def analyzers(reviews_df):
+    cache = ResultCache()
+    return SuccessionPlanningAnalyzer(reviews_df, cache=cache), TeamDynamicsAnalyzer(reviews_df, cache=cache)
+
+
+def test_completed_job_leaves_results_cached(analyzers):
+    succession, dynamics = analyzers
+    job = PrecomputeJob(succession, dynamics).start()
+    job.join(timeout=60)
+    assert not job.running and job.error is None
+    assert (job.current_step, job.steps_done, job.progress) == ("Done", job.total_steps, 1.0)
+
+    cache = succession.cache
+    misses = cache.misses
+    succession.identify_succession_candidates()
+    succession.generate_development_plans()
+    dynamics.generate_team_health_report()
+    assert cache.misses == misses
+
+
+def test_cancel_before_start_runs_no_step(analyzers):
+    job = PrecomputeJob(*analyzers)
+    job.cancel()
+    job.start().join(timeout=60)
+    assert (job.current_step, job.steps_done, job.progress) == ("Cancelled", 0, 0.0)
+    assert len(analyzers[0].cache) == 0
+
+
+def test_cancel_lets_running_step_finish_and_stops(analyzers):
+    succession, dynamics = analyzers
+    started, release = threading.Event(), threading.Event()
+    calculate_employee_scores = succession.calculate_employee_scores
+
+    def blocking_scores():
+        started.set()
+        release.wait(timeout=60)
+        return calculate_employee_scores()
+
+    succession.calculate_employee_scores = blocking_scores
+    job = PrecomputeJob(succession, dynamics).start()
+    assert started.wait(timeout=60)
+    assert job.current_step == "Employee scores" and job.running
+    # A newer upload cancels the job while its first step runs
+    job.cancel()
+    release.set()
+    job.join(timeout=60)
+    assert job.cancelled and not job.running
+    assert (job.current_step, job.steps_done) == ("Cancelled", 1)
+    assert 0 < job.progress < 1
+
+
+def test_failed_step_is_reported(analyzers):
+    succession, dynamics = analyzers
+
+    def failing_candidates():
+        raise ValueError("no roles")
+
+    succession.identify_succession_candidates = failing_candidates
+    job = PrecomputeJob(succession, dynamics).start()
+    job.join(timeout=60)
+    assert job.current_step == "Failed" and job.steps_done == 1
+    assert isinstance(job.error, ValueError)
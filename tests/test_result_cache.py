@@ -0,0 +1,106 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis_core import ResultCache, SuccessionPlanningAnalyzer, dataset_fingerprint
+from result_cache import approximate_size
+
+
+def frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({'score': np.zeros(rows), 'count': np.zeros(rows, dtype=np.int64)})
+
+
+def test_approximate_size_counts_buffers_and_contents():
+    assert approximate_size(frame(1000)) >= 16_000
+    assert approximate_size(np.zeros(1000)) == 8000
+    nested = {'table': frame(1000), 'rows': [np.zeros(100) for _ in range(1000)]}
+    assert 16_000 + 800_000 <= approximate_size(nested) < 2 * (16_000 + 800_000)
+    # Shared objects count once
+    shared = np.zeros(1000)
+    assert approximate_size([shared, shared]) < 2 * shared.nbytes
+
+
+def test_evicts_least_recently_used_beyond_byte_budget():
+    # Room for two frames of 1000 rows
+    cache = ResultCache(max_bytes=40_000)
+    for key in 'ab':
+        cache.put(key, frame(1000))
+    assert cache.get('a') is not None
+    cache.put('c', frame(1000))
+    assert [key for key in 'abc' if cache.get(key) is not None] == ['a', 'c']
+    assert cache.nbytes == approximate_size(frame(1000)) * 2 <= cache.max_bytes
+
+
+def test_keeps_newest_result_beyond_byte_budget():
+    cache = ResultCache(max_bytes=1000)
+    cache.put('small', frame(1))
+    cache.put('large', frame(1000))
+    assert len(cache) == 1 and cache.get('large') is not None
+    cache.put('large', frame(1))
+    assert cache.nbytes == approximate_size(frame(1))
+    cache.clear()
+    assert cache.nbytes == 0
+
+
+def test_analyzer_results_hit_within_budget(reviews_df):
+    cache = ResultCache(max_bytes=10 << 20)
+    analyzer = SuccessionPlanningAnalyzer(reviews_df, cache=cache)
+    scores = analyzer.calculate_employee_scores()
+    assert analyzer.calculate_employee_scores() is scores
+    assert cache.hits == 1
+    assert 0 < cache.nbytes <= cache.max_bytes
+
+
+def test_pickled_cache_keeps_bounds():
+    cache = ResultCache(maxsize=4, max_bytes=1234)
+    cache.put('a', frame(1))
+    restored = pickle.loads(pickle.dumps(cache))
+    assert (restored.maxsize, restored.max_bytes, len(restored), restored.nbytes) == (4, 1234, 0, 0)
+
+
+def test_fingerprint_follows_content(reviews_df):
+    assert dataset_fingerprint(reviews_df.copy()) == dataset_fingerprint(reviews_df)
+    changed = reviews_df.copy()
+    changed.loc[0, 'leadership_score'] += 0.01
+    assert dataset_fingerprint(changed) != dataset_fingerprint(reviews_df)
+
+
+def test_results_shared_by_fingerprint_and_invalidated_by_appends(reviews_df):
+    cache = ResultCache()
+    first, rest = reviews_df.iloc[:600], reviews_df.iloc[600:]
+    analyzer = SuccessionPlanningAnalyzer(first, cache=cache)
+    scores = analyzer.calculate_employee_scores()
+    # A new analyzer on the same data reuses the result instead of recomputing it
+    assert SuccessionPlanningAnalyzer(first.copy(), cache=cache).calculate_employee_scores() is scores
+
+    fingerprint = analyzer.fingerprint
+    analyzer.append_reviews(rest)
+    assert analyzer.fingerprint != fingerprint
+    appended = analyzer.calculate_employee_scores()
+    assert appended is not scores
+    pd.testing.assert_frame_equal(
+        appended, SuccessionPlanningAnalyzer(reviews_df, cache=ResultCache()).calculate_employee_scores()
+    )
+    # Analyzers still on the original data keep getting its results
+    assert SuccessionPlanningAnalyzer(first, cache=cache).calculate_employee_scores() is scores
+
+
+def test_configuration_is_part_of_the_key(reviews_df):
+    cache = ResultCache()
+    analyzer = SuccessionPlanningAnalyzer(reviews_df, cache=cache)
+    candidates = analyzer.identify_succession_candidates()
+    analyzer.role_weights = {**analyzer.role_weights, "VP": {"leadership": 1.0}}
+    assert analyzer.identify_succession_candidates() is not candidates
+
+
+def test_app_reuses_analyzers_per_fingerprint(reviews_df):
+    succession_app = pytest.importorskip("succession_app")
+    fingerprint = dataset_fingerprint(reviews_df)
+    analyzer = succession_app.get_succession_analyzer(fingerprint, reviews_df)
+    # The frame is not hashed, so reruns only pass the fingerprint taken at load time
+    assert succession_app.get_succession_analyzer(fingerprint, reviews_df.copy()) is analyzer
+    assert succession_app.get_dynamics_analyzer(fingerprint, reviews_df) is \
+        succession_app.get_dynamics_analyzer(fingerprint, reviews_df)
+    assert succession_app.get_succession_analyzer(fingerprint + "-other", reviews_df) is not analyzer
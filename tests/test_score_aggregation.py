@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis_core import ResultCache, SuccessionPlanningAnalyzer
+
+REVIEWER_WEIGHTS = {"Manager": 2.0, "Peer": 1.0, "Direct Report": 0.5, "Self": 0.25}
+
+
+def naive_calibrated(reviews_df: pd.DataFrame, col: str, review_cycle: str) -> pd.Series:
+    """Scores z-scored within review cycle and reviewer type, mapped onto the overall scale"""
+    scores = reviews_df[col]
+    groups = scores.groupby([reviews_df['review_date'].dt.to_period(review_cycle), reviews_df['reviewer_type']])
+    means, stds = groups.transform('mean'), groups.transform(lambda group: group.std(ddof=0))
+    calibrate = (groups.transform('count') >= 2) & (stds > 0)
+    calibrated = scores.mean() + (scores - means) / stds * scores.std(ddof=0)
+    return calibrated.where(calibrate, scores)
+
+
+def naive_employee_scores(reviews_df: pd.DataFrame, competencies, reviewer_weights=None,
+                          calibrate_leniency=False, review_cycle="Q") -> pd.DataFrame:
+    """Weighted means per employee and competency, by a plain pandas groupby"""
+    weights = reviews_df['reviewer_type'].map(reviewer_weights or {}).astype(float).fillna(1.0)
+    means = {}
+    for comp in competencies:
+        scores = reviews_df[f"{comp}_score"]
+        if calibrate_leniency:
+            scores = naive_calibrated(reviews_df, f"{comp}_score", review_cycle)
+        present_weights = weights.where(scores.notna(), 0.0)
+        by_employee = pd.DataFrame({'weighted': scores * weights, 'weight': present_weights}).groupby(
+            reviews_df['employee_name'], sort=False
+        ).sum()
+        means[comp] = by_employee['weighted'] / by_employee['weight'].replace(0.0, np.nan)
+    return pd.DataFrame(means)
+
+
+@pytest.fixture(scope="module")
+def reviews(reviews_df):
+    reviews_df = reviews_df.copy()
+    # Two review cycles, missing scores and a reviewer type without a configured weight
+    reviews_df.loc[reviews_df.index[::3], 'review_date'] = pd.Timestamp("2025-01-15")
+    reviews_df.loc[reviews_df.index[::7], 'mentoring_score'] = np.nan
+    return reviews_df
+
+
+@pytest.mark.parametrize("reviewer_weights, calibrate_leniency", [
+    (REVIEWER_WEIGHTS, False), (None, True), (REVIEWER_WEIGHTS, True),
+])
+def test_aggregation_matches_naive_means(reviews, reviewer_weights, calibrate_leniency):
+    base = SuccessionPlanningAnalyzer(reviews, cache=ResultCache())
+    analyzer = base.with_score_aggregation(reviewer_weights, calibrate_leniency)
+    actual = analyzer.calculate_employee_scores()
+    expected = naive_employee_scores(reviews, base.competencies, reviewer_weights, calibrate_leniency)
+
+    assert actual['name'].tolist() == expected.index.tolist()
+    np.testing.assert_allclose(actual[base.competencies].to_numpy(), expected.to_numpy(), rtol=1e-12)
+    np.testing.assert_allclose(actual['overall_score'], expected.mean(axis=1), rtol=1e-12)
+    assert actual['num_reviews'].tolist() == reviews.groupby('employee_name', sort=False).size().tolist()
+    # The shared analyzer keeps aggregating equally
+    assert not np.allclose(
+        base.calculate_employee_scores()[base.competencies].to_numpy(), actual[base.competencies].to_numpy()
+    )
+
+
+def test_unit_weights_match_equal_aggregation(reviews):
+    analyzer = SuccessionPlanningAnalyzer(reviews, cache=ResultCache())
+    weighted = analyzer.with_score_aggregation({reviewer_type: 1.0 for reviewer_type in REVIEWER_WEIGHTS})
+    pd.testing.assert_frame_equal(weighted.calculate_employee_scores(), analyzer.calculate_employee_scores())
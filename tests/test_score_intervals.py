@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis_core import ResultCache, SuccessionPlanningAnalyzer
+
+N_RESAMPLES = 4000
+
+
+def naive_bootstrap(analyzer: SuccessionPlanningAnalyzer, reviews_df: pd.DataFrame, employee: str,
+                    target_roles, seed: int) -> dict:
+    """95% percentile bounds of one employee's scores, resampling review rows one employee at a time"""
+    rng = np.random.default_rng(seed)
+    reviews = reviews_df.loc[
+        reviews_df['employee_name'] == employee, [f"{comp}_score" for comp in analyzer.competencies]
+    ].to_numpy()
+    # Each resample draws as many rows as the employee has reviews, with replacement
+    draws = rng.integers(0, len(reviews), (N_RESAMPLES, len(reviews)))
+    competency_means = pd.DataFrame(reviews[draws].mean(axis=1), columns=analyzer.competencies)
+    employee_scores = analyzer.calculate_employee_scores().set_index('name')
+    bounds = {'overall_score': np.quantile(competency_means.mean(axis=1), [0.025, 0.975])}
+    for role in target_roles:
+        resampled = employee_scores.loc[[employee] * N_RESAMPLES].reset_index()
+        resampled[analyzer.competencies] = competency_means.to_numpy()
+        bounds[role] = np.quantile(analyzer.calculate_succession_scores(resampled, [role])[role], [0.025, 0.975])
+    return bounds
+
+
+@pytest.fixture(scope="module")
+def analyzer(reviews_df):
+    return SuccessionPlanningAnalyzer(reviews_df, cache=ResultCache())
+
+
+@pytest.fixture(scope="module")
+def intervals(analyzer):
+    return analyzer.calculate_score_intervals(n_resamples=N_RESAMPLES)
+
+
+def test_intervals_match_naive_bootstrap(analyzer, reviews_df, intervals):
+    target_roles = list(analyzer.succession_paths)
+    counts = reviews_df.groupby('employee_name', sort=False).size()
+    # Employees of every review count
+    employees = counts.reset_index().drop_duplicates(0)['employee_name']
+    for seed, employee in enumerate(employees):
+        expected = naive_bootstrap(analyzer, reviews_df, employee, target_roles, seed)
+        actual = {'overall_score': intervals['overall_score'].loc[employee, ['low', 'high']].to_numpy()}
+        for role in target_roles:
+            actual[role] = np.array([
+                intervals['succession_score_low'].loc[employee, role],
+                intervals['succession_score_high'].loc[employee, role],
+            ])
+        for score, bounds in expected.items():
+            # Independent draws of 4000 resamples agree within a small share of the interval width
+            width = bounds[1] - bounds[0]
+            np.testing.assert_allclose(actual[score], bounds, rtol=0, atol=0.1 * width + 1e-6, err_msg=score)
+
+
+def test_intervals_contain_point_estimates(analyzer, intervals):
+    employee_scores = analyzer.calculate_employee_scores().set_index('name')
+    overall = intervals['overall_score']
+    assert ((overall['low'] <= employee_scores['overall_score'] + 1e-6)
+            & (employee_scores['overall_score'] <= overall['high'] + 1e-6)).mean() > 0.95
+    succession = analyzer.calculate_succession_scores(target_roles=list(analyzer.succession_paths))
+    succession.index = employee_scores.index
+    assert (intervals['succession_score_low'] <= intervals['succession_score_high']).all().all()
+    assert ((intervals['succession_score_low'] <= succession + 1e-6)
+            & (succession <= intervals['succession_score_high'] + 1e-6)).mean().mean() > 0.95
+
+
+def test_intervals_reproducible_per_seed(analyzer, intervals):
+    again = analyzer.calculate_score_intervals(n_resamples=N_RESAMPLES)
+    for table in intervals:
+        pd.testing.assert_frame_equal(again[table], intervals[table])
+    other = analyzer.calculate_score_intervals(n_resamples=N_RESAMPLES, seed=1)
+    assert not other['overall_score'].equals(intervals['overall_score'])
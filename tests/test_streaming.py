@@ -0,0 +1,80 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis_core import ResultCache, SuccessionPlanningAnalyzer, TeamDynamicsAnalyzer, stream_reviews_csv
+
+
+@pytest.fixture(scope="module")
+def streamed(reviews_df):
+    buffer = io.StringIO()
+    reviews_df.to_csv(buffer, index=False)
+    buffer.seek(0)
+    streamed = stream_reviews_csv(buffer, chunksize=100)
+    yield streamed
+    streamed.review_store.close()
+
+
+@pytest.fixture(scope="module")
+def in_memory(reviews_df):
+    # Round-trip through CSV so both sides see the same parsed values
+    buffer = io.StringIO()
+    reviews_df.to_csv(buffer, index=False)
+    buffer.seek(0)
+    reviews_df = pd.read_csv(buffer, parse_dates=['review_date'])
+    return (
+        SuccessionPlanningAnalyzer(reviews_df, cache=ResultCache()),
+        TeamDynamicsAnalyzer(reviews_df, cache=ResultCache()),
+    )
+
+
+def test_streamed_employee_scores_match(streamed, in_memory):
+    # Chunks add partial sums, so scores may differ in the last bits
+    pd.testing.assert_frame_equal(
+        streamed.succession_analyzer.calculate_employee_scores(), in_memory[0].calculate_employee_scores()
+    )
+
+
+def test_streamed_succession_results_match(streamed, in_memory):
+    expected = in_memory[0].identify_succession_candidates()
+    actual = streamed.succession_analyzer.identify_succession_candidates()
+    assert actual.keys() == expected.keys()
+    for role in expected:
+        assert [c['name'] for c in actual[role]['candidates']] == [c['name'] for c in expected[role]['candidates']]
+    expected_plans = in_memory[0].generate_development_plans()
+    actual_plans = streamed.succession_analyzer.generate_development_plans()
+    # A last-bit difference can flip a score rounded to two decimals, but no more
+    for table in ['gaps', 'actions']:
+        pd.testing.assert_frame_equal(
+            actual_plans[table], expected_plans[table], check_exact=False, rtol=0, atol=0.01 + 1e-9
+        )
+
+
+def test_streamed_team_dynamics_match(streamed, in_memory):
+    dynamics = streamed.dynamics_analyzer
+    assert dynamics.analyze_toxic_behaviors() == in_memory[1].analyze_toxic_behaviors()
+    assert dynamics.analyze_relationship_network() == in_memory[1].analyze_relationship_network()
+    assert dynamics.generate_team_health_report() == in_memory[1].generate_team_health_report()
+
+
+def test_streamed_reviews_are_never_materialized(streamed, reviews_df):
+    for analyzer in (streamed.succession_analyzer, streamed.dynamics_analyzer):
+        with pytest.raises(RuntimeError):
+            analyzer.reviews_df
+        assert sum(len(chunk) for chunk in analyzer.iter_review_chunks()) == len(reviews_df)
+    with pytest.raises(RuntimeError):
+        streamed.dynamics_analyzer.get_text_features()
+    features = list(streamed.dynamics_analyzer.iter_text_features())
+    assert np.sum([len(chunk) for chunk in features]) == len(reviews_df)
+
+
+@pytest.mark.parametrize("chunksize", [2, 7, 100, 10_000])
+def test_store_chunks_cover_every_row_in_order(streamed, reviews_df, chunksize):
+    chunks = list(streamed.review_store.iter_chunks(chunksize))
+    assert all(len(chunk) == chunksize for chunk in chunks[:-1])
+    stored = pd.concat(chunks, ignore_index=True)
+    assert list(stored.columns) == list(reviews_df.columns)
+    assert stored['employee_name'].tolist() == reviews_df['employee_name'].tolist()
+    assert stored['review_text'].tolist() == reviews_df['review_text'].tolist()
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis_core import ResultCache, SuccessionPlanningAnalyzer
+
+
+def baseline_succession_score(analyzer: SuccessionPlanningAnalyzer, candidates: pd.DataFrame,
+                              target_role: str) -> pd.Series:
+    """The original per-candidate loop that the weight matrix replaced"""
+    target_level = analyzer._get_target_level(target_role)
+    weights = analyzer.role_weights.get(target_level, analyzer.role_weights["Manager"])
+    succession_scores = []
+    for _, candidate in candidates.iterrows():
+        weighted_score = 0
+        for competency, weight in weights.items():
+            if competency in candidate:
+                weighted_score += candidate[competency] * weight
+        experience_bonus = min(0.1, candidate['years_experience'] / 100)
+        team_bonus = min(0.05, candidate['team_size'] / 100) if target_level in ["VP", "Director"] else 0
+        succession_scores.append(weighted_score + experience_bonus + team_bonus)
+    return pd.Series(succession_scores, index=candidates.index)
+
+
+def baseline_candidates(analyzer: SuccessionPlanningAnalyzer, target_roles) -> dict:
+    """The original per-role filter, score and nlargest ranking"""
+    employee_scores = analyzer.calculate_employee_scores()
+    succession_candidates = {}
+    for target_role in target_roles:
+        current_holder = employee_scores[
+            employee_scores['role'].str.replace(' ', '') == target_role.replace(' ', '')
+        ]
+        eligible_levels = analyzer.succession_paths.get(target_role, ["Professional", "Manager"])
+        candidates = employee_scores[employee_scores['level'].isin(eligible_levels)].copy()
+        if len(current_holder) == 0 or len(candidates) == 0:
+            continue
+        candidates['succession_score'] = baseline_succession_score(analyzer, candidates, target_role)
+        succession_candidates[target_role] = {
+            'current_holder': current_holder.iloc[0].to_dict(),
+            'candidates': candidates.nlargest(3, 'succession_score').to_dict('records'),
+        }
+    return succession_candidates
+
+
+def assert_candidates_match(actual: dict, expected: dict):
+    assert actual.keys() == expected.keys()
+    for role in expected:
+        assert actual[role]['current_holder']['name'] == expected[role]['current_holder']['name']
+        assert [c['name'] for c in actual[role]['candidates']] == [c['name'] for c in expected[role]['candidates']]
+        np.testing.assert_allclose(
+            [c['succession_score'] for c in actual[role]['candidates']],
+            [c['succession_score'] for c in expected[role]['candidates']],
+            rtol=0, atol=1e-12
+        )
+
+
+@pytest.fixture(scope="module")
+def analyzer(reviews_df):
+    return SuccessionPlanningAnalyzer(reviews_df, cache=ResultCache())
+
+
+def test_matrix_scores_match_per_role_loop(analyzer):
+    employee_scores = analyzer.calculate_employee_scores()
+    target_roles = ["VP Engineering", "Director Product", "Senior Manager", "Team Lead"]
+    scores = analyzer.calculate_succession_scores(target_roles=target_roles)
+    assert list(scores.columns) == target_roles
+    for role in target_roles:
+        np.testing.assert_allclose(
+            scores[role], baseline_succession_score(analyzer, employee_scores, role), rtol=0, atol=1e-12
+        )
+
+
+def test_missing_competency_only_poisons_roles_weighting_it(reviews_df):
+    reviews_df = reviews_df.copy()
+    # Decision making is weighted for VP roles alone
+    reviews_df['decision_making_score'] = np.nan
+    analyzer = SuccessionPlanningAnalyzer(reviews_df, cache=ResultCache())
+    employee_scores = analyzer.calculate_employee_scores()
+    scores = analyzer.calculate_succession_scores(target_roles=["VP Engineering", "Senior Manager"])
+    assert scores["VP Engineering"].isna().all()
+    np.testing.assert_allclose(
+        scores["Senior Manager"], baseline_succession_score(analyzer, employee_scores, "Senior Manager"),
+        rtol=0, atol=1e-12
+    )
+
+
+@pytest.mark.parametrize("target_roles", [None, ["Senior Manager", "VP Engineering", "Team Lead"]])
+def test_index_matches_per_role_ranking(analyzer, target_roles):
+    expected = baseline_candidates(analyzer, target_roles or list(analyzer.succession_paths))
+    assert_candidates_match(analyzer.identify_succession_candidates(target_roles), expected)
+    assert_candidates_match(analyzer.rank_succession_candidates(target_roles=target_roles), expected)
+
+
+def test_roles_for_candidate_agree_with_top_successors(analyzer):
+    index = analyzer.get_succession_index()
+    expected = {}
+    for role in index.target_roles:
+        for rank, candidate in enumerate(index.top_successors(role, 5), start=1):
+            expected.setdefault(candidate['name'], {})[role] = (rank, candidate['succession_score'])
+    assert expected
+    for name in analyzer.calculate_employee_scores()['name']:
+        roles = index.roles_for_candidate(name, 5)
+        assert {entry['target_role']: (entry['rank'], entry['succession_score']) for entry in roles} == \
+            expected.get(name, {})
+        assert [entry['rank'] for entry in roles] == sorted(entry['rank'] for entry in roles)
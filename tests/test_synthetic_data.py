@@ -0,0 +1,17 @@
+import numpy as np
+
+from sample_data import _unique_names, generate_synthetic_review_data
+from text_matching import SENTENCE_DELIMITER
+
+
+def test_names_beyond_combinations_are_unique_and_unpunctuated():
+    names = _unique_names(10_000, np.random.default_rng(0))
+    assert len(set(names)) == len(names)
+    assert not any(SENTENCE_DELIMITER.search(name) for name in names)
+
+
+def test_synthetic_reviewee_names_are_unpunctuated():
+    reviews_df = generate_synthetic_review_data(5_000, seed=1)
+    names = reviews_df['employee_name'].unique()
+    assert len(names) > 4096
+    assert not reviews_df['employee_name'].str.contains(r"[.!?]").any()
@@ -0,0 +1,103 @@
+import re
+
+import pandas as pd
+import pytest
+
+from analysis_core import ResultCache, TeamDynamicsAnalyzer
+from sample_data import generate_synthetic_review_data
+
+
+def pattern_hit_counts(analyzer: TeamDynamicsAnalyzer, review_text: str) -> dict:
+    """Hits per pattern category of one review, by re.findall over every pattern"""
+    return {
+        f"{family}__{category}": sum(len(re.findall(pattern, review_text, re.IGNORECASE)) for pattern in patterns)
+        for family, categories in [("toxic", analyzer.toxic_patterns), ("positive", analyzer.positive_patterns)]
+        for category, patterns in categories.items()
+    }
+
+
+@pytest.fixture(scope="module")
+def analyzer(reviews_df):
+    return TeamDynamicsAnalyzer(reviews_df, cache=ResultCache())
+
+
+def test_feature_table_counts_every_pattern_hit(analyzer, reviews_df):
+    features = analyzer.get_text_features()
+    assert features['employee_name'].tolist() == reviews_df['employee_name'].tolist()
+    for row, review_text in zip(features.to_dict('records'), reviews_df['review_text']):
+        hits = pattern_hit_counts(analyzer, review_text)
+        assert {column: row[column] for column in hits} == hits
+
+
+def test_analyses_match_per_employee_pattern_counts(analyzer, reviews_df):
+    toxic = analyzer.analyze_toxic_behaviors()
+    positive = analyzer.analyze_positive_dynamics()
+    assert list(toxic) == list(positive) == list(reviews_df['employee_name'].unique())
+    for employee, reviews in reviews_df.groupby('employee_name', sort=False)['review_text']:
+        totals = pd.DataFrame([pattern_hit_counts(analyzer, review_text) for review_text in reviews]).sum()
+        for family, analysis, key in [("toxic", toxic, 'toxicity_scores'), ("positive", positive, 'positive_scores')]:
+            assert analysis[employee][key] == {
+                column.split("__")[1]: min(1.0, totals[column] / len(reviews))
+                for column in totals.index if column.startswith(f"{family}__")
+            }
+
+
+def test_parallel_analysis_matches_serial(analyzer, reviews_df):
+    parallel = TeamDynamicsAnalyzer(reviews_df, cache=ResultCache(), n_workers=2, chunk_size=7)
+    pd.testing.assert_frame_equal(parallel.get_text_features(), analyzer.get_text_features())
+    assert parallel.analyze_toxic_behaviors() == analyzer.analyze_toxic_behaviors()
+    assert parallel.analyze_positive_dynamics() == analyzer.analyze_positive_dynamics()
+    assert parallel.analyze_relationship_network() == analyzer.analyze_relationship_network()
+    assert parallel.generate_team_health_report() == analyzer.generate_team_health_report()
+
+
+def mutual_negative_pairs(relationships: dict) -> set:
+    """Unordered pairs with negative mentions both ways, by checking every mention pairwise"""
+    pairs = set()
+    for person1, mentions in relationships.items():
+        for mention in mentions:
+            person2 = mention['mentioned_person']
+            if mention['sentiment'] < -0.3 and any(
+                m['mentioned_person'] == person1 and m['sentiment'] < -0.3 for m in relationships.get(person2, [])
+            ):
+                pairs.add(frozenset((person1, person2)))
+    return pairs
+
+
+def conflict_pairs(tensions) -> list:
+    return [
+        frozenset(tension['person'].split(" ↔ "))
+        for tension in tensions if tension['tension_type'] == 'Interpersonal Conflict'
+    ]
+
+
+def test_mutual_tensions_match_pairwise_check():
+    # Large enough for several mutual pairs
+    analyzer = TeamDynamicsAnalyzer(generate_synthetic_review_data(3_000, seed=7), cache=ResultCache())
+    pairs = conflict_pairs(analyzer.identify_team_tensions())
+    assert len(pairs) == len(set(pairs))
+    assert set(pairs) == mutual_negative_pairs(analyzer.analyze_relationship_network())
+    assert pairs
+
+
+def test_each_mutual_tension_reported_once():
+    reviews_df = pd.DataFrame({
+        'employee_name': ["Ana Lopez", "Ana Lopez", "Ben Carter", "Cai Wong", "Ben Carter"],
+        'reviewer_type': ["Peer", "Manager", "Peer", "Peer", "Direct Report"],
+        'review_text': [
+            "Ben Carter is dismissive in meetings.",
+            "Ben Carter is toxic. Delivers on time.",
+            "Ana Lopez is difficult to work with.",
+            "Ana Lopez is difficult to work with.",
+            "Cai Wong is helpful.",
+        ],
+    })
+    analyzer = TeamDynamicsAnalyzer(reviews_df, cache=ResultCache())
+    conflicts = [
+        tension for tension in analyzer.identify_team_tensions() if tension['tension_type'] == 'Interpersonal Conflict'
+    ]
+    assert [tension['person'] for tension in conflicts] == ["Ana Lopez ↔ Ben Carter"]
+    assert conflicts[0]['severity'] == 'High'
+    assert conflicts[0]['evidence'] == [
+        "Ben Carter is dismissive in meetings", "Ben Carter is toxic", "Ana Lopez is difficult to work with"
+    ]
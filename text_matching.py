@@ -0,0 +1,185 @@
+import re
+from collections import defaultdict, deque
+from typing import Dict, Iterable, List, Tuple
+
+# Sentence boundaries used by every review text analysis
+SENTENCE_DELIMITER = re.compile(r'[.!?]+')
+
+
+def split_sentences(text: str) -> Tuple[List[str], List[int]]:
+    """Split text like re.split(r'[.!?]+') and also return each sentence's start offset"""
+    sentences = []
+    starts = []
+    start = 0
+    for delimiter in SENTENCE_DELIMITER.finditer(text):
+        sentences.append(text[start:delimiter.start()])
+        starts.append(start)
+        start = delimiter.end()
+    sentences.append(text[start:])
+    starts.append(start)
+    return sentences, starts
+
+
+def _lowercase_pattern(pattern: str) -> str:
+    """Lower-case a regex's literal text, leaving escape sequences such as \\S intact"""
+    return re.sub(r'\\.|[^\\]+', lambda part: part.group() if part.group().startswith('\\') else part.group().lower(),
+                  pattern)
+
+
+class PatternMatcher:
+    """Tags every pattern of every family and category in a single regex scan
+
+    Patterns match case-insensitively, as re.IGNORECASE would, whatever their case.
+    """
+
+    def __init__(self, pattern_families: Dict[str, Dict[str, List[str]]]):
+        self.pattern_families = pattern_families
+        self._group_tags = []
+
+        # One named group per source pattern so each hit maps back to (family, category, pattern)
+        patterns = []
+        for family, categories in pattern_families.items():
+            for category, category_patterns in categories.items():
+                for pattern_index, pattern in enumerate(category_patterns):
+                    self._group_tags.append((f"p{len(patterns)}", (family, category, pattern_index)))
+                    patterns.append(pattern)
+
+        # The leading lookahead rejects positions where nothing matches; the optional
+        # lookaheads then record every pattern that matches at a hit position, so
+        # overlapping hits from different patterns are all reported, as with findall
+        any_pattern, tagged = self._combine(patterns)
+
+        # Matching runs on lower-cased text, which lets re skip ahead on first characters, so
+        # those regexes use lower-cased patterns; the IGNORECASE variants cover text whose
+        # length changes when lower-cased
+        lower_any_pattern, lower_tagged = self._combine([_lowercase_pattern(pattern) for pattern in patterns])
+        self._any_regex = re.compile(lower_any_pattern)
+        self._tagged_regex = re.compile(lower_tagged)
+        self._any_regex_ci = re.compile(any_pattern, re.IGNORECASE)
+        self._tagged_regex_ci = re.compile(tagged, re.IGNORECASE)
+        self._group_tags = [
+            (self._tagged_regex.groupindex[group_name], tag) for group_name, tag in self._group_tags
+        ]
+
+    def _combine(self, patterns: List[str]) -> Tuple[str, str]:
+        """Alternation of all patterns, and the tagged regex with one named group per pattern"""
+        any_pattern = "|".join(f"(?:{pattern})" for pattern in patterns)
+        tagged = "(?=(?:{})){}".format(any_pattern, "".join(
+            f"(?=(?P<{group_name}>{pattern}))?"
+            for (group_name, _), pattern in zip(self._group_tags, patterns)
+        ))
+        return any_pattern, tagged
+
+    def scan(self, text: str) -> List[Tuple[str, str, int, int]]:
+        """Return (family, category, pattern_index, offset) for every hit in text
+
+        Matching is case-insensitive and each pattern reports the same
+        non-overlapping matches re.findall would.
+        """
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            any_regex, tagged_regex = self._any_regex, self._tagged_regex
+        else:
+            lowered = text
+            any_regex, tagged_regex = self._any_regex_ci, self._tagged_regex_ci
+
+        # Most reviews contain no hit at all and are rejected by the cheap search
+        first_hit = any_regex.search(lowered)
+        if first_hit is None:
+            return []
+
+        hits = []
+        next_start = {}
+        for match in tagged_regex.finditer(lowered, first_hit.start()):
+            offset = match.start()
+            spans = match.regs
+            for group, tag in self._group_tags:
+                end = spans[group][1]
+                if end != -1 and offset >= next_start.get(group, 0):
+                    next_start[group] = end
+                    hits.append(tag + (offset,))
+        return hits
+
+
+def first_name_aliases(names: Iterable[str]) -> Dict[str, str]:
+    """Map each unambiguous first name to the full employee name"""
+    names = set(names)
+    by_first_name = defaultdict(set)
+    for name in names:
+        parts = name.split()
+        if len(parts) > 1:
+            by_first_name[parts[0]].add(name)
+    return {
+        first_name: next(iter(full_names))
+        for first_name, full_names in by_first_name.items()
+        if len(full_names) == 1 and first_name not in names
+    }
+
+
+class NameMentionAutomaton:
+    """Aho-Corasick automaton that finds every employee name and alias in one pass
+
+    Full names match anywhere as plain substrings. Aliases such as first names
+    only match as whole words so that "Al" does not fire inside "Also".
+    """
+
+    def __init__(self, names: Iterable[str], aliases: Dict[str, str] = None):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for name in names:
+            self._add_keyword(name, name, False)
+        for alias, name in (aliases or {}).items():
+            self._add_keyword(alias, name, True)
+
+        # Breadth-first pass sets failure links and inherits outputs of shorter suffixes
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                if self._fail[next_state] == next_state:
+                    self._fail[next_state] = 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def _add_keyword(self, keyword: str, name: str, whole_word: bool):
+        """Insert a keyword into the trie"""
+        if not keyword:
+            return
+        state = 0
+        for char in keyword:
+            if char not in self._goto[state]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = len(self._goto) - 1
+            state = self._goto[state][char]
+        self._output[state].append((name, len(keyword), whole_word))
+
+    def find(self, text: str) -> List[Tuple[str, int, int]]:
+        """Return (name, start, end) for every name or alias occurrence in text"""
+        goto, fail, output = self._goto, self._fail, self._output
+        root = goto[0]
+        matches = []
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0) if state else root.get(char, 0)
+            if not output[state]:
+                continue
+            end = position + 1
+            for name, length, whole_word in output[state]:
+                start = end - length
+                if whole_word and (
+                    (start > 0 and text[start - 1].isalnum())
+                    or (end < len(text) and text[end].isalnum())
+                ):
+                    continue
+                matches.append((name, start, end))
+        return matches